@@ -0,0 +1,285 @@
+"""
+Benchmarks of the core CSVFile operations
+
+Synthetic files are generated once (and kept in --data-dir) for every
+shape and size:
+
+    narrow      6 columns (ints, floats, dates, text and a quoted note
+                with commas, quotes and newlines)
+    wide        60 columns of the same kinds
+
+Every operation runs on a freshly loaded file (the load is not counted)
+and is timed (best of --repeat runs), then run again under tracemalloc
+to record its peak memory (skip with --no-memory). The results are
+written as JSON so that runs of different versions can be compared:
+
+    python benchmarks/core.py --output new.json [--quick | --sizes 10000 ...]
+    python benchmarks/core.py --compare old.json new.json
+"""
+import argparse
+import csv
+import datetime
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pysv.classes.csv_file import CSVFile  # noqa: E402
+from pysv.creators.create_csv_file import load_csv  # noqa: E402
+from pysv.defaults import DEFAULT_INFER_TYPES  # noqa: E402
+
+SIZES: List[int] = [10_000, 100_000, 1_000_000, 5_000_000]
+QUICK_SIZES: List[int] = [10_000, 100_000]
+SHAPES: Dict[str, int] = {"narrow": 6, "wide": 60}
+
+# cells written by the set_cell benchmark
+SET_CELLS: int = 10_000
+
+# kinds of values, repeated over the columns
+KINDS: List[str] = ["int", "float", "date", "text", "note", "text"]
+
+# distinct values of every kind (cells are drawn from them)
+POOL_SIZE: int = 50_000
+
+# rows generated at once
+BLOCK_ROWS: int = 10_000
+
+
+def make_value(kind: str, rng: random.Random) -> str:
+    """Generate one value of the given kind"""
+    if kind == "int":
+        return str(rng.randrange(-1_000_000, 1_000_000))
+    if kind == "float":
+        return repr(round(rng.uniform(-1000, 1000), 4))
+    if kind == "date":
+        return datetime.date.fromordinal(730_000 + rng.randrange(9000)).isoformat()
+    if kind == "note" and rng.random() < 0.1:
+        # a field that needs quotes
+        return f'said "hi", twice\nthen {rng.randrange(1000)}'
+    return "".join(rng.choices("abcdefghijklmnopqrstuvwxyz ", k=rng.randrange(3, 16)))
+
+
+def generate(path: str, columns: int, rows: int) -> None:
+    """Write a synthetic csv file (same content for the same arguments)"""
+    rng = random.Random(f"{columns}-{rows}")
+    pools: Dict[str, List[str]] = {
+        kind: [make_value(kind, rng) for _ in range(POOL_SIZE)] for kind in KINDS
+    }
+    kinds: List[str] = [KINDS[i % len(KINDS)] for i in range(columns)]
+
+    tmp: str = path + ".tmp"
+    with open(tmp, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([f"{kind}_{i}" for i, kind in enumerate(kinds)])
+        for start in range(0, rows, BLOCK_ROWS):
+            count: int = min(BLOCK_ROWS, rows - start)
+            block = [rng.choices(pools[kind], k=count) for kind in kinds]
+            writer.writerows(zip(*block))
+    os.replace(tmp, path)
+
+
+def dataset(data_dir: str, shape: str, rows: int) -> str:
+    """Path of a synthetic file, generated if it doesn't exist yet"""
+    path: str = os.path.join(data_dir, f"{shape}-{rows}.csv")
+    if not os.path.exists(path):
+        print(f"generating {path}", file=sys.stderr)
+        generate(path, SHAPES[shape], rows)
+    return path
+
+
+def load(path: str) -> CSVFile:
+    """Load a file the way the prompt does (always eagerly, one process)"""
+    return load_csv(path, infer_types=DEFAULT_INFER_TYPES)
+
+
+def set_cells(file: CSVFile) -> None:
+    """Write SET_CELLS random cells of a text column"""
+    rng = random.Random(0)
+    column: str = file.header[3]
+    count: int = file.row_count()
+    for _ in range(SET_CELLS):
+        file.set_cell(column, str(rng.randrange(count)), "benchmark")
+
+
+# operation -> (runs on a loaded file, function)
+OPERATIONS: Dict[str, Callable[[str, Optional[CSVFile], str], object]] = {
+    "load_csv": lambda path, file, out: load(path),
+    "render": lambda path, file, out: file.render(),
+    "save": lambda path, file, out: file.save(out),
+    "make_table_str": lambda path, file, out: file.make_table_str(),
+    "peek_column": lambda path, file, out: file.peek_column(file.header[0]),
+    "delete_column": lambda path, file, out: file.delete_column(file.header[0]),
+    "switch_column": lambda path, file, out: file.switch_column(
+        file.header[0], file.header[-1]
+    ),
+    "set_cell": lambda path, file, out: set_cells(file),
+}
+
+
+def measure(op: str, path: str, out: str, repeat: int, memory: bool) -> dict:
+    """
+    Time an operation (best of «repeat» runs) and its peak memory,
+    every run on a freshly loaded file
+    """
+    function = OPERATIONS[op]
+
+    seconds: float = float("inf")
+    for _ in range(repeat):
+        file: Optional[CSVFile] = None if op == "load_csv" else load(path)
+        start: float = time.perf_counter()
+        function(path, file, out)
+        seconds = min(seconds, time.perf_counter() - start)
+
+    peak: Optional[int] = None
+    if memory:
+        file = None if op == "load_csv" else load(path)
+        tracemalloc.start()
+        function(path, file, out)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {"seconds": seconds, "peak_bytes": peak}
+
+
+def version() -> str:
+    """Commit of the benchmarked tree"""
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(args: argparse.Namespace) -> dict:
+    """Run every benchmark and collect the results"""
+    os.makedirs(args.data_dir, exist_ok=True)
+    results: List[dict] = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out: str = os.path.join(tmp, "saved.csv")
+
+        for shape in args.shapes:
+            for rows in args.sizes:
+                path: str = dataset(args.data_dir, shape, rows)
+                size: int = os.path.getsize(path)
+
+                for op in args.ops:
+                    result: dict = measure(op, path, out, args.repeat, args.memory)
+                    units: int = SET_CELLS if op == "set_cell" else rows
+                    result.update(
+                        {
+                            "shape": shape,
+                            "columns": SHAPES[shape],
+                            "rows": rows,
+                            "bytes": size,
+                            "op": op,
+                            "units_per_s": units / result["seconds"],
+                            "mb_per_s": size / 1e6 / result["seconds"],
+                        }
+                    )
+                    results.append(result)
+
+                    peak: str = (
+                        f"{result['peak_bytes'] / 1e6:9.1f} MB"
+                        if result["peak_bytes"] is not None
+                        else "        -"
+                    )
+                    print(
+                        f"{shape:<7}{rows:>9} {op:<15}{result['seconds']:9.3f} s"
+                        f"{result['units_per_s']:14.0f}/s {peak}",
+                        file=sys.stderr,
+                    )
+
+    return {
+        "meta": {
+            "version": version(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "infer_types": DEFAULT_INFER_TYPES,
+            "set_cells": SET_CELLS,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(old_path: str, new_path: str) -> None:
+    """Print the speed and memory ratios of two result files (new / old)"""
+    with open(old_path) as f:
+        old: dict = json.load(f)
+    with open(new_path) as f:
+        new: dict = json.load(f)
+
+    def key(result: dict) -> tuple:
+        return (result["shape"], result["rows"], result["op"])
+
+    before: Dict[tuple, dict] = {key(r): r for r in old["results"]}
+    print(
+        f"{old['meta']['version']} -> {new['meta']['version']}"
+        " (time and memory new/old)"
+    )
+
+    for result in new["results"]:
+        base: Optional[dict] = before.get(key(result))
+        if base is None:
+            continue
+
+        shape, rows, op = key(result)
+        line: str = f"{shape:<7}{rows:>9} {op:<15}"
+        line += f"time x{result['seconds'] / base['seconds']:6.2f}"
+        if result["peak_bytes"] and base["peak_bytes"]:
+            line += f"   memory x{result['peak_bytes'] / base['peak_bytes']:6.2f}"
+        print(line)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="pysv core operation benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--quick", action="store_true", help="only 10k and 100k rows")
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES, default=list(SHAPES))
+    parser.add_argument(
+        "--ops", nargs="+", choices=OPERATIONS, default=list(OPERATIONS)
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs")
+    parser.add_argument("--no-memory", dest="memory", action="store_false")
+    parser.add_argument(
+        "--data-dir", default=os.path.join(tempfile.gettempdir(), "pysv-bench")
+    )
+    parser.add_argument("--output", help="JSON file for the results (default stdout)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return 0
+
+    if args.quick:
+        args.sizes = QUICK_SIZES
+
+    report: dict = run(args)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
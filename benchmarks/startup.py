@@ -0,0 +1,103 @@
+"""
+Startup time benchmark
+
+Every sample runs in a fresh interpreter (with an empty HOME, so the
+user's settings and history don't change the result):
+
+    python           bare interpreter startup (the baseline)
+    exec             pysv --exec help (batch mode, output to a pipe)
+    prompt           pysv until the first prompt is shown and accepted
+
+The median of every benchmark, minus the baseline, must stay under its
+budget; the script exits with 1 otherwise.
+
+    python benchmarks/startup.py [--runs N] [--prompt-budget MS] [--exec-budget MS]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+# milliseconds over the bare interpreter startup (the prompt needs
+# prompt_toolkit, which alone takes ~180ms to import)
+PROMPT_BUDGET_MS: float = 300
+EXEC_BUDGET_MS: float = 120
+
+# shows the prompt (with fake terminal input and output) and accepts it
+PROMPT_SNIPPET: str = """
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+from pysv.functions.general import make_config
+make_config()
+with create_pipe_input() as inp, create_app_session(input=inp, output=DummyOutput()):
+    from pysv.tui.session import Session
+    inp.send_text("\\r")
+    Session().run()
+"""
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMMANDS: Dict[str, List[str]] = {
+    "python": [sys.executable, "-c", "pass"],
+    "exec": [sys.executable, "-m", "pysv", "--exec", "help"],
+    "prompt": [sys.executable, "-c", PROMPT_SNIPPET],
+}
+
+
+def sample(command: List[str], env: dict) -> float:
+    """Run a command once and return its wall time in milliseconds"""
+    start: float = time.perf_counter()
+    subprocess.run(
+        command,
+        env=env,
+        cwd=ROOT,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="pysv startup time benchmark")
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--prompt-budget", type=float, default=PROMPT_BUDGET_MS)
+    parser.add_argument("--exec-budget", type=float, default=EXEC_BUDGET_MS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        env: dict = dict(os.environ, HOME=home, PYTHONPATH=ROOT)
+
+        # warm up the file system cache and the bytecode
+        for command in COMMANDS.values():
+            sample(command, env)
+
+        medians: Dict[str, float] = {}
+        for name, command in COMMANDS.items():
+            times: List[float] = [sample(command, env) for _ in range(args.runs)]
+            medians[name] = statistics.median(times)
+            print(
+                f"{name:<8} median {medians[name]:7.1f} ms"
+                f"   min {min(times):7.1f} ms   max {max(times):7.1f} ms"
+            )
+
+    ok: bool = True
+    for name, budget in (("exec", args.exec_budget), ("prompt", args.prompt_budget)):
+        over: float = medians[name] - medians["python"]
+        status: str = "ok" if over <= budget else "OVER BUDGET"
+        print(
+            f"{name:<8} +{over:6.1f} ms over python"
+            f" (budget {budget:.0f} ms) {status}"
+        )
+        ok = ok and over <= budget
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
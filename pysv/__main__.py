@@ -1,15 +1,48 @@
-from pysv.functions.general import p_print, make_config
+from pysv.functions.general import p_print, make_config, split_commands
 from pysv.tui.session import Session
+from typing import List
 import click
+import sys
 
 
 @click.command()
 @click.option("--file", "-f", is_flag=False, help="CSV file that should be pre-loaded.")
-def main(file: str) -> None:
+@click.option(
+    "--exec",
+    "-e",
+    "commands",
+    is_flag=False,
+    help="Commands (separated by ;, escape a ; in a value as \\;) to run without the prompt.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Report the time and the peak memory of every command.",
+)
+@click.option(
+    "--script",
+    "-s",
+    type=click.File("r"),
+    help="File with the commands (one per line) to run without the prompt.",
+)
+def main(file: str, commands: str, profile: bool, script) -> None:
     make_config()
 
+    if commands or script:
+        # run the commands and quit
+        session = Session(interactive=False)
+        session.timing = session.timing_memory = profile
+        if file:
+            session.load_file(file, wait=True)
+
+        lines: List[str] = script.read().splitlines() if script else []
+        if commands:
+            lines += split_commands(commands)
+        sys.exit(0 if session.run_script(lines) else 1)
+
     # Create session
     session = Session()
+    session.timing = session.timing_memory = profile
 
     if file:
         session.load_file(file)
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from prompt_toolkit.styles.style import Style
+if TYPE_CHECKING:
+    from prompt_toolkit.styles.style import Style
 
 
 @dataclass
@@ -32,7 +34,9 @@ class Colors:
 }}
         """
 
-    def render_style(self) -> Style:
+    def render_style(self) -> "Style":
+        from prompt_toolkit.styles.style import Style
+
         return Style.from_dict(
             {
                 "dialog": f"bg: {self.bg_color}",
@@ -44,5 +48,9 @@ class Colors:
                 "frame.label": f"bg: {self.title_color}",
                 "prompt_text": f"fg: {self.text_color_2}",
                 "text-area": f"bg: {self.bg_color} {self.text_color_2}",
+                "grid.header": f"bold fg: {self.title_color}",
+                "grid.index": f"fg: {self.border_color}",
+                "grid.cursor": "reverse",
+                "grid.status": f"bg: {self.border_color} {self.text_color_1}",
             }
         )
@@ -0,0 +1,105 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, Optional, Union
+from pysv.functions.output import title_message
+
+
+@dataclass
+class ColumnStats:
+    """Summary of the values of a column"""
+
+    count: int  # number of values
+    nulls: int  # empty (or blank) values
+    distinct: int  # different values (nulls included)
+    numeric: bool  # every non null value is a number
+    minimum: Optional[Union[float, str]] = None  # smallest non null value
+    maximum: Optional[Union[float, str]] = None  # largest non null value
+    total: Optional[float] = None  # sum (numeric columns only)
+    mean: Optional[float] = None  # average (numeric columns only)
+
+    @classmethod
+    def from_values(cls, values: Iterable[str]) -> "ColumnStats":
+        """
+        Compute the statistics of a column in a single pass.
+        The values are counted first, so the rest of the work is done
+        once per distinct value.
+
+        Arguments:
+            values (Iterable[str]): values of the column
+
+        Returns:
+            (ColumnStats): statistics of the values
+        """
+        counts: Counter = Counter(values)
+        count: int = sum(counts.values())
+
+        nulls: int = 0
+        numeric: bool = True
+        total: float = 0.0
+        numbers: list = []
+        texts: list = []
+
+        for value, times in counts.items():
+            if not value.strip():
+                nulls += times
+                continue
+
+            texts.append(value)
+            if numeric:
+                try:
+                    number: float = float(value)
+                    numbers.append(number)
+                    total += number * times
+                except ValueError:
+                    numeric = False
+
+        stats: ColumnStats = cls(
+            count=count,
+            nulls=nulls,
+            distinct=len(counts),
+            numeric=numeric and bool(numbers),
+        )
+
+        if stats.numeric:
+            stats.minimum, stats.maximum = min(numbers), max(numbers)
+            stats.total = total
+            stats.mean = total / (count - nulls)
+        elif texts:
+            stats.minimum, stats.maximum = min(texts), max(texts)
+
+        return stats
+
+    def render(self, column: str) -> str:
+        """
+        Render the statistics as a message
+
+        Arguments:
+            column (str): name of the column
+
+        Returns:
+            (str): one line for every statistic
+        """
+        lines: list = [
+            ("count", self.count),
+            ("nulls", self.nulls),
+            ("distinct", self.distinct),
+            ("min", self.minimum),
+            ("max", self.maximum),
+        ]
+        if self.numeric:
+            lines += [("sum", self.total), ("mean", self.mean)]
+
+        message: str = "".join(
+            f"\n«{name}:» {'-' if value is None else format_stat(value)}"
+            for name, value in lines
+        )
+        return title_message(f"Stats {column}", message)
+
+
+def format_stat(value: Union[int, float, str]) -> str:
+    """Show whole numbers without a decimal part (12.0 -> 12)"""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
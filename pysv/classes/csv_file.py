@@ -1,16 +1,312 @@
-from dataclasses import dataclass
-from pysv.functions.general import make_csv_row
-from typing import List, Tuple
+import csv
+import io
+import os
+import shutil
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from html import escape
+from itertools import islice, zip_longest
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type
 from pysv.functions.output import error_message, title_message
+from pysv.functions.sort import invert_order, value_key
+from pysv.classes.sort_key import SortKey
+from pysv.classes.column_stats import ColumnStats
+from pysv.classes.typed_column import TypedColumn
+from pysv.classes.edit import Edit
+from pysv.classes.journal import Journal
+from pysv.classes.prefix_index import PrefixIndex
+from pysv.classes.value_index import ValueIndex, cell_matches
+
+# values of a text column measured to estimate its memory
+MEMORY_SAMPLE: int = 1000
+
+# cells listed by «find» (the rest are only counted)
+FIND_LIMIT: int = 100
+
+
+class AmbiguousColumnError(ValueError):
+    """A column name is shared by more than one column"""
+
+    def __init__(self, column: str, count: int) -> None:
+        options: str = " | ".join(f"«{column}#{i}»" for i in range(1, count + 1))
+        super().__init__(
+            f"There are {count} columns named «{column}», use one of {options}"
+        )
+
+
+def transpose(rows: Iterable[List[str]], width: int) -> List[List[str]]:
+    """
+    Turn rows into columns (at C speed). Rows shorter than the width are
+    padded with empty cells, the values of longer rows are kept as extra
+    columns (so that the caller can know the rows were wider).
+
+    Arguments:
+        rows (Iterable[List[str]]): the rows
+        width (int): number of columns expected
+
+    Returns:
+        (List[List[str]]): at least «width» columns
+    """
+    columns: List[List[str]] = [
+        list(col) for col in zip_longest(*rows, fillvalue="")
+    ]
+
+    # make sure every column exists, even when there are no rows
+    row_count: int = len(columns[0]) if columns else 0
+    while len(columns) < width:
+        columns.append([""] * row_count)
+
+    return columns
 
 
 @dataclass()
 class CSVFile:
-    """CSV File loaded into memory"""
+    """
+    CSV File loaded into memory.
+
+    The values are stored column by column (one list per column), so
+    deleting or switching columns only touches the list of columns and
+    scanning a column walks a single contiguous list.
+    """
 
     header: List[str]  # column names / table header
-    rows: List[List[str]]  # rows of he csv file
+    # values of the csv file, one list (or TypedColumn) per column
+    columns: List[List[str]]
     path: str = ""
+    dialect: Type[csv.Dialect] = csv.excel  # dialect the file was loaded with
+    # column name -> positions of the columns with that name
+    _header_index: Dict[str, List[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # column names sorted for completion (None until the first completion
+    # after the header changes)
+    _column_prefixes: Optional[PrefixIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # id of a column's list -> (that list, its cached statistics)
+    _stats: Dict[int, Tuple[list, ColumnStats]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # edits that can be undone / redone (most recent last)
+    _undo: List[Edit] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _redo: List[Edit] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # sidecar file where the unsaved edits are written as they are made
+    journal: Optional[Journal] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # words and values -> cells, built by the first «find» (None until then
+    # and after a change that it can't follow)
+    _index: Optional[ValueIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # the file has edits that were not saved to its path
+    dirty: bool = field(default=False, init=False, repr=False, compare=False)
+    # some rows had values past the last column of the header (they are
+    # not kept, so the file can't be saved over its source)
+    wide_rows: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.index_header()
+
+    def index_header(self) -> None:
+        """
+        Rebuild the column name -> positions index.
+        Must be called whenever the header changes.
+        """
+        self._header_index = {}
+        for position, name in enumerate(self.header):
+            self._header_index.setdefault(name, []).append(position)
+        self._column_prefixes = None
+
+    def column_index(self, column: str) -> int:
+        """
+        Get the position of a column in the header.
+        Columns that share a name are addressed as «name#n»
+        (n-th column with that name, starting at 1).
+
+        Arguments:
+            column (str): name of the column
+
+        Returns:
+            (int): position of the column
+
+        Raises:
+            AmbiguousColumnError: more than one column has that name
+            ValueError: there's no column with that name
+        """
+        positions: Optional[List[int]] = self._header_index.get(column)
+
+        if positions is None:
+            # name#n -> n-th column called name
+            name, sep, number = column.rpartition("#")
+            positions = self._header_index.get(name) if sep else None
+            if positions is None or not number.isdigit():
+                raise ValueError(column)
+            if not 1 <= int(number) <= len(positions):
+                raise ValueError(column)
+            return positions[int(number) - 1]
+
+        if len(positions) > 1:
+            raise AmbiguousColumnError(column, len(positions))
+
+        return positions[0]
+
+    def column_name(self, index: int) -> str:
+        """
+        Get a name that addresses a single column (see column_index)
+
+        Arguments:
+            index (int): position of the column
+
+        Returns:
+            (str): «name» or «name#n» when the name is shared
+        """
+        name: str = self.header[index]
+        positions: List[int] = self._header_index[name]
+
+        if len(positions) == 1:
+            return name
+        return f"{name}#{positions.index(index) + 1}"
+
+    def column_names(self) -> List[str]:
+        """
+        Names of every column, each one addressing a single column
+
+        Returns:
+            (List[str]): column names (see column_name)
+        """
+        return [self.column_name(i) for i in range(len(self.header))]
+
+    def complete_column(self, prefix: str) -> Iterator[str]:
+        """
+        Column names that start with a prefix, ignoring the case (the names
+        are sorted once, until the header changes)
+
+        Arguments:
+            prefix (str): start of the name
+
+        Returns:
+            (Iterator[str]): names that address a single column
+                (see column_name), in alphabetical order
+        """
+        if self._column_prefixes is None:
+            self._column_prefixes = PrefixIndex(self.column_names())
+        return self._column_prefixes.complete(prefix)
+
+    @classmethod
+    def from_rows(
+        cls,
+        header: List[str],
+        rows: Iterable[List[str]],
+        path: str = "",
+        dialect: Type[csv.Dialect] = csv.excel,
+    ) -> "CSVFile":
+        """
+        Create a CSVFile from a header and row oriented data
+
+        Rows shorter than the header are padded with empty cells and
+        values past the last column of the header are dropped (wide_rows
+        is then set).
+
+        Arguments:
+            header (List[str]): column names
+            rows (Iterable[List[str]]): rows of the csv file
+            path (str): path of the csv file
+            dialect (Type[csv.Dialect]): dialect of the csv file
+
+        Returns:
+            (CSVFile): column oriented CSVFile
+        """
+        width: int = len(header)
+        columns: List[List[str]] = transpose(rows, width)
+
+        file: CSVFile = cls(
+            header=list(header), columns=columns[:width], path=path, dialect=dialect
+        )
+        file.wide_rows = len(columns) > width
+        return file
+
+    def row_count(self) -> int:
+        """
+        Number of rows in the CSV file (the header is not counted)
+
+        Returns:
+            (int): number of rows
+        """
+        return len(self.columns[0]) if self.columns else 0
+
+    def count_rows_until(self, stop: int) -> int:
+        """
+        Number of rows, counted no further than a limit (a file read on
+        demand is only indexed that far)
+
+        Arguments:
+            stop (int): most rows that are counted
+
+        Returns:
+            (int): the number of rows, at most «stop»
+        """
+        return min(self.row_count(), stop)
+
+    def known_row_count(self) -> Optional[int]:
+        """
+        Number of rows, if it is known without reading the whole file
+
+        Returns:
+            (Optional[int]): the number of rows, None while a file read on
+                demand is not fully indexed
+        """
+        return self.row_count()
+
+    def get_row(self, index: int) -> List[str]:
+        """
+        Gather the values of a single row
+
+        Arguments:
+            index (int): index of the row
+
+        Returns:
+            (List[str]): values of the row, in header order
+        """
+        # validate the index once, so that empty files also raise
+        if not -self.row_count() <= index < self.row_count():
+            raise IndexError(index)
+
+        return [col[index] for col in self.columns]
+
+    def get_value(self, col_index: int, row_index: int) -> str:
+        """
+        Get the value stored at the given column and row positions
+
+        Arguments:
+            col_index (int): position of the column in the header
+            row_index (int): index of the row
+
+        Returns:
+            (str): value of the cell
+        """
+        return self.columns[col_index][row_index]
+
+    def iter_rows(self) -> Iterator[List[str]]:
+        """
+        Iterate over the rows of the CSV file
+
+        Returns:
+            (Iterator[List[str]]): every row, in order
+        """
+        for row in zip(*self.columns):
+            yield list(row)
+
+    @property
+    def rows(self) -> List[List[str]]:
+        """Row oriented copy of the data (builds every row, avoid on big files)"""
+        return list(self.iter_rows())
 
     def render(self) -> str:
         """
@@ -19,18 +315,32 @@ class CSVFile:
         Returns:
             (str): CSVFile as a default csv string
         """
-        # create the csv header H1, H2, H3, ... Hn
-        output: str = make_csv_row(self.header)
+        buffer: io.StringIO = io.StringIO()
+        self.write(buffer)
+        return buffer.getvalue()
 
-        # create a new row on the CSV for every row in this class
-        for row in self.rows:
-            output += make_csv_row(row)
+    def write(self, f: io.TextIOBase) -> None:
+        """
+        Stream the CSV (header and rows) into a text file object,
+        using the dialect the file was loaded with
 
-        return output
+        Arguments:
+            f (io.TextIOBase): file object opened with newline=""
+        """
+        writer = csv.writer(f, self.dialect)
+
+        # create the csv header H1, H2, H3, ... Hn
+        writer.writerow(self.header)
+
+        # the rows are written one by one, never as a single string
+        writer.writerows(self.iter_rows())
 
     def save(self, new_path: str = "") -> str:
         """
-        Save the CSV to a file
+        Save the CSV to a file.
+        The rows are streamed into a temporary file next to the target,
+        that then replaces the target at once (a failed save never leaves
+        a half written file behind).
 
         Arguments:
             new_path (str): Path where the file should be stored
@@ -41,17 +351,55 @@ class CSVFile:
         """
         # get a path if none was provided
         path: str = new_path or self.path
+        tmp_path: str = ""
 
         try:
-            # save the file
-            with open(path, "w") as f:
-                # generate and write the csv
-                f.write(self.render())
+            # the temporary file must be on the same file system
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=".pysv-", suffix=".tmp", dir=os.path.dirname(path) or "."
+            )
+
+            # save the file using a 1 MiB write buffer
+            with open(fd, "w", newline="", buffering=1 << 20) as f:
+                self.write(f)
+
+            # the values past the header would be lost from the source
+            if (
+                self.wide_rows
+                and os.path.exists(path)
+                and os.path.samefile(path, self.path)
+            ):
+                os.remove(tmp_path)
+                return error_message(
+                    "Some rows have more values than the header and those "
+                    "values are not kept, save the file to a new path"
+                )
+
+            # keep the permissions of the file that is being replaced, a new
+            # file gets the ones open() would give it (mkstemp uses 0600)
+            if os.path.exists(path):
+                shutil.copymode(path, tmp_path)
+            else:
+                umask: int = os.umask(0)
+                os.umask(umask)
+                os.chmod(tmp_path, 0o666 & ~umask)
+            os.replace(tmp_path, path)
+
+            # saved to its own path -> nothing left to save
+            if self.path and os.path.samefile(path, self.path):
+                self.dirty = False
+
+            # the journaled edits are now part of the file
+            journal: Optional[Journal] = self.journal
+            if journal is not None and os.path.samefile(path, journal.source):
+                journal.clear()
 
             return title_message(
                 "Saved", f"the file was successfully saved to «{path}»."
             )
         except Exception:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
             return error_message("There was an error trying to save the file!")
 
     def is_loaded(self) -> bool:
@@ -61,35 +409,408 @@ class CSVFile:
         Returns:
             (bool): if the csv file has been loaded
         """
-        return bool(self.header and self.rows)
+        return bool(self.header and self.row_count())
+
+    def memory_usage(self) -> int:
+        """
+        Estimate the memory taken by the values and by the index of
+        «find» (the size of the strings of a text column is measured on a
+        sample of them)
+
+        Returns:
+            (int): bytes
+        """
+        total: int = 0
+        for column in self.columns:
+            if isinstance(column, TypedColumn):
+                total += column.values.itemsize * len(column.values)
+                total += len(column.nulls or b"")
+                continue
+
+            total += sys.getsizeof(column)
+            if column:
+                sample: list = column[:: max(1, len(column) // MEMORY_SAMPLE)]
+                size: int = sum(sys.getsizeof(value) for value in sample)
+                total += size * len(column) // len(sample)
+
+        if self._index is not None:
+            total += self._index.memory_usage(MEMORY_SAMPLE)
+        return total
 
     def add(self, row: List[str]) -> None:
-        """Add a new row to the CSV file rows list
+        """Add a new row to the end of the CSV file
 
         Arguments:
             row (List[str]): list that should be added
         """
-        self.rows.append(row)
+        self.insert_row(self.row_count(), row)
+        self.record(Edit("add", new=list(row)))
+
+    def insert_row(self, index: int, row: List[str]) -> None:
+        """
+        Insert a row before the given index (no edit is recorded)
+
+        Arguments:
+            index (int): index the new row will have
+            row (List[str]): values of the row
+        """
+        for i, col in enumerate(self.columns):
+            value: str = row[i] if i < len(row) else ""
+            try:
+                col.insert(index, value)
+            except ValueError:
+                # the value doesn't fit the column's type
+                self.untype_column(i).insert(index, value)
+
+        self.invalidate_stats()
+        self._index = None
+
+    def remove_row(self, index: int) -> List[str]:
+        """
+        Remove a row (no edit is recorded)
+
+        Arguments:
+            index (int): index of the row
+
+        Returns:
+            (List[str]): values of the removed row
+        """
+        values: List[str] = self.get_row(index)
+        if self._index is not None:
+            self._index.remove_row(index % self.row_count())
+        for col in self.columns:
+            del col[index]
+        self.invalidate_stats()
+        return values
+
+    def insert_column(self, index: int, name: str, column: List[str]) -> None:
+        """
+        Insert a column before the given position (no edit is recorded)
+
+        Arguments:
+            index (int): position the new column will have
+            name (str): name of the column
+            column (List[str]): values of the column
+        """
+        self.columns.insert(index, column)
+        self.header.insert(index, name)
+        self.index_header()
+        self._index = None
+
+    def remove_column(self, index: int) -> Tuple[str, List[str]]:
+        """
+        Remove a column (no edit is recorded)
+
+        Arguments:
+            index (int): position of the column
+
+        Returns:
+            (Tuple[str, List[str]]): name and values of the removed column
+        """
+        # drop the whole column at once (no row is touched)
+        self.invalidate_stats(index)
+        column: List[str] = self.columns.pop(index)
+        name: str = self.header.pop(index)
+        self.index_header()
+        if self._index is not None:
+            self._index.remove_column(index)
+        return (name, column)
+
+    def swap_rows(self, ind1: int, ind2: int) -> None:
+        """Switch two rows in every column (no edit is recorded)"""
+        for col in self.columns:
+            col[ind1], col[ind2] = col[ind2], col[ind1]
+        self._index = None
+
+    def swap_columns(self, ind1: int, ind2: int) -> None:
+        """Switch the values of two columns (no edit is recorded)"""
+        # the header stays in place
+        self.columns[ind1], self.columns[ind2] = (
+            self.columns[ind2],
+            self.columns[ind1],
+        )
+        if self._index is not None:
+            self._index.swap_columns(ind1, ind2)
+
+    def record(self, edit: Edit) -> None:
+        """
+        Remember an edit so that it can be undone
+        (a new edit makes the undone edits impossible to redo)
+
+        Arguments:
+            edit (Edit): the edit that was made
+        """
+        self._undo.append(edit)
+        self._redo.clear()
+        self.log(edit, undo=False)
+
+    def log(self, edit: Edit, undo: bool) -> None:
+        """
+        Write an edit that was just made (or undone) to the journal, the
+        file now has unsaved edits.
+        The journal only holds what is needed to make the change again,
+        an undone edit is written as the edit that reverts it.
+
+        Arguments:
+            edit (Edit): the edit
+            undo (bool): the edit was undone (True) or made (False)
+        """
+        self.dirty = True
+        if self.journal is None:
+            return
+
+        entry: dict = {"op": edit.kind, "first": edit.first, "second": edit.second}
+
+        if edit.kind == "set":
+            entry["value"] = edit.old if undo else edit.new
+
+        elif edit.kind == "delete_row" and undo:
+            entry.update(op="insert_row", values=edit.old)
+
+        elif edit.kind == "delete_column" and undo:
+            name, column = edit.old
+            entry.update(op="insert_column", name=name, values=list(column))
+
+        elif edit.kind == "sort":
+            order: Sequence[int] = invert_order(edit.new) if undo else edit.new
+            entry["order"] = list(order)
+
+        elif edit.kind == "add":
+            if undo:
+                # the added row was the last one
+                entry.update(op="delete_row", first=self.row_count())
+            else:
+                entry["values"] = edit.new
+
+        self.journal.write(entry)
+
+    def replay(self, entries: Iterable[dict]) -> int:
+        """
+        Make again the edits read from a journal (they can't be undone)
+
+        Arguments:
+            entries (Iterable[dict]): journaled edits, in order
+
+        Returns:
+            (int): number of edits that were replayed
+        """
+        count: int = 0
+
+        try:
+            for entry in entries:
+                op: str = entry["op"]
+                first: int = entry["first"]
+
+                if op == "set":
+                    self.set_value(first, entry["second"], entry["value"])
+                    self.invalidate_stats(first)
+                elif op == "delete_row":
+                    self.remove_row(first)
+                elif op == "insert_row":
+                    self.insert_row(first, entry["values"])
+                elif op == "delete_column":
+                    self.remove_column(first)
+                elif op == "insert_column":
+                    self.insert_column(first, entry["name"], entry["values"])
+                elif op == "switch_row":
+                    self.swap_rows(first, entry["second"])
+                elif op == "switch_column":
+                    self.swap_columns(first, entry["second"])
+                elif op == "sort":
+                    self.reorder(entry["order"])
+                elif op == "sort_by":
+                    # a sort made on disk: sort the rows again
+                    keys: List[SortKey] = [
+                        SortKey("", descending, numeric)
+                        for _, descending, numeric in entry["keys"]
+                    ]
+                    positions: List[int] = [key[0] for key in entry["keys"]]
+                    self.reorder(self.sort_order(keys, positions))
+                elif op == "add":
+                    self.insert_row(self.row_count(), entry["values"])
+
+                count += 1
+
+        except (KeyError, ValueError, IndexError, TypeError):
+            # a broken entry ends the replay
+            pass
+
+        if count:
+            self.dirty = True
+        return count
+
+    def apply(self, edit: Edit, undo: bool) -> None:
+        """
+        Revert or redo an edit
+
+        Arguments:
+            edit (Edit): the edit
+            undo (bool): revert the edit (True) or make it again (False)
+        """
+        if edit.kind == "set":
+            self.set_value(edit.first, edit.second, edit.old if undo else edit.new)
+            self.invalidate_stats(edit.first)
+
+        elif edit.kind == "delete_row":
+            if undo:
+                self.insert_row(edit.first, edit.old)
+            else:
+                self.remove_row(edit.first)
+
+        elif edit.kind == "delete_column":
+            if undo:
+                self.insert_column(edit.first, *edit.old)
+            else:
+                self.remove_column(edit.first)
+
+        elif edit.kind == "switch_row":
+            self.swap_rows(edit.first, edit.second)
+
+        elif edit.kind == "switch_column":
+            self.swap_columns(edit.first, edit.second)
+
+        elif edit.kind == "sort":
+            self.reorder(invert_order(edit.new) if undo else edit.new)
+
+        elif edit.kind == "add":
+            if undo:
+                self.remove_row(self.row_count() - 1)
+            else:
+                self.insert_row(self.row_count(), edit.new)
+
+    def next_edit(self, undo: bool = True) -> Optional[Edit]:
+        """
+        The edit that the next undo (or redo) would apply
+
+        Arguments:
+            undo (bool): look at the undo (True) or the redo (False) stack
+
+        Returns:
+            (Edit|None): the edit, None if there's nothing to undo/redo
+        """
+        stack: List[Edit] = self._undo if undo else self._redo
+        return stack[-1] if stack else None
+
+    def undo(self) -> str:
+        """
+        Revert the most recent edit
+
+        Returns:
+            (str): Message saying which edit was undone
+        """
+        if not self._undo:
+            return error_message("There's nothing to undo")
+
+        edit: Edit = self._undo.pop()
+        self.apply(edit, undo=True)
+        self._redo.append(edit)
+        self.log(edit, undo=True)
+        return title_message("Undone", f"«{edit.kind.replace('_', ' ')}»")
+
+    def redo(self) -> str:
+        """
+        Make the most recently undone edit again
+
+        Returns:
+            (str): Message saying which edit was redone
+        """
+        if not self._redo:
+            return error_message("There's nothing to redo")
+
+        edit: Edit = self._redo.pop()
+        self.apply(edit, undo=False)
+        self._undo.append(edit)
+        self.log(edit, undo=False)
+        return title_message("Redone", f"«{edit.kind.replace('_', ' ')}»")
+
+    def set_value(self, col_index: int, row_index: int, value: str) -> None:
+        """
+        Set the value stored at the given column and row positions
+
+        Arguments:
+            col_index (int): position of the column in the header
+            row_index (int): index of the row
+            value (str): new value of the cell
+        """
+        old: str = self.columns[col_index][row_index]
+
+        try:
+            self.columns[col_index][row_index] = value
+        except ValueError:
+            # the value doesn't fit the column's type
+            self.untype_column(col_index)[row_index] = value
+
+        if self._index is not None:
+            self._index.set_value(
+                col_index, row_index % self.row_count(), old, value
+            )
+
+    def untype_column(self, index: int) -> List[str]:
+        """
+        Store a typed column as a plain list of strings again
+        (so that it can hold any value)
+
+        Arguments:
+            index (int): position of the column
+
+        Returns:
+            (List[str]): the new column
+        """
+        self.invalidate_stats(index)
+        column: List[str] = list(self.columns[index])
+        self.columns[index] = column
+        return column
+
+    def iter_table_html(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None,
+        rows: Optional[Iterator[List[str]]] = None,
+    ) -> Iterator[str]:
+        """
+        Generate the CSV as an html table, one row at a time.
+        Every value is html escaped.
+
+        Arguments:
+            start (int): index of the first row of the table
+            stop (int|None): index past the last row of the table
+                (Defaults to the end of the file)
+            rows (Iterator[List[str]]|None): iterator already positioned at
+                the row «start», so that consecutive tables can share a
+                single pass over the file (Defaults to self.iter_rows())
+
+        Returns:
+            (Iterator[str]): html of the table, split by rows
+        """
+        # table header
+        yield "<table><tr><th>#</th>" + "".join(
+            f"<th>{escape(head)}</th>" for head in self.header
+        ) + "</tr>\n"
+
+        if rows is None:
+            rows = islice(self.iter_rows(), start, stop)
+        else:
+            rows = islice(rows, None if stop is None else stop - start)
+
+        # one <tr> per row, numbered with the row index
+        for i, row in enumerate(rows, start):
+            yield f"<tr><td>{i}</td>" + "".join(
+                f"<td>{escape(value)}</td>" for value in row
+            ) + "</tr>\n"
+
+        yield "</table>\n"
 
     def make_table_str(self) -> str:
-        # TODO: Comment
-        table: str = "<table><tr><th>#</th>"
-        for head in self.header:
-            table += f"<th>{head}</th>"
-        table += "</tr>"
-
-        i: int = 0
-        for row in self.rows:
-            table += f"<tr><td>{i}</td>"
-            i += 1
-            for value in row:
-                table += f"<td>{value}</td>"
-            table += "</tr>"
-        table += "</table>"
-        return table
+        """
+        Render the CSV as an html table
+
+        Returns:
+            (str): html table with the header and every row
+        """
+        return "".join(self.iter_table_html())
 
     def make_row_num_list(self) -> List[str]:
-        return [str(num) for num in range(len(self.rows))]
+        return [str(num) for num in range(self.row_count())]
 
     def list_columns(self) -> str:
         """
@@ -99,7 +820,7 @@ class CSVFile:
             (str): the names of every column:
                 Columns: Col1 | Col2 | ... | ColN
         """
-        return title_message("Columns", " | ".join(self.header))
+        return title_message("Columns", " | ".join(self.column_names()))
 
     def list_rows(self) -> str:
         """
@@ -110,7 +831,7 @@ class CSVFile:
                 Rows: [0, N]
         """
         # number of rows in the csv
-        length: int = len(self.rows)
+        length: int = self.row_count()
 
         if length == 0:
             return error_message("There are no rows!")
@@ -119,7 +840,7 @@ class CSVFile:
             return title_message("Rows", "0")
         else:
             # there are more than 1 rows
-            return title_message("Rows", f"[0, {len(self.rows)-1}]")
+            return title_message("Rows", f"[0, {length-1}]")
 
     def list_col_and_rows(self) -> str:
         """
@@ -145,19 +866,22 @@ class CSVFile:
         """
         try:
             # get the index of the column in the header
-            index: int = self.header.index(column)
+            index: int = self.column_index(column)
 
-            # list comprehension to get all the values in that column
-            values: List[str] = [row[index] for row in self.rows]
+            # the values of the column are already stored together
+            values: List[str] = self.columns[index]
 
             # create the message
-            message: str = ""
-            for i in range(len(values)):
-                message += f"\n«{i}:» {values[i]}"
+            message: str = "".join(
+                f"\n«{i}:» {value}" for i, value in enumerate(values)
+            )
 
             # send sucess message
             return title_message(column.capitalize(), message)
 
+        except AmbiguousColumnError as e:
+            return error_message(str(e))
+
         except (ValueError, IndexError):
             return error_message(f"The column «{column}» doesn't exist!")
 
@@ -179,7 +903,7 @@ class CSVFile:
             row_number: int = int(row)
 
             # the row that should be peeked
-            p_row: List[str] = self.rows[row_number]
+            p_row: List[str] = self.get_row(row_number)
 
             # create Message
             message: str = ""
@@ -214,19 +938,20 @@ class CSVFile:
             raise IndexError
         try:
             # get the index of the column in the header
-            index: int = self.header.index(column)
-            del self.header[index]
+            index: int = self.column_index(column)
 
-            # loop through the rows
-            for row in self.rows:
-                # delete the cell where thw column and the current row meet
-                del row[index]
+            # the removed column is kept (not copied) to undo the delete
+            removed: Tuple[str, List[str]] = self.remove_column(index)
+            self.record(Edit("delete_column", index, old=removed))
 
             # send success message
             return title_message(
                 "Deleted", f"The column «{column}» was successfully deleted!"
             )
 
+        except AmbiguousColumnError as e:
+            return error_message(str(e))
+
         except (ValueError, IndexError):
             return error_message(f"The column «{column}» does not exist!")
 
@@ -254,8 +979,11 @@ class CSVFile:
             # get the index of the row
             index: int = int(row)
 
-            # delete the row
-            del self.rows[index]
+            # delete the row's value from every column
+            values: List[str] = self.remove_row(index)
+            if index < 0:
+                index += self.row_count() + 1
+            self.record(Edit("delete_row", index, old=values))
 
             # send success message
             return title_message(
@@ -292,8 +1020,13 @@ class CSVFile:
             # index of the second row
             ind2: int = int(row2)
 
-            # switch the first row with the second row
-            self.rows[ind1], self.rows[ind2] = self.rows[ind2], self.rows[ind1]
+            # validate both indexes before touching any column
+            self.get_row(ind1)
+            self.get_row(ind2)
+
+            # switch the first row with the second row in every column
+            self.swap_rows(ind1, ind2)
+            self.record(Edit("switch_row", ind1, ind2))
 
             # send success message
             return title_message(
@@ -327,15 +1060,14 @@ class CSVFile:
         """
         try:
             # index of the first column in the header
-            ind1: int = self.header.index(col1)
+            ind1: int = self.column_index(col1)
 
             # index of the second column in the header
-            ind2: int = self.header.index(col2)
+            ind2: int = self.column_index(col2)
 
-            # loop through every row
-            for row in self.rows:
-                # switch the columns in each row
-                row[ind1], row[ind2] = row[ind2], row[ind1]
+            # switch the stored columns (the header stays in place)
+            self.swap_columns(ind1, ind2)
+            self.record(Edit("switch_column", ind1, ind2))
 
             # send success message
             return title_message(
@@ -343,6 +1075,9 @@ class CSVFile:
                 f"The columns «{col1}» and «{col2}» were successfully switched!",
             )
 
+        except AmbiguousColumnError as e:
+            return error_message(str(e))
+
         except (ValueError, IndexError):
             return error_message(
                 f"At least one of «column {col1}» and «column {col2}» do not exist!"
@@ -365,15 +1100,18 @@ class CSVFile:
 
         try:
             # index of the column
-            col_index: int = self.header.index(column)
+            col_index: int = self.column_index(column)
             # index of the row
             row_index: int = int(row)
 
             # get the value of the cell
-            value: str = self.rows[row_index][col_index]
+            value: str = self.get_value(col_index, row_index)
 
             return (title_message(f"Cell {column}-{row}", value), value)
 
+        except AmbiguousColumnError as e:
+            return (error_message(str(e)), "")
+
         except (ValueError, IndexError):
             return (
                 error_message(
@@ -399,16 +1137,230 @@ class CSVFile:
 
         try:
             # index of the column
-            col_index: int = self.header.index(col)
+            col_index: int = self.column_index(col)
             # index of the row
             row_index: int = int(row)
 
-            self.rows[row_index][col_index] = content
+            old: str = self.get_value(col_index, row_index)
+            self.set_value(col_index, row_index, content)
+            self.invalidate_stats(col_index)
+            self.record(
+                Edit("set", col_index, row_index % self.row_count(), old, content)
+            )
             return title_message(
                 "Set", f"The cell «{col} - {row}» was set to {content}"
             )
 
+        except AmbiguousColumnError as e:
+            return error_message(str(e))
+
         except (ValueError, IndexError):
             # a ValueError means that the column does not exist
             # an Index Error means that the row does not exist
             return error_message("It's not possible to set that cell")
+
+    def sort(self, keys: List[SortKey], memory: int = 0) -> str:
+        """
+        Sort the rows by one or more columns
+
+        Arguments:
+            keys (List[SortKey]): columns to sort by, most significant first
+            memory (int): memory budget (in bytes) for files that are not
+                in memory yet (see LazyCSVFile.sort_rows)
+
+        Returns:
+            (str):
+                -> error -> Error saying that a column was not found
+                -> sucess -> Message saying that the rows were sorted
+        """
+        try:
+            positions: List[int] = [self.column_index(key.column) for key in keys]
+
+        except AmbiguousColumnError as e:
+            return error_message(str(e))
+
+        except ValueError as e:
+            return error_message(f"The column «{e}» does not exist!")
+
+        undoable: bool = self.sort_rows(keys, positions, memory)
+        self._index = None
+
+        columns: str = ", ".join(key.column for key in keys)
+        msg: str = f"The rows were sorted by «{columns}»"
+        if not undoable:
+            msg += " (on disk, it can't be undone)"
+        return title_message("Sorted", msg)
+
+    def sort_rows(self, keys: List[SortKey], positions: List[int], memory: int) -> bool:
+        """
+        Reorder the rows (in memory) by the given keys
+
+        Arguments:
+            keys (List[SortKey]): columns to sort by, most significant first
+            positions (List[int]): position of the column of every key
+            memory (int): memory budget (not needed, the rows are in memory)
+
+        Returns:
+            (bool): the sort can be undone
+        """
+        # the order is all that is needed to undo the sort
+        order: List[int] = self.sort_order(keys, positions)
+        self.reorder(order)
+        self.record(Edit("sort", new=array("q", order)))
+        return True
+
+    def sort_order(self, keys: List[SortKey], positions: List[int]) -> List[int]:
+        """
+        Order of the rows sorted by the given keys
+
+        Arguments:
+            keys (List[SortKey]): columns to sort by, most significant first
+            positions (List[int]): position of the column of every key
+
+        Returns:
+            (List[int]): index of the row for every position
+        """
+        order: List[int] = list(range(self.row_count()))
+
+        # stable sorts, from the least to the most significant key,
+        # each one on the pre-extracted keys of its column
+        for key, position in reversed(list(zip(keys, positions))):
+            values: list = list(map(value_key(key), self.columns[position]))
+            order.sort(
+                key=values.__getitem__,
+                reverse=key.descending and not key.numeric,
+            )
+
+        return order
+
+    def reorder(self, order: Sequence[int]) -> None:
+        """
+        Put the rows in a new order (no edit is recorded)
+
+        Arguments:
+            order (Sequence[int]): index of the row for every position
+        """
+        # rebuild every column in the new order
+        self._index = None
+        columns: List[List[str]] = self.columns
+        self.columns = [
+            col.take(order)
+            if isinstance(col, TypedColumn)
+            else list(map(col.__getitem__, order))
+            for col in columns
+        ]
+
+        # the statistics don't depend on the order, keep them
+        for old, new in zip(columns, self.columns):
+            if id(old) in self._stats:
+                self._stats[id(new)] = (new, self._stats.pop(id(old))[1])
+
+    def column_stats(self, index: int) -> ColumnStats:
+        """
+        Get the statistics of a column, computing them only if they are
+        not cached. The cache follows the column's values, so switching
+        columns or rows keeps it valid.
+
+        Arguments:
+            index (int): position of the column
+
+        Returns:
+            (ColumnStats): statistics of the column
+        """
+        column: list = self.columns[index]
+        cached: Optional[Tuple[list, ColumnStats]] = self._stats.get(id(column))
+
+        if cached is None:
+            cached = (column, ColumnStats.from_values(column))
+            self._stats[id(column)] = cached
+
+        return cached[1]
+
+    def invalidate_stats(self, index: Optional[int] = None) -> None:
+        """
+        Forget the cached statistics of a column whose values changed
+
+        Arguments:
+            index (int|None): position of the column (None -> every column)
+        """
+        if index is None:
+            self._stats.clear()
+        elif self._stats:
+            self._stats.pop(id(self.columns[index]), None)
+
+    def stats(self, column: str) -> str:
+        """
+        Show the statistics of a column (count, nulls, distinct values,
+        min/max and, for numeric columns, sum and mean)
+
+        Arguments:
+            column (str): name of the column
+
+        Returns:
+            (str):
+                -> error -> Error saying that the column was not found
+                -> sucess -> The statistics of the column
+        """
+        try:
+            return self.column_stats(self.column_index(column)).render(column)
+
+        except AmbiguousColumnError as e:
+            return error_message(str(e))
+
+        except (ValueError, IndexError):
+            return error_message(f"The column «{column}» does not exist!")
+
+    def find_cells(self, text: str, use_index: bool = True) -> List[Tuple[int, int]]:
+        """
+        Find the cells that contain a text: the whole value or some of its
+        words, ignoring the case (see cell_matches). The index of the
+        values is built on the first search and then follows the edits.
+
+        Arguments:
+            text (str): text that is looked for
+            use_index (bool): use (and build) the index instead of reading
+                every cell
+
+        Returns:
+            (List[Tuple[int, int]]): row and column of every cell, by row
+        """
+        if not use_index:
+            return [
+                (row, col)
+                for row, values in enumerate(self.iter_rows())
+                for col, value in enumerate(values)
+                if cell_matches(value, text)
+            ]
+
+        if self._index is None:
+            self._index = ValueIndex(self.columns)
+        return self._index.find(text, self.get_value)
+
+    def find(self, text: str, use_index: bool = True) -> str:
+        """
+        Show the cells that contain a text (see find_cells)
+
+        Arguments:
+            text (str): text that is looked for
+            use_index (bool): use the index of the values
+
+        Returns:
+            (str):
+                -> error -> Error saying that no cell contains the text
+                -> sucess -> The row, column and value of the cells
+        """
+        if not text.strip():
+            return error_message("Give the «text» to find")
+
+        cells: List[Tuple[int, int]] = self.find_cells(text, use_index)
+        if not cells:
+            return error_message(f"No cell contains «{text}»")
+
+        message: str = "".join(
+            f"\n«{row} {self.header[col]}:» {self.get_value(col, row)}"
+            for row, col in cells[:FIND_LIMIT]
+        )
+        if len(cells) > FIND_LIMIT:
+            message += f"\n... and «{len(cells) - FIND_LIMIT}» more"
+
+        return title_message(f"Found {len(cells)}", message)
@@ -0,0 +1,182 @@
+import os
+from typing import Dict, Iterator, List, MutableSequence, Tuple
+from pysv.classes.csv_file import CSVFile
+from pysv.classes.column_stats import ColumnStats
+from pysv.classes.sort_key import SortKey
+from pysv.functions.output import error_message
+
+
+class ColumnView(MutableSequence):
+    """
+    The values of a column on a subset of the rows.
+    Reading or setting a value reads or sets the underlying column.
+    """
+
+    def __init__(self, column: MutableSequence, indexes: List[int]) -> None:
+        self.column: MutableSequence = column
+        self.indexes: List[int] = indexes
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    def __getitem__(self, index: int) -> str:
+        return self.column[self.indexes[index]]
+
+    def __setitem__(self, index: int, value: str) -> None:
+        self.column[self.indexes[index]] = value
+
+    def __delitem__(self, index: int) -> None:
+        raise TypeError("rows can't be deleted through a view")
+
+    def insert(self, index: int, value: str) -> None:
+        raise TypeError("rows can't be added through a view")
+
+    def __iter__(self) -> Iterator[str]:
+        column: MutableSequence = self.column
+        for index in self.indexes:
+            yield column[index]
+
+
+class CSVView(CSVFile):
+    """
+    The rows of a CSV file that matched a «where» expression.
+
+    Rows are numbered inside the view (0 is the first match). Cells can
+    be read, edited and rows switched (the changes go to the original
+    file), but the shape of the file (deleting rows or columns, switching
+    columns) can only be changed once the filter is cleared.
+    """
+
+    def __init__(self, base: CSVFile, indexes: List[int]) -> None:
+        self.base: CSVFile = base
+        self.indexes: List[int] = indexes
+
+        # the header is shared with the original file
+        super().__init__(
+            header=base.header, columns=None, path="", dialect=base.dialect
+        )
+
+    @property
+    def columns(self) -> List[ColumnView]:
+        """Columns of the original file, restricted to the matching rows"""
+        return [ColumnView(column, self.indexes) for column in self.base.columns]
+
+    @columns.setter
+    def columns(self, value: None) -> None:
+        # the data always comes from the original file
+        pass
+
+    def row_count(self) -> int:
+        return len(self.indexes)
+
+    def get_row(self, index: int) -> List[str]:
+        return self.base.get_row(self.indexes[index])
+
+    def get_value(self, col_index: int, row_index: int) -> str:
+        return self.base.get_value(col_index, self.indexes[row_index])
+
+    def iter_rows(self) -> Iterator[List[str]]:
+        for index in self.indexes:
+            yield self.base.get_row(index)
+
+    def base_row(self, row: str) -> str:
+        """
+        Number of a row of the view in the original file
+
+        Arguments:
+            row (str): index of the row in the view
+
+        Returns:
+            (str): index of the row in the original file
+        """
+        return str(self.indexes[int(row)])
+
+    def set_cell(self, col: str, row: str, content: str) -> str:
+        # edit the original file, so that it knows about the change
+        try:
+            base_row: str = self.base_row(row)
+        except (ValueError, IndexError):
+            return error_message("It's not possible to set that cell")
+
+        return self.base.set_cell(col, base_row, content)
+
+    def switch_row(self, row1: str, row2: str) -> str:
+        try:
+            base_row1: str = self.base_row(row1)
+            base_row2: str = self.base_row(row2)
+        except IndexError:
+            return error_message(
+                f"At least one of «row {row1}» and «row {row2} do not exist!"
+            )
+
+        return self.base.switch_row(base_row1, base_row2)
+
+    def column_stats(self, index: int) -> ColumnStats:
+        # the matching rows change with every filter, so nothing is cached
+        return ColumnStats.from_values(self.columns[index])
+
+    def undo(self) -> str:
+        # only the edits that keep the rows in place can be undone here
+        edit = self.base.next_edit(undo=True)
+        if edit is not None and edit.kind not in {"set", "switch_row"}:
+            return self.filtered()
+        return self.base.undo()
+
+    def redo(self) -> str:
+        edit = self.base.next_edit(undo=False)
+        if edit is not None and edit.kind not in {"set", "switch_row"}:
+            return self.filtered()
+        return self.base.redo()
+
+    def filtered(self) -> str:
+        """Error message for the operations that need the whole file"""
+        return error_message(
+            "Not possible while a filter is active, clear it with «where»"
+        )
+
+    def save(self, new_path: str = "") -> str:
+        # never overwrite the original file with a subset of its rows
+        if not new_path or self.is_base_path(new_path):
+            return error_message("Save the filtered rows to a new «path»")
+        return super().save(new_path)
+
+    def is_base_path(self, path: str) -> bool:
+        """
+        Know if a path points at the original file
+
+        Arguments:
+            path (str): path where the rows would be saved
+
+        Returns:
+            (bool): it is the path of the original file
+        """
+        source: str = self.base.path
+        if not source:
+            return False
+        if os.path.exists(path) and os.path.exists(source):
+            return os.path.samefile(path, source)
+        return os.path.abspath(path) == os.path.abspath(source)
+
+    def add(self, row: List[str]) -> None:
+        raise TypeError("rows can't be added through a view")
+
+    def delete_column(self, column: str) -> str:
+        return self.filtered()
+
+    def delete_row(self, row: str) -> str:
+        return self.filtered()
+
+    def switch_column(self, col1: str, col2: str) -> str:
+        return self.filtered()
+
+    def sort(self, keys: List[SortKey], memory: int = 0) -> str:
+        return self.filtered()
+
+    def find_cells(self, text: str, use_index: bool = True) -> List[Tuple[int, int]]:
+        # search the original file, then keep the matching rows
+        positions: Dict[int, int] = {row: i for i, row in enumerate(self.indexes)}
+        return sorted(
+            (positions[row], col)
+            for row, col in self.base.find_cells(text, use_index)
+            if row in positions
+        )
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class Edit:
+    """
+    A change made to a CSV file, with just enough data to revert it
+    (and to make it again):
+
+    | kind          | first  | second | old                   | new       |
+    | set           | column | row    | previous value        | new value |
+    | delete_row    | row    |        | values of the row     |           |
+    | delete_column | column |        | (name, column values) |           |
+    | switch_row    | row 1  | row 2  |                       |           |
+    | switch_column | col 1  | col 2  |                       |           |
+    | sort          |        |        |                       | new order |
+    | add           |        |        |                       | the row   |
+    """
+
+    kind: str
+    first: int = 0
+    second: int = 0
+    old: Any = None
+    new: Any = None
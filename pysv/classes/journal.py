@@ -0,0 +1,126 @@
+import json
+import os
+from typing import IO, Iterator, Optional
+
+
+class Journal:
+    """
+    Append-only sidecar file with the edits made to a CSV file that were
+    not saved yet (one JSON object per line).
+
+    The first line identifies the version of the CSV file the edits apply
+    to (its size and modification time when it was loaded, or last saved),
+    so that the edits are only replayed on the same file. Every edit is flushed as soon as it is
+    made, so a session that dies loses nothing.
+    """
+
+    def __init__(self, source: str) -> None:
+        self.source: str = source  # path of the csv file
+        self.path: str = journal_path(source)
+        self._file: Optional[IO[str]] = None
+        # version of the csv file the edits are made on (the journal is
+        # created once the file is loaded)
+        self.version: dict = self.identity()
+
+    def identity(self) -> dict:
+        """
+        Identity of the current version of the csv file
+
+        Returns:
+            (dict): {"size": «bytes», "mtime": «nanoseconds»}
+        """
+        stat: os.stat_result = os.stat(self.source)
+        return {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+    def exists(self) -> bool:
+        """Know if there are journaled edits"""
+        return os.path.exists(self.path)
+
+    def matches(self) -> bool:
+        """
+        Know if the journaled edits were made on the current version of
+        the csv file
+
+        Returns:
+            (bool): the journal's header matches the csv file
+        """
+        try:
+            with open(self.path, "r") as f:
+                return json.loads(f.readline()) == self.identity()
+        except (OSError, ValueError):
+            return False
+
+    def entries(self) -> Iterator[dict]:
+        """
+        Read the journaled edits, in order. A line that was cut short
+        (the session died while writing it) ends the journal.
+
+        Returns:
+            (Iterator[dict]): the edits
+        """
+        with open(self.path, "r") as f:
+            f.readline()
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    return
+
+    def write(self, entry: dict) -> None:
+        """
+        Append an edit to the journal (creating it if needed)
+
+        Arguments:
+            entry (dict): the edit
+        """
+        if self._file is None:
+            new: bool = not self.exists()
+            self._file = open(self.path, "a")
+            if new:
+                self._file.write(json.dumps(self.version) + "\n")
+
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the journal file (the edits stay in it)"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def clear(self) -> None:
+        """
+        Forget every journaled edit (they are saved or discarded), the
+        next edits are made on the current version of the csv file
+        """
+        self.close()
+        if self.exists():
+            os.remove(self.path)
+        self.version = self.identity()
+
+    def set_aside(self) -> str:
+        """
+        Keep a journal that doesn't match the csv file anymore under
+        another name, so that a new journal can be started
+
+        Returns:
+            (str): new path of the old journal
+        """
+        self.close()
+        old_path: str = self.path + ".old"
+        os.replace(self.path, old_path)
+        return old_path
+
+
+def journal_path(source: str) -> str:
+    """
+    Path of the journal of a csv file (/dir/file.csv -> /dir/.file.csv.journal)
+
+    Arguments:
+        source (str): path of the csv file
+
+    Returns:
+        (str): path of the journal
+    """
+    directory, name = os.path.split(os.path.abspath(source))
+    return os.path.join(directory, f".{name}.journal")
@@ -0,0 +1,316 @@
+import csv
+import io
+import mmap
+import os
+import sys
+from array import array
+from locale import getpreferredencoding
+from typing import Dict, Iterator, List, Optional, Type
+from pysv.classes.csv_file import CSVFile
+from pysv.classes.sort_key import SortKey
+from pysv.functions.parse import parse_file, record_end
+from pysv.functions.sort import external_sort
+from pysv.creators.create_typed_column import make_typed_column
+
+
+class LazyCSVFile(CSVFile):
+    """
+    CSV File that is parsed on demand.
+
+    The file is memory-mapped and only a compact index with the offset of
+    every row is built (as far as it is needed). Rows are parsed when they
+    are first read. Any operation that needs whole columns (editing,
+    deleting, switching, peeking a column) loads the full file into the
+    usual column oriented storage first.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        dialect: Type[csv.Dialect] = csv.excel,
+        encoding: Optional[str] = None,
+        infer_types: bool = False,
+        workers: int = 1,
+    ) -> None:
+        self.encoding: str = encoding or getpreferredencoding(False)
+        # use typed storage once the file is loaded
+        self.infer_types: bool = infer_types
+        # processes used to load the whole file (0 -> one per cpu)
+        self.workers: int = workers
+        self.dialect: Type[csv.Dialect] = dialect
+        self._quote: bytes = (dialect.quotechar or '"').encode(self.encoding)
+
+        # column storage, only filled once the file is fully loaded
+        self._columns: Optional[List[List[str]]] = None
+        self._mmap: Optional[mmap.mmap] = None
+
+        header: List[str] = self.open_source(path)
+        super().__init__(header=header, columns=None, path=path, dialect=dialect)
+
+    def open_source(self, source: str, temporary: bool = False) -> List[str]:
+        """
+        Map a file into memory and read its header. The rows are read
+        from this file from now on (self.path, where the file is saved
+        by default, does not change)
+
+        Arguments:
+            source (str): path of the csv file that holds the rows
+            temporary (bool): delete the file once it is not needed
+
+        Returns:
+            (List[str]): header of the file
+        """
+        self.close()
+
+        self._source: str = source
+        self._temporary: bool = temporary
+        self._file = open(source, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # offsets where every row starts (8 bytes per row)
+        self._offsets: array = array("Q")
+        # parsed rows that have already been viewed
+        self._cache: Dict[int, List[str]] = {}
+
+        # the header is the first record of the file
+        header_end: int = record_end(self._mmap, 0, self._quote)
+        header: List[str] = self._parse(0, header_end)
+
+        # the index is extended from here on demand
+        self._scan_pos: int = header_end
+        self._indexed: bool = False
+
+        return header
+
+    @property
+    def columns(self) -> List[List[str]]:
+        """Column storage (loads the whole file on first access)"""
+        if self._columns is None:
+            self.materialize()
+        return self._columns
+
+    @columns.setter
+    def columns(self, value: Optional[List[List[str]]]) -> None:
+        self._columns = value
+
+    def is_lazy(self) -> bool:
+        """
+        Know if the file is still being read on demand
+
+        Returns:
+            (bool): True while the rows have not been fully loaded
+        """
+        return self._columns is None
+
+    def memory_usage(self) -> int:
+        if not self.is_lazy():
+            return super().memory_usage()
+
+        # the mapped file is not counted (the system can drop its pages)
+        cached: int = sum(
+            sys.getsizeof(value) for row in self._cache.values() for value in row
+        )
+        return self._offsets.itemsize * len(self._offsets) + cached
+
+    def _index_to(self, index: int) -> None:
+        """
+        Extend the offsets index until it covers the given row
+        (a negative index indexes the whole file)
+
+        Arguments:
+            index (int): index of the row that should be reachable
+        """
+        size: int = len(self._mmap)
+        while not self._indexed and (index < 0 or len(self._offsets) <= index):
+            if self._scan_pos >= size:
+                self._indexed = True
+                break
+
+            self._offsets.append(self._scan_pos)
+            self._scan_pos = record_end(self._mmap, self._scan_pos, self._quote)
+
+    def _parse(self, start: int, end: int) -> List[str]:
+        """
+        Parse the record stored between two offsets
+
+        Arguments:
+            start (int): offset of the start of the record
+            end (int): offset of the end of the record
+
+        Returns:
+            (List[str]): values of the record
+        """
+        text: str = self._mmap[start:end].decode(self.encoding)
+        return next(csv.reader(io.StringIO(text, newline=""), self.dialect), [])
+
+    def _pad(self, row: List[str]) -> List[str]:
+        """
+        Give a parsed row the same width as the header (the values past
+        the header are dropped and wide_rows is set)
+        """
+        width: int = len(self.header)
+        if len(row) == width:
+            return row
+        if len(row) > width:
+            self.wide_rows = True
+        return (row + [""] * width)[:width]
+
+    def is_loaded(self) -> bool:
+        if not self.is_lazy():
+            return super().is_loaded()
+
+        # only the first row is needed (counting them indexes the file)
+        self._index_to(0)
+        return bool(self.header and self._offsets)
+
+    def row_count(self) -> int:
+        if not self.is_lazy():
+            return super().row_count()
+
+        self._index_to(-1)
+        return len(self._offsets)
+
+    def count_rows_until(self, stop: int) -> int:
+        if not self.is_lazy():
+            return super().count_rows_until(stop)
+        if stop <= 0:
+            return 0
+
+        self._index_to(stop - 1)
+        return min(len(self._offsets), stop)
+
+    def known_row_count(self) -> Optional[int]:
+        if not self.is_lazy():
+            return super().known_row_count()
+
+        return len(self._offsets) if self._indexed else None
+
+    def get_row(self, index: int) -> List[str]:
+        if not self.is_lazy():
+            return super().get_row(index)
+
+        if index < 0:
+            index += self.row_count()
+        if index < 0:
+            raise IndexError(index)
+
+        if index not in self._cache:
+            self._index_to(index)
+
+            # the row is past the end of the file
+            if index >= len(self._offsets):
+                raise IndexError(index)
+
+            start: int = self._offsets[index]
+            if index + 1 < len(self._offsets):
+                end: int = self._offsets[index + 1]
+            else:
+                end: int = record_end(self._mmap, start, self._quote)
+
+            self._cache[index] = self._pad(self._parse(start, end))
+
+        return self._cache[index]
+
+    def get_value(self, col_index: int, row_index: int) -> str:
+        if not self.is_lazy():
+            return super().get_value(col_index, row_index)
+
+        return self.get_row(row_index)[col_index]
+
+    def iter_rows(self) -> Iterator[List[str]]:
+        if not self.is_lazy():
+            yield from super().iter_rows()
+            return
+
+        # stream the rows with the C parser, without caching them
+        with open(self._source, "r", encoding=self.encoding, newline="") as f:
+            data = csv.reader(f, self.dialect)
+            next(data, None)
+            for row in data:
+                yield self._pad(row)
+
+    def materialize(self) -> None:
+        """
+        Load every row into the column oriented storage and release the
+        memory map (the file then behaves like a regular CSVFile)
+        """
+        if not self.is_lazy():
+            return
+
+        if self.workers == 1:
+            columns: List[List[str]] = CSVFile.from_rows(
+                self.header, self.iter_rows()
+            ).columns
+        else:
+            _, columns, wide = parse_file(
+                self._source, self.dialect, self.encoding, self.workers
+            )
+            self.wide_rows = self.wide_rows or wide
+        if self.infer_types:
+            columns = [make_typed_column(col) for col in columns]
+
+        self._columns = columns
+        self.close()
+
+    def sort_rows(
+        self, keys: List[SortKey], positions: List[int], memory: int
+    ) -> bool:
+        """
+        Sort the rows. Files bigger than the memory budget are sorted on
+        disk (external merge sort) into a temporary file that then backs
+        this file, the others are loaded and sorted in memory.
+
+        Arguments:
+            keys (List[SortKey]): columns to sort by, most significant first
+            positions (List[int]): position of the column of every key
+            memory (int): memory budget in bytes (0 -> always in memory)
+
+        Returns:
+            (bool): the sort can be undone (only the sorts in memory)
+        """
+        if not self.is_lazy() or not memory or len(self._mmap) <= memory:
+            return super().sort_rows(keys, positions, memory)
+
+        sorted_path: str = external_sort(
+            self.header,
+            self.iter_rows(),
+            keys,
+            positions,
+            memory,
+            self.dialect,
+            os.path.dirname(os.path.abspath(self.path)),
+        )
+        self.open_source(sorted_path, temporary=True)
+
+        # the sorted rows only exist in a temporary file: they are unsaved
+        # edits (and the journal sorts the source again when replayed)
+        self._redo.clear()
+        self.dirty = True
+        if self.journal is not None:
+            self.journal.write(
+                {
+                    "op": "sort_by",
+                    "first": 0,
+                    "second": 0,
+                    "keys": [
+                        [position, key.descending, key.numeric]
+                        for key, position in zip(keys, positions)
+                    ],
+                }
+            )
+        return False
+
+    def close(self) -> None:
+        """Release the memory map and the lazy index"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+            self._mmap = None
+
+            # files made by pysv (sorted copies) are not needed anymore
+            if self._temporary:
+                os.remove(self._source)
+
+        self._offsets = array("Q")
+        self._cache = {}
+        self._indexed = True
@@ -0,0 +1,127 @@
+import threading
+import time
+from typing import Callable, Iterator, List, Optional, Tuple
+from pysv.classes.csv_file import CSVFile
+from pysv.creators.create_typed_column import make_typed_column
+
+# bytes in a mebibyte (to show the progress)
+MIB: int = 1024 * 1024
+
+
+class Loader:
+    """
+    Reads the rows of a CSV file into a CSVFile, a chunk at a time, either
+    right away (run) or on a background thread (start).
+
+    The file can be read while it is loading: every column of a chunk is
+    extended before the first one, and the number of rows is the length of
+    the first column, so only complete rows are ever seen. The values past
+    the header (a chunk with more columns than the file) are dropped and
+    the file's wide_rows is set.
+    """
+
+    def __init__(
+        self,
+        file: CSVFile,
+        chunks: Iterator[Tuple[int, List[List[str]]]],
+        size: int,
+        infer_types: bool = False,
+        on_done: Optional[Callable[[CSVFile], None]] = None,
+    ) -> None:
+        self.file: CSVFile = file
+        self.size: int = size  # bytes in the file
+        self.read: int = 0  # bytes read so far
+        self.infer_types: bool = infer_types
+        # called with the file once every row is read (not if cancelled)
+        self.on_done: Optional[Callable[[CSVFile], None]] = on_done
+        self.error: Optional[Exception] = None
+
+        self.started: float = time.monotonic()
+        self.finished: Optional[float] = None
+
+        # (offset where the chunk ends, columns of the chunk)
+        self._chunks: Iterator[Tuple[int, List[List[str]]]] = chunks
+        self._cancel: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run(self) -> CSVFile:
+        """
+        Read every remaining row (stops early if the load is cancelled)
+
+        Returns:
+            (CSVFile): the loaded file
+        """
+        try:
+            for offset, chunk in self._chunks:
+                if self._cancel.is_set():
+                    break
+
+                if len(chunk) > len(self.file.columns):
+                    self.file.wide_rows = True
+
+                # the first column (row count) grows last
+                for column, part in reversed(list(zip(self.file.columns, chunk))):
+                    column.extend(part)
+                self.read = offset
+
+            else:
+                self.read = self.size
+                if self.infer_types:
+                    self.file.columns = [
+                        make_typed_column(col) for col in self.file.columns
+                    ]
+                if self.on_done is not None:
+                    self.on_done(self.file)
+
+        finally:
+            # release the file (and the workers of a parallel parse)
+            close = getattr(self._chunks, "close", None)
+            if close is not None:
+                close()
+            self.finished = time.monotonic()
+
+        return self.file
+
+    def start(self) -> None:
+        """Read the rows on a background thread"""
+
+        def work() -> None:
+            try:
+                self.run()
+            except Exception as e:
+                self.error = e
+
+        self._thread = threading.Thread(target=work, daemon=True)
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """Stop reading rows (waits for the chunk being read)"""
+        self._cancel.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def is_running(self) -> bool:
+        """Know if the rows are still being read"""
+        return self.finished is None
+
+    def is_cancelled(self) -> bool:
+        """Know if the load was cancelled"""
+        return self._cancel.is_set()
+
+    def elapsed(self) -> float:
+        """Seconds spent loading so far"""
+        return (self.finished or time.monotonic()) - self.started
+
+    def progress(self) -> str:
+        """
+        Describe how far the load is
+
+        Returns:
+            (str): «read»/«size» MiB («%»), «rows» rows, «speed» MiB/s
+        """
+        speed: float = self.read / MIB / max(self.elapsed(), 1e-6)
+        percent: float = 100 * self.read / self.size if self.size else 100
+        return (
+            f"{self.read / MIB:.1f}/{self.size / MIB:.1f} MiB ({percent:.0f}%), "
+            f"{self.file.row_count()} rows, {speed:.1f} MiB/s"
+        )
@@ -0,0 +1,33 @@
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, Tuple
+
+
+class PrefixIndex:
+    """
+    Names sorted by their lowercased form, so that the names that start
+    with a prefix (whatever its case) are found with a binary search
+    instead of a scan of every name.
+    """
+
+    def __init__(self, names: Iterable[str]) -> None:
+        # (lowercased name, name), sorted
+        self.names: List[Tuple[str, str]] = sorted(
+            (name.lower(), name) for name in set(names)
+        )
+        self.keys: List[str] = [key for key, _ in self.names]
+
+    def complete(self, prefix: str) -> Iterator[str]:
+        """
+        Names that start with a prefix, ignoring the case
+
+        Arguments:
+            prefix (str): start of the name
+
+        Returns:
+            (Iterator[str]): the names, in alphabetical order
+        """
+        key: str = prefix.lower()
+        for position in range(bisect_left(self.keys, key), len(self.keys)):
+            if not self.keys[position].startswith(key):
+                return
+            yield self.names[position][1]
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pysv.classes.named_files import NamedFiles
 from pysv.classes.color import Colors
 from pysv.defaults import (
@@ -6,13 +6,40 @@ from pysv.defaults import (
     DEFAULT_HELP_KEY,
     DEFAULT_LIST_KEY,
     DEFAULT_COLOR_SCM,
+    DEFAULT_LAZY_SIZE,
+    DEFAULT_HTML_PAGE_SIZE,
+    DEFAULT_SORT_MEMORY,
+    DEFAULT_INFER_TYPES,
+    DEFAULT_JOURNAL,
+    DEFAULT_PARALLEL_SIZE,
+    DEFAULT_PARSE_WORKERS,
+    DEFAULT_CACHE,
+    DEFAULT_CACHE_DIR,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_WORKSPACE_MEMORY,
+    DEFAULT_JOIN_MEMORY,
+    DEFAULT_FIND_INDEX,
 )
 
 
 @dataclass
 class Settings:
-    named_files: NamedFiles = NamedFiles()
-    color_scheme: Colors = DEFAULT_COLOR_SCM
+    named_files: NamedFiles = field(default_factory=NamedFiles)
+    color_scheme: Colors = field(default_factory=lambda: DEFAULT_COLOR_SCM)
     clear_key: str = DEFAULT_CL_S_KEY
     list_key: str = DEFAULT_LIST_KEY
     help_key: str = DEFAULT_HELP_KEY
+    lazy_size: int = DEFAULT_LAZY_SIZE  # bytes from which files load lazily
+    html_page_size: int = DEFAULT_HTML_PAGE_SIZE  # rows per html table page
+    sort_memory: int = DEFAULT_SORT_MEMORY  # bytes a sort can keep in memory
+    infer_types: bool = DEFAULT_INFER_TYPES  # typed storage for typed columns
+    journal: bool = DEFAULT_JOURNAL  # journal the unsaved edits
+    parallel_size: int = DEFAULT_PARALLEL_SIZE  # bytes from which parsing is parallel
+    parse_workers: int = DEFAULT_PARSE_WORKERS  # processes used to parse
+    cache: bool = DEFAULT_CACHE  # cache the parsed files
+    cache_dir: str = DEFAULT_CACHE_DIR  # directory of the cached files
+    cache_size: int = DEFAULT_CACHE_SIZE  # bytes the cached files can take
+    # bytes the open files can take
+    workspace_memory: int = DEFAULT_WORKSPACE_MEMORY
+    join_memory: int = DEFAULT_JOIN_MEMORY  # bytes the hash table of a join can take
+    find_index: bool = DEFAULT_FIND_INDEX  # index the values for «find»
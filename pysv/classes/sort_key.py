@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class SortKey:
+    """A column to sort by and how its values are ordered"""
+
+    column: str  # name of the column
+    descending: bool = False  # largest values first
+    numeric: bool = False  # compare the values as numbers instead of text
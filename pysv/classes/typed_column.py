@@ -0,0 +1,184 @@
+from array import array
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Iterator, List, MutableSequence, Optional, Union
+
+
+@dataclass(frozen=True)
+class ColumnType:
+    """How the values of a typed column are stored"""
+
+    name: str  # int | float | bool | date
+    typecode: str  # array typecode of the stored values
+    parse: Callable[[str], Any]  # text -> stored value (ValueError if lossy)
+    format: Callable[[Any], str]  # stored value -> the exact original text
+
+
+def parse_int(text: str) -> int:
+    """Read an integer that is written exactly as python writes it"""
+    value: int = int(text)
+    if str(value) != text:
+        raise ValueError(text)
+    return value
+
+
+def parse_float(text: str) -> float:
+    """Read a float that is written exactly as python writes it"""
+    value: float = float(text)
+    if repr(value) != text:
+        raise ValueError(text)
+    return value
+
+
+def parse_date(text: str) -> int:
+    """Read an ISO date (YYYY-MM-DD) as its ordinal"""
+    value: date = date.fromisoformat(text)
+    if value.isoformat() != text:
+        raise ValueError(text)
+    return value.toordinal()
+
+
+def format_date(ordinal: int) -> str:
+    """Write the ordinal of a date as an ISO date (YYYY-MM-DD)"""
+    return date.fromordinal(ordinal).isoformat()
+
+
+INT: ColumnType = ColumnType("int", "q", parse_int, str)
+FLOAT: ColumnType = ColumnType("float", "d", parse_float, repr)
+DATE: ColumnType = ColumnType("date", "i", parse_date, format_date)
+
+# the ways a boolean column can be written (false, true)
+BOOL_SPELLINGS: List[tuple] = [
+    ("false", "true"),
+    ("False", "True"),
+    ("FALSE", "TRUE"),
+]
+
+
+def bool_type(false: str, true: str) -> ColumnType:
+    """
+    Create the type of a boolean column written with the given spelling
+
+    Arguments:
+        false (str): how false is written
+        true (str): how true is written
+
+    Returns:
+        (ColumnType): bool column type
+    """
+    values: dict = {false: 0, true: 1}
+
+    def parse_bool(text: str) -> int:
+        try:
+            return values[text]
+        except KeyError:
+            raise ValueError(text)
+
+    return ColumnType("bool", "b", parse_bool, (false, true).__getitem__)
+
+
+class TypedColumn(MutableSequence):
+    """
+    Column whose values all have the same type (int, float, bool or date),
+    stored in a compact array instead of a list of strings.
+
+    It reads and writes text like any other column: values are parsed
+    when they are set and formatted back (exactly as they were written)
+    when they are read. Empty cells are kept in a separate mask. Setting a
+    value that is not of the column's type raises a ValueError.
+    """
+
+    def __init__(
+        self, kind: ColumnType, values: array, nulls: Optional[bytearray] = None
+    ) -> None:
+        self.kind: ColumnType = kind
+        self.values: array = values
+        # 1 for every empty cell (None while there are no empty cells)
+        self.nulls: Optional[bytearray] = nulls
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if self.nulls is not None and self.nulls[index]:
+            return ""
+        return self.kind.format(self.values[index])
+
+    def parse(self, text: str) -> Any:
+        """
+        Convert a text into the value that is stored
+
+        Arguments:
+            text (str): text of the cell
+
+        Returns:
+            (Any): stored value
+
+        Raises:
+            ValueError: the text is not of the column's type
+        """
+        if text == "":
+            return 0
+        try:
+            value: Any = self.kind.parse(text)
+            # make sure the value fits in the array
+            array(self.kind.typecode, [value])
+        except (TypeError, OverflowError):
+            raise ValueError(text)
+        return value
+
+    def mark_null(self, index: int, text: str) -> None:
+        """Update the empty cells mask for a value that was just set"""
+        if text == "" and self.nulls is None:
+            self.nulls = bytearray(len(self.values))
+        if self.nulls is not None:
+            self.nulls[index] = text == ""
+
+    def __setitem__(self, index: int, text: str) -> None:
+        self.values[index] = self.parse(text)
+        self.mark_null(index, text)
+
+    def __delitem__(self, index: int) -> None:
+        del self.values[index]
+        if self.nulls is not None:
+            del self.nulls[index]
+
+    def insert(self, index: int, text: str) -> None:
+        value: Any = self.parse(text)
+
+        # same clamping as list.insert
+        length: int = len(self.values)
+        index = min(max(index if index >= 0 else length + index, 0), length)
+
+        self.values.insert(index, value)
+        if self.nulls is not None:
+            self.nulls.insert(index, 0)
+        self.mark_null(index, text)
+
+    def __iter__(self) -> Iterator[str]:
+        if self.nulls is None:
+            return map(self.kind.format, self.values)
+        return (
+            "" if null else self.kind.format(value)
+            for value, null in zip(self.values, self.nulls)
+        )
+
+    def take(self, order: List[int]) -> "TypedColumn":
+        """
+        Create a column with the values in the given order
+
+        Arguments:
+            order (List[int]): index of the value for every position
+
+        Returns:
+            (TypedColumn): reordered column of the same type
+        """
+        values: array = array(
+            self.kind.typecode, map(self.values.__getitem__, order)
+        )
+        nulls: Optional[bytearray] = None
+        if self.nulls is not None:
+            nulls = bytearray(map(self.nulls.__getitem__, order))
+        return TypedColumn(self.kind, values, nulls)
@@ -0,0 +1,264 @@
+import re
+import sys
+from array import array
+from bisect import bisect_left, insort
+from itertools import islice
+from typing import Callable, Dict, List, Sequence, Set, Tuple, Union
+
+# words of a value (what «find» looks for)
+WORD_RE = re.compile(r"\w+")
+
+# rows of a key: a single row (most keys of a column are unique) or many
+Posting = Union[int, array]
+
+
+def value_keys(value: str) -> Set[str]:
+    """
+    Keys a value is indexed under: the whole value and every word in it,
+    lowercased («New York» -> new york, new, york)
+
+    Arguments:
+        value (str): content of the cell
+
+    Returns:
+        (Set[str]): the keys
+    """
+    lowered: str = value.strip().lower()
+    keys: Set[str] = set(WORD_RE.findall(lowered))
+    if lowered:
+        keys.add(lowered)
+    return keys
+
+
+def cell_matches(value: str, text: str) -> bool:
+    """
+    Know if a cell contains a text: the whole value or a sequence of its
+    words (the case and the punctuation between the words are ignored)
+
+    Arguments:
+        value (str): content of the cell
+        text (str): text that is looked for
+
+    Returns:
+        (bool): the cell contains the text
+    """
+    lowered: str = value.strip().lower()
+    key: str = text.strip().lower()
+    if lowered == key:
+        return True
+
+    phrase: List[str] = WORD_RE.findall(key)
+    if not phrase:
+        return False
+
+    words: List[str] = WORD_RE.findall(lowered)
+    size: int = len(phrase)
+    return any(words[i : i + size] == phrase for i in range(len(words) - size + 1))
+
+
+def add_row(postings: Dict[str, Posting], key: str, row: int) -> None:
+    """Add a row to the posting of a key"""
+    found = postings.get(key)
+    if found is None:
+        postings[key] = row
+    elif isinstance(found, int):
+        postings[key] = array("q", [found, row])
+    else:
+        found.append(row)
+
+
+def remove_row(postings: Dict[str, Posting], key: str, row: int) -> None:
+    """Remove a row from the posting of a key"""
+    found = postings.get(key)
+    if found is None:
+        return
+    if isinstance(found, int):
+        if found == row:
+            del postings[key]
+    elif row in found:
+        found.remove(row)
+        if not found:
+            del postings[key]
+
+
+def posting_rows(found: Posting) -> Sequence[int]:
+    """Rows of a posting"""
+    return (found,) if isinstance(found, int) else found
+
+
+def index_column(column: Sequence[str]) -> Dict[str, Posting]:
+    """
+    Build the postings of a column: every distinct value is split into
+    words once, then its rows are added to the posting of every word
+
+    Arguments:
+        column (Sequence[str]): values of the column
+
+    Returns:
+        (Dict[str, Posting]): key -> rows that have it
+    """
+    values: Dict[str, Posting] = {}
+    for row, value in enumerate(column):
+        add_row(values, value, row)
+
+    postings: Dict[str, Posting] = {}
+    for value, found in values.items():
+        for key in value_keys(value):
+            if key not in postings:
+                # postings are never shared (they are updated in place)
+                postings[key] = found if isinstance(found, int) else array("q", found)
+                continue
+            for row in posting_rows(found):
+                add_row(postings, key, row)
+
+    return postings
+
+
+class ValueIndex:
+    """
+    Inverted index of the values of a CSV file: every value and every
+    word in it (lowercased) -> the rows of every column that have it.
+
+    Rows keep the number they had when the index was built. Deleted rows
+    are remembered apart and the other rows are numbered again when they
+    are looked up, so deleting a row doesn't touch the postings.
+    """
+
+    def __init__(self, columns: Sequence[Sequence[str]]) -> None:
+        # one dict of postings for every column
+        self.columns: List[Dict[str, Posting]] = [
+            index_column(column) for column in columns
+        ]
+        # numbers (when the index was built) of the deleted rows, sorted
+        self.removed: List[int] = []
+        self._removed: Set[int] = set()
+
+    def original(self, row: int) -> int:
+        """
+        Number a row had when the index was built
+
+        Arguments:
+            row (int): current index of the row
+
+        Returns:
+            (int): number of the row in the postings
+        """
+        for removed in self.removed:
+            if removed > row:
+                break
+            row += 1
+        return row
+
+    def current(self, row: int) -> int:
+        """Current index of a row of the postings (that was not deleted)"""
+        return row - bisect_left(self.removed, row)
+
+    def set_value(self, col: int, row: int, old: str, new: str) -> None:
+        """
+        Follow the change of a cell
+
+        Arguments:
+            col (int): position of the column
+            row (int): current index of the row
+            old (str): previous value of the cell
+            new (str): new value of the cell
+        """
+        postings: Dict[str, Posting] = self.columns[col]
+        row = self.original(row)
+        old_keys: Set[str] = value_keys(old)
+        new_keys: Set[str] = value_keys(new)
+
+        for key in old_keys - new_keys:
+            remove_row(postings, key, row)
+        for key in new_keys - old_keys:
+            add_row(postings, key, row)
+
+    def memory_usage(self, sample: int) -> int:
+        """
+        Estimate the memory taken by the index (the size of the keys and
+        postings of a column is measured on a sample of them)
+
+        Arguments:
+            sample (int): keys measured in every column
+
+        Returns:
+            (int): bytes
+        """
+        total: int = sys.getsizeof(self.removed) + sys.getsizeof(self._removed)
+        for postings in self.columns:
+            total += sys.getsizeof(postings)
+            if not postings:
+                continue
+
+            step: int = max(1, len(postings) // sample)
+            measured: List[Tuple[str, Posting]] = list(
+                islice(postings.items(), 0, None, step)
+            )
+            size: int = sum(
+                sys.getsizeof(key) + sys.getsizeof(found) for key, found in measured
+            )
+            total += size * len(postings) // len(measured)
+
+        return total
+
+    def remove_row(self, row: int) -> None:
+        """Follow the deletion of a row (given its current index)"""
+        row = self.original(row)
+        insort(self.removed, row)
+        self._removed.add(row)
+
+    def remove_column(self, col: int) -> None:
+        """Follow the deletion of a column"""
+        del self.columns[col]
+
+    def swap_columns(self, col1: int, col2: int) -> None:
+        """Follow the switch of two columns"""
+        self.columns[col1], self.columns[col2] = self.columns[col2], self.columns[col1]
+
+    def find(
+        self, text: str, value: Callable[[int, int], str]
+    ) -> List[Tuple[int, int]]:
+        """
+        Find the cells that contain a text (see cell_matches)
+
+        Arguments:
+            text (str): text that is looked for
+            value (Callable[[int, int], str]): (column, row) -> content of
+                the cell, to check the cells that only have every word
+
+        Returns:
+            (List[Tuple[int, int]]): current row and column of every cell,
+                by row then column
+        """
+        key: str = text.strip().lower()
+        phrase: List[str] = WORD_RE.findall(key)
+        # a single word (or a whole value) needs no check
+        exact: bool = len(phrase) <= 1 and (not phrase or phrase[0] == key)
+
+        cells: List[Tuple[int, int]] = []
+        for col, postings in enumerate(self.columns):
+            rows: Set[int] = set()
+            if key in postings:
+                rows.update(posting_rows(postings[key]))
+
+            if phrase and not exact:
+                # cells that have every word of the phrase (the rarest first)
+                found: List[Posting] = [postings.get(word) for word in phrase]
+                if all(posting is not None for posting in found):
+                    parts: List[Sequence[int]] = sorted(
+                        (posting_rows(posting) for posting in found), key=len
+                    )
+                    common: Set[int] = set(parts[0])
+                    for part in parts[1:]:
+                        common.intersection_update(part)
+                    rows.update(common)
+
+            for row in rows:
+                if row in self._removed:
+                    continue
+                current: int = self.current(row)
+                if exact or cell_matches(value(col, current), text):
+                    cells.append((current, col))
+
+        cells.sort()
+        return cells
@@ -0,0 +1,193 @@
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from pysv.classes.csv_file import CSVFile
+from pysv.classes.csv_view import CSVView
+
+# bytes in a mebibyte (to list the files)
+MIB: int = 1024 * 1024
+
+
+def workspace_key(path: str) -> str:
+    """
+    Name under which a file is kept in the workspace
+
+    Arguments:
+        path (str): path of the csv file
+
+    Returns:
+        (str): absolute path of the file
+    """
+    return os.path.abspath(path)
+
+
+def base_file(file: CSVFile) -> CSVFile:
+    """The file shown by a filter (or the file itself)"""
+    return file.base if isinstance(file, CSVView) else file
+
+
+def release(file: CSVFile) -> None:
+    """Free what a file keeps open (its journal and its memory map)"""
+    base: CSVFile = base_file(file)
+    if base.journal is not None:
+        base.journal.close()
+    close = getattr(base, "close", None)
+    if close is not None:
+        close()
+
+
+class Workspace:
+    """
+    Loaded files that are kept in memory, so that switching between them
+    doesn't read them again.
+
+    The files are ordered from the least to the most recently used (the
+    current file). Once they take more memory than the budget the least
+    recently used files are closed, except the ones with unsaved edits
+    and the current file.
+    """
+
+    def __init__(self, memory: int) -> None:
+        self.memory: int = memory  # bytes the files can take
+        # path of the file -> the file (or the filter that was shown on it)
+        self.files: "OrderedDict[str, CSVFile]" = OrderedDict()
+
+    def __contains__(self, path: str) -> bool:
+        return workspace_key(path) in self.files
+
+    def get(self, path: str) -> Optional[CSVFile]:
+        """
+        Get an open file, which becomes the most recently used
+
+        Arguments:
+            path (str): path of the csv file
+
+        Returns:
+            (Optional[CSVFile]): the file, None if it isn't open
+        """
+        key: str = workspace_key(path)
+        if key not in self.files:
+            return None
+        self.files.move_to_end(key)
+        return self.files[key]
+
+    def update(self, file: CSVFile) -> None:
+        """
+        Remember how an open file is shown (a filter may have been set or
+        cleared), without changing its place
+
+        Arguments:
+            file (CSVFile): the file or a filter on it
+        """
+        key: str = workspace_key(base_file(file).path)
+        if base_file(file).path and key in self.files:
+            self.files[key] = file
+
+    def add(self, file: CSVFile) -> Tuple[List[str], List[str]]:
+        """
+        Keep a file that was just loaded (as the most recently used) and
+        close files until the workspace fits in the budget again
+
+        Arguments:
+            file (CSVFile): the file
+
+        Returns:
+            (Tuple[List[str], List[str]]): paths of the files that were
+                closed, and of the files over the budget that were kept
+                because they have unsaved edits
+        """
+        if not file.path:
+            return [], []
+
+        key: str = workspace_key(file.path)
+        old: Optional[CSVFile] = self.files.pop(key, None)
+        if old is not None and base_file(old) is not file:
+            release(old)
+
+        self.files[key] = file
+        return self.evict()
+
+    def remove(self, path: str) -> Optional[CSVFile]:
+        """
+        Close an open file
+
+        Arguments:
+            path (str): path of the csv file
+
+        Returns:
+            (Optional[CSVFile]): the file, None if it wasn't open
+        """
+        file: Optional[CSVFile] = self.files.pop(workspace_key(path), None)
+        if file is not None:
+            release(file)
+        return file
+
+    def usage(self) -> Dict[str, int]:
+        """
+        Memory taken by every open file
+
+        Returns:
+            (Dict[str, int]): path -> bytes
+        """
+        return {
+            key: base_file(file).memory_usage() for key, file in self.files.items()
+        }
+
+    def evict(self) -> Tuple[List[str], List[str]]:
+        """
+        Close the least recently used files without unsaved edits until
+        the files fit in the budget (the current file is always kept)
+
+        Returns:
+            (Tuple[List[str], List[str]]): paths of the closed files, and
+                of the files over the budget that have unsaved edits
+        """
+        usage: Dict[str, int] = self.usage()
+        total: int = sum(usage.values())
+        closed: List[str] = []
+        unsaved: List[str] = []
+
+        for key in list(self.files)[:-1]:
+            if total <= self.memory:
+                break
+
+            if base_file(self.files[key]).dirty:
+                unsaved.append(key)
+                continue
+
+            release(self.files.pop(key))
+            total -= usage[key]
+            closed.append(key)
+
+        if total <= self.memory:
+            unsaved = []
+        return closed, unsaved
+
+    def render(self, current: CSVFile) -> str:
+        """
+        List the open files, most recently used first
+
+        Arguments:
+            current (CSVFile): the file that is shown
+
+        Returns:
+            (str): one line per file (path, rows, memory, unsaved edits)
+        """
+        usage: Dict[str, int] = self.usage()
+        lines: List[str] = []
+
+        for key, file in reversed(self.files.items()):
+            base: CSVFile = base_file(file)
+            marker: str = "*" if base is base_file(current) else " "
+            line: str = (
+                f"<ansigreen>{marker} {key}:</ansigreen> "
+                f"{base.row_count()} rows, {usage[key] / MIB:.1f} MiB"
+            )
+            if base.dirty:
+                line += " <ansiyellow>(unsaved edits)</ansiyellow>"
+            lines.append(line)
+
+        lines.append(
+            f"{sum(usage.values()) / MIB:.1f} of {self.memory / MIB:.1f} MiB used"
+        )
+        return "\n".join(lines)
@@ -1,16 +1,219 @@
-from pysv.functions.general import p_print
+from pysv.functions.general import make_dialect, p_print
 from pysv.functions.output import error_message
-from typing import List
+from typing import BinaryIO, Callable, Iterator, List, Optional, Tuple, Type
+from os import cpu_count, path
+from io import TextIOWrapper
+from itertools import islice
+from locale import getpreferredencoding
 import csv
-from pysv.classes.csv_file import CSVFile
+from pysv.classes.csv_file import CSVFile, transpose
+from pysv.classes.lazy_csv_file import LazyCSVFile
+from pysv.classes.loader import Loader
+from pysv.functions.cache import (
+    CACHE_MIN_SIZE,
+    cache_key,
+    evict,
+    read_cache,
+    write_cache,
+)
+from pysv.functions.parse import parse_chunks
 
+# number of characters used to guess the dialect of a file
+SNIFF_SIZE: int = 64 * 1024
 
-def load_csv(file_path: str) -> CSVFile:
+# rows read at once (the loaded rows are usable between two chunks)
+CHUNK_ROWS: int = 10000
+
+
+def sniff_dialect(sample: str) -> Type[csv.Dialect]:
+    """
+    Guess the dialect of a csv file from its first characters
+
+    Only the delimiter, the quote character and the line terminator are
+    guessed, every other option is kept from the excel dialect so that
+    the values are read (and written back) exactly as they are.
+
+    Arguments:
+        sample (str): first characters of the file
+
+    Returns:
+        (Type[csv.Dialect]): dialect of the file
+    """
+    # only sniff complete lines
+    sample = sample[: sample.rfind("\n") + 1] or sample
+
+    try:
+        sniffed = csv.Sniffer().sniff(sample, delimiters=",;\t|")
+        delimiter: str = sniffed.delimiter
+        quotechar: str = sniffed.quotechar or '"'
+    except csv.Error:
+        # not enough data to guess -> excel defaults
+        delimiter: str = ","
+        quotechar: str = '"'
+
+    # keep the line endings of the first line
+    newline: int = sample.find("\n")
+    terminator: str = "\r\n" if newline > 0 and sample[newline - 1] == "\r" else "\n"
+
+    return make_dialect(delimiter, quotechar, terminator)
+
+
+def read_chunks(
+    raw: BinaryIO, rows: Iterator[List[str]], header: List[str]
+) -> Iterator[Tuple[int, List[List[str]]]]:
+    """
+    Read the rows of a csv file a chunk at a time
+
+    Arguments:
+        raw (BinaryIO): the file (closed once every row is read)
+        rows (Iterator[List[str]]): csv reader over the file
+        header (List[str]): header of the file
+
+    Returns:
+        (Iterator[Tuple[int, List[List[str]]]]): offset reached after every
+            chunk and the columns of the chunk (see transpose)
+    """
+    with raw:
+        while True:
+            chunk: List[List[str]] = list(islice(rows, CHUNK_ROWS))
+            if not chunk:
+                return
+            yield raw.tell(), transpose(chunk, len(header))
+
+
+def make_cache_writer(
+    file_path: str, infer_types: bool, cache_dir: str, cache_size: int
+) -> Callable[[CSVFile], None]:
+    """
+    Create the function that stores a file in the cache once it is loaded
+    (the key is taken now, before the file is parsed)
+
+    Arguments:
+        file_path (str): path of the csv file
+        infer_types (bool): the file is loaded with infer_types
+        cache_dir (str): directory of the caches
+        cache_size (int): bytes the caches can take
+
+    Returns:
+        (Callable[[CSVFile], None]): CSVFile -> None
+    """
+    key: dict = cache_key(file_path, infer_types)
+
+    def store(file: CSVFile) -> None:
+        if file.wide_rows:
+            # a reload must warn about the dropped values again
+            return
+        try:
+            write_cache(cache_dir, file, key)
+            evict(cache_dir, cache_size)
+        except OSError:
+            # the cache is only an optimization
+            pass
+
+    return store
+
+
+def make_loader(
+    file_path: str,
+    lazy_size: int = 0,
+    infer_types: bool = False,
+    parallel_size: int = 0,
+    workers: int = 0,
+    cache_dir: str = "",
+    cache_size: int = 0,
+) -> Loader:
+    """
+    Open a CSV file and prepare the reading of its rows (see Loader)
+
+    Arguments:
+        file_path (str): path of the csv file
+        lazy_size (int): files with at least this many bytes are indexed
+            and parsed on demand instead of being read at once (0 -> never)
+        infer_types (bool): store the int, float, bool and date columns in
+            compact arrays (see make_typed_column)
+        parallel_size (int): files with at least this many bytes are
+            parsed on several processes (0 -> never)
+        workers (int): number of processes used to parse (0 -> one per cpu)
+        cache_dir (str): directory where parsed files are cached
+            ("" -> no cache)
+        cache_size (int): bytes the caches can take
+
+    Returns:
+        (Loader): loader of the file, whose header is already read
+
+    Raises:
+        FileNotFoundError: the file does not exist
+    """
+    encoding: str = getpreferredencoding(False)
+    with open(file_path, "r", newline="", encoding=encoding) as f:
+        dialect: Type[csv.Dialect] = sniff_dialect(f.read(SNIFF_SIZE))
+    size: int = path.getsize(file_path)
+    parallel: bool = (
+        bool(parallel_size)
+        and size >= parallel_size
+        and (workers or cpu_count() or 1) > 1
+    )
+
+    if lazy_size and size >= lazy_size:
+        # nothing to read, rows are parsed on demand
+        lazy: LazyCSVFile = LazyCSVFile(
+            file_path,
+            dialect=dialect,
+            encoding=encoding,
+            infer_types=infer_types,
+            workers=workers if parallel else 1,
+        )
+        return Loader(lazy, iter(()), size)
+
+    store: Optional[Callable[[CSVFile], None]] = None
+    if cache_dir and size >= CACHE_MIN_SIZE:
+        # a fresh cache replaces the parsing
+        cached: Optional[CSVFile] = read_cache(cache_dir, file_path, infer_types)
+        if cached is not None:
+            return Loader(cached, iter(()), size)
+        store = make_cache_writer(file_path, infer_types, cache_dir, cache_size)
+
+    if parallel:
+        header, chunks = parse_chunks(file_path, dialect, encoding, workers)
+    else:
+        raw: BinaryIO = open(file_path, "rb")
+        rows = csv.reader(TextIOWrapper(raw, encoding, newline=""), dialect)
+        header: List[str] = next(rows, [])
+        chunks = read_chunks(raw, rows, header)
+
+    file: CSVFile = CSVFile(
+        header, [[] for _ in header], path=file_path, dialect=dialect
+    )
+    return Loader(file, chunks, size, infer_types=infer_types, on_done=store)
+
+
+def load_csv(
+    file_path: str,
+    lazy_size: int = 0,
+    infer_types: bool = False,
+    parallel_size: int = 0,
+    workers: int = 0,
+) -> CSVFile:
+    """
+    Load a CSV file into memory
+
+    Arguments:
+        file_path (str): path of the csv file
+        lazy_size (int): files with at least this many bytes are indexed
+            and parsed on demand instead of being read at once (0 -> never)
+        infer_types (bool): store the int, float, bool and date columns in
+            compact arrays (see make_typed_column)
+        parallel_size (int): files with at least this many bytes are
+            parsed on several processes (0 -> never)
+        workers (int): number of processes used to parse (0 -> one per cpu)
+
+    Returns:
+        (CSVFile): the loaded file (empty if it could not be read)
+    """
     try:
-        with open(file_path, "r") as f:
-            data = csv.reader(f)
-            rows: List[List[str]] = [row for row in data]
-            return CSVFile(header=rows[0], rows=rows[1:], path=file_path)
+        return make_loader(
+            file_path, lazy_size, infer_types, parallel_size, workers
+        ).run()
 
     except FileNotFoundError:
         p_print(error_message("That file does not exist"))
@@ -0,0 +1,43 @@
+from pysv.classes.csv_file import CSVFile
+from pysv.classes.journal import Journal
+from pysv.functions.output import error_message, title_message
+
+
+def attach_journal(file: CSVFile) -> str:
+    """
+    Start journaling the edits of a CSV file. If a previous session left
+    unsaved edits in the journal of the same file, they are replayed.
+    Must be called once the file is loaded (its version on disk is what
+    the journal records).
+
+    Arguments:
+        file (CSVFile): file that was just loaded
+
+    Returns:
+        (str): message about the recovered edits ("" if there were none)
+    """
+    if not file.path:
+        return ""
+
+    journal: Journal = Journal(file.path)
+    message: str = ""
+
+    if journal.exists():
+        if journal.matches():
+            count: int = file.replay(journal.entries())
+            message = title_message(
+                "Recovered",
+                f"«{count}» unsaved edits were replayed from «{journal.path}» "
+                "(use «discard» to drop them)",
+            )
+        else:
+            # the file was changed by something else since then
+            old_path: str = journal.set_aside()
+            message = error_message(
+                "The journal doesn't match the file anymore, "
+                f"it was kept as «{old_path}»",
+                title="Warning",
+            )
+
+    file.journal = journal
+    return message
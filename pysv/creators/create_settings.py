@@ -3,7 +3,24 @@ import json
 from pysv.classes.named_files import NamedFiles
 from pysv.functions.output import error_message
 from pysv.functions.general import p_print
-from pysv.defaults import DEFAULT_CL_S_KEY, DEFAULT_HELP_KEY, DEFAULT_LIST_KEY
+from pysv.defaults import (
+    DEFAULT_CL_S_KEY,
+    DEFAULT_HELP_KEY,
+    DEFAULT_LIST_KEY,
+    DEFAULT_LAZY_SIZE,
+    DEFAULT_HTML_PAGE_SIZE,
+    DEFAULT_SORT_MEMORY,
+    DEFAULT_INFER_TYPES,
+    DEFAULT_JOURNAL,
+    DEFAULT_PARALLEL_SIZE,
+    DEFAULT_PARSE_WORKERS,
+    DEFAULT_CACHE,
+    DEFAULT_CACHE_DIR,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_WORKSPACE_MEMORY,
+    DEFAULT_JOIN_MEMORY,
+    DEFAULT_FIND_INDEX,
+)
 from pysv.classes.settings import Settings
 from pysv.classes.color import Colors
 from pysv.creators.create_color import make_color_scheme
@@ -22,6 +39,19 @@ def make_settings(path: str = "~/.config/pysv/config.json") -> Settings:
     clear_key: str = data.get("clear_key") or DEFAULT_CL_S_KEY
     list_key: str = data.get("list_key") or DEFAULT_LIST_KEY
     help_key: str = data.get("help_key") or DEFAULT_HELP_KEY
+    lazy_size: int = data.get("lazy_load_size", DEFAULT_LAZY_SIZE)
+    html_page_size: int = data.get("html_page_size", DEFAULT_HTML_PAGE_SIZE)
+    sort_memory: int = data.get("sort_memory", DEFAULT_SORT_MEMORY)
+    infer_types: bool = data.get("infer_types", DEFAULT_INFER_TYPES)
+    journal: bool = data.get("journal", DEFAULT_JOURNAL)
+    parallel_size: int = data.get("parallel_size", DEFAULT_PARALLEL_SIZE)
+    parse_workers: int = data.get("parse_workers", DEFAULT_PARSE_WORKERS)
+    cache: bool = data.get("cache", DEFAULT_CACHE)
+    cache_dir: str = os.path.expanduser(data.get("cache_dir", DEFAULT_CACHE_DIR))
+    cache_size: int = data.get("cache_size", DEFAULT_CACHE_SIZE)
+    workspace_memory: int = data.get("workspace_memory", DEFAULT_WORKSPACE_MEMORY)
+    join_memory: int = data.get("join_memory", DEFAULT_JOIN_MEMORY)
+    find_index: bool = data.get("find_index", DEFAULT_FIND_INDEX)
 
     return Settings(
         named_files=files,
@@ -29,4 +59,17 @@ def make_settings(path: str = "~/.config/pysv/config.json") -> Settings:
         clear_key=clear_key,
         list_key=list_key,
         help_key=help_key,
+        lazy_size=lazy_size,
+        html_page_size=html_page_size,
+        sort_memory=sort_memory,
+        infer_types=infer_types,
+        journal=journal,
+        parallel_size=parallel_size,
+        parse_workers=parse_workers,
+        cache=cache,
+        cache_dir=cache_dir,
+        cache_size=cache_size,
+        workspace_memory=workspace_memory,
+        join_memory=join_memory,
+        find_index=find_index,
     )
@@ -0,0 +1,96 @@
+from array import array
+from itertools import islice
+from typing import List, MutableSequence, Optional
+from pysv.classes.typed_column import (
+    BOOL_SPELLINGS,
+    DATE,
+    FLOAT,
+    INT,
+    ColumnType,
+    TypedColumn,
+    bool_type,
+)
+
+# number of (non empty) values used to guess the type of a column
+SAMPLE_SIZE: int = 1000
+
+
+def guess_types(sample: List[str]) -> List[ColumnType]:
+    """
+    Types that can store every value of a sample, most compact first
+
+    Arguments:
+        sample (List[str]): non empty values of the column
+
+    Returns:
+        (List[ColumnType]): candidate types (empty -> text)
+    """
+    candidates: List[ColumnType] = [INT, FLOAT, DATE]
+
+    # booleans must always be written the same way
+    distinct: set = set(sample)
+    for false, true in BOOL_SPELLINGS:
+        if distinct <= {false, true}:
+            candidates.append(bool_type(false, true))
+
+    types: List[ColumnType] = []
+    for kind in candidates:
+        try:
+            for value in sample:
+                kind.parse(value)
+            types.append(kind)
+        except ValueError:
+            pass
+
+    return types
+
+
+def make_typed_column(values: List[str]) -> MutableSequence:
+    """
+    Store a column in a compact array when all of its values have the same
+    type (int, float, bool or ISO date) and can be written back exactly.
+    The type is guessed from a sample and then verified on every value.
+
+    Arguments:
+        values (List[str]): values of the column
+
+    Returns:
+        (MutableSequence): TypedColumn, or the values themselves (text)
+    """
+    sample: List[str] = list(islice((v for v in values if v), SAMPLE_SIZE))
+    if not sample:
+        return values
+
+    for kind in guess_types(sample):
+        column: Optional[TypedColumn] = build_column(kind, values)
+        if column is not None:
+            return column
+
+    # text column
+    return values
+
+
+def build_column(kind: ColumnType, values: List[str]) -> Optional[TypedColumn]:
+    """
+    Verify and convert every value of a column
+
+    Arguments:
+        kind (ColumnType): type of the column
+        values (List[str]): values of the column
+
+    Returns:
+        (TypedColumn|None): the typed column (None if a value doesn't fit)
+    """
+    try:
+        if "" not in values:
+            return TypedColumn(kind, array(kind.typecode, map(kind.parse, values)))
+
+        parse = kind.parse
+        nulls: bytearray = bytearray(value == "" for value in values)
+        stored: array = array(
+            kind.typecode, (parse(value) if value else 0 for value in values)
+        )
+        return TypedColumn(kind, stored, nulls)
+
+    except (ValueError, TypeError, OverflowError):
+        return None
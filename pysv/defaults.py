@@ -10,6 +10,43 @@ DEFAULT_LIST_KEY: str = "l"
 # Default key binding to show the help message
 DEFAULT_HELP_KEY: str = "h"
 
+# Default size (in bytes) from which files are loaded lazily (0 -> never)
+DEFAULT_LAZY_SIZE: int = 256 * 1024 * 1024
+
+# Default number of rows in each page of the html table (0 -> single page)
+DEFAULT_HTML_PAGE_SIZE: int = 10000
+
+# Default memory (in bytes) that sorting a file not in memory can use
+DEFAULT_SORT_MEMORY: int = 256 * 1024 * 1024
+
+# Hash tables of a join bigger than this are split into partitions on disk
+DEFAULT_JOIN_MEMORY: int = 256 * 1024 * 1024
+
+# «find» builds an index of the values on its first search (faster searches
+# after that, at the cost of memory)
+DEFAULT_FIND_INDEX: bool = True
+
+# Store int, float, bool and date columns in compact arrays by default
+DEFAULT_INFER_TYPES: bool = True
+
+# Write the unsaved edits to a sidecar journal by default
+DEFAULT_JOURNAL: bool = True
+
+# Files of at least 32MiB are parsed on several processes (0 -> never)
+DEFAULT_PARALLEL_SIZE: int = 32 * 1024 * 1024
+
+# Processes used to parse a file (0 -> one per cpu)
+DEFAULT_PARSE_WORKERS: int = 0
+
+# Keep a binary copy of the parsed files (reloads skip the parsing)
+DEFAULT_CACHE: bool = False
+
+# The cached files can take up to 2GiB (least recently used are deleted)
+DEFAULT_CACHE_SIZE: int = 2 * 1024 * 1024 * 1024
+
+# Loaded files are kept open while they take less than 1GiB of memory
+DEFAULT_WORKSPACE_MEMORY: int = 1024 * 1024 * 1024
+
 # Nord color scheme
 NORD: Colors = Colors(
     bg_color="#2e3440",
@@ -87,9 +124,18 @@ th {
 tr:nth-child(even) {
   color: var(--text-color-2);
 }
+
+nav {
+  padding: 1rem 0;
+}
+
+a {
+  color: var(--title-color);
+}
 """
 
 # paths for the configuration files
 DEFAULT_CONFIG_DIR = path.expanduser("~/.config/pysv")
 DEFAULT_HISTORY_PATH = path.join(DEFAULT_CONFIG_DIR, ".pysvhistory")
+DEFAULT_CACHE_DIR = path.join(DEFAULT_CONFIG_DIR, "cache")
 DEFAULT_SETTINGS_PATH = path.join(DEFAULT_CONFIG_DIR, "config.json")
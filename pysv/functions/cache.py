@@ -0,0 +1,210 @@
+import hashlib
+import json
+import marshal
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from typing import BinaryIO, List, MutableSequence, Optional
+from pysv.classes.csv_file import CSVFile
+from pysv.classes.typed_column import DATE, FLOAT, INT, TypedColumn, bool_type
+from pysv.functions.general import make_dialect
+
+# first bytes of every cache file (the number is the format version)
+MAGIC: bytes = b"PYSVCACHE1\n"
+
+# files smaller than this are parsed faster than a cache is checked
+CACHE_MIN_SIZE: int = 1024 * 1024
+
+# typed columns that are stored as arrays (booleans are stored apart)
+TYPES: dict = {"int": INT, "float": FLOAT, "date": DATE}
+
+
+def cache_path(cache_dir: str, source: str) -> str:
+    """
+    Path of the cache of a csv file (named after a hash of its full path)
+
+    Arguments:
+        cache_dir (str): directory of the caches
+        source (str): path of the csv file
+
+    Returns:
+        (str): path of the cache file
+    """
+    digest: str = hashlib.sha1(os.path.abspath(source).encode()).hexdigest()
+    return os.path.join(cache_dir, digest + ".pysvc")
+
+
+def cache_key(source: str, infer_types: bool) -> dict:
+    """
+    What a cache must match to be used: the version of the csv file
+    (size and modification time) and the way it was loaded
+
+    Arguments:
+        source (str): path of the csv file
+        infer_types (bool): the columns are stored in typed arrays
+
+    Returns:
+        (dict): key of the cache
+    """
+    stat: os.stat_result = os.stat(source)
+    return {
+        "path": os.path.abspath(source),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "infer_types": infer_types,
+        # marshal's format depends on the python version
+        "python": list(sys.version_info[:2]),
+    }
+
+
+def write_block(f: BinaryIO, data: bytes) -> None:
+    """Write a block of bytes preceded by its length"""
+    f.write(struct.pack("<Q", len(data)))
+    f.write(data)
+
+
+def read_block(f: BinaryIO) -> bytes:
+    """Read a block written by write_block"""
+    (length,) = struct.unpack("<Q", f.read(8))
+    data: bytes = f.read(length)
+    if len(data) != length:
+        raise ValueError("The cache is truncated")
+    return data
+
+
+def column_meta(column: MutableSequence) -> dict:
+    """Describe how a column is stored in the cache"""
+    if not isinstance(column, TypedColumn):
+        return {"kind": "text"}
+
+    meta: dict = {"kind": column.kind.name, "nulls": column.nulls is not None}
+    if column.kind.name == "bool":
+        # how false and true are written
+        meta["spelling"] = [column.kind.format(0), column.kind.format(1)]
+    return meta
+
+
+def write_cache(cache_dir: str, file: CSVFile, key: dict) -> None:
+    """
+    Store a parsed csv file: a JSON header (key, dialect, header and
+    the type of every column) followed by one block per column (the raw
+    array of a typed column, the marshaled values of a text column)
+
+    Arguments:
+        cache_dir (str): directory of the caches
+        file (CSVFile): the freshly loaded file
+        key (dict): key of the file, taken before it was parsed
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+
+    meta: dict = {
+        "key": key,
+        "dialect": [
+            file.dialect.delimiter,
+            file.dialect.quotechar,
+            file.dialect.lineterminator,
+        ],
+        "header": file.header,
+        "columns": [column_meta(column) for column in file.columns],
+    }
+
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            write_block(f, json.dumps(meta).encode())
+
+            for column in file.columns:
+                if isinstance(column, TypedColumn):
+                    write_block(f, column.values.tobytes())
+                    if column.nulls is not None:
+                        write_block(f, bytes(column.nulls))
+                else:
+                    write_block(f, marshal.dumps(list(column)))
+
+        os.replace(tmp, cache_path(cache_dir, file.path))
+
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def read_column(f: BinaryIO, meta: dict) -> MutableSequence:
+    """Read a column stored by write_cache"""
+    if meta["kind"] == "text":
+        return marshal.loads(read_block(f))
+
+    if meta["kind"] == "bool":
+        kind = bool_type(*meta["spelling"])
+    else:
+        kind = TYPES[meta["kind"]]
+
+    values: array = array(kind.typecode)
+    values.frombytes(read_block(f))
+    nulls: Optional[bytearray] = bytearray(read_block(f)) if meta["nulls"] else None
+    return TypedColumn(kind, values, nulls)
+
+
+def read_cache(cache_dir: str, source: str, infer_types: bool) -> Optional[CSVFile]:
+    """
+    Load a csv file from its cache, if the cache matches the file
+
+    Arguments:
+        cache_dir (str): directory of the caches
+        source (str): path of the csv file
+        infer_types (bool): the file is loaded with infer_types
+
+    Returns:
+        (Optional[CSVFile]): the file, None if there is no fresh cache
+    """
+    target: str = cache_path(cache_dir, source)
+
+    try:
+        with open(target, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                return None
+            meta: dict = json.loads(read_block(f))
+            if meta["key"] != cache_key(source, infer_types):
+                return None
+
+            columns: List[MutableSequence] = [
+                read_column(f, column) for column in meta["columns"]
+            ]
+
+    except (OSError, ValueError, KeyError, TypeError, EOFError, struct.error):
+        # missing or damaged -> parse the file
+        return None
+
+    # recently used caches are evicted last
+    os.utime(target)
+
+    return CSVFile(
+        meta["header"],
+        columns,
+        path=source,
+        dialect=make_dialect(*meta["dialect"]),
+    )
+
+
+def evict(cache_dir: str, max_size: int) -> None:
+    """
+    Delete the least recently used caches until they fit in the budget
+
+    Arguments:
+        cache_dir (str): directory of the caches
+        max_size (int): bytes the caches can take
+    """
+    caches: List[tuple] = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(".pysvc"):
+            stat: os.stat_result = entry.stat()
+            caches.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total: int = sum(size for _, size, _ in caches)
+    for _, size, cache in sorted(caches):
+        if total <= max_size:
+            break
+        os.remove(cache)
+        total -= size
@@ -1,6 +1,10 @@
+import csv
+import io
+import re
+import sys
 from os import system, path, makedirs
-from typing import List
-from prompt_toolkit import print_formatted_text, HTML
+from typing import List, Optional, Type, Union
+from pysv.functions.output import strip_tags
 from pysv.defaults import (
     DEFAULT_CONFIG_DIR,
     DEFAULT_HISTORY_PATH,
@@ -15,27 +19,80 @@ def clear_screen() -> None:
     _ = system("clear")
 
 
-def p_print(text: str) -> None:
+def p_print(text: str, plain: Optional[str] = None) -> None:
     """
     Pretty print HTML-like formated text
+    (plain text when the output is not a terminal, e.g. in a pipeline)
 
     Arguments:
         text(str): HTML-like formated string
+        plain(Optional[str]): text printed when the output is not a
+            terminal. Default the text without its color tags
     """
+    if not sys.stdout.isatty():
+        print(strip_tags(text) if plain is None else plain)
+        return
+
+    from prompt_toolkit import print_formatted_text, HTML
+
     print_formatted_text(HTML(text))
 
 
-def make_csv_row(row: List[str]) -> str:
+def split_commands(commands: str) -> List[str]:
+    """
+    Split the commands given on the command line (separated by ;, a ;
+    that is part of a value is escaped as \\;)
+
+    Arguments:
+        commands (str): the commands
+
+    Returns:
+        (List[str]): every command, with its escaped ; restored
+    """
+    return [
+        command.replace("\\;", ";")
+        for command in re.split(r"(?<!\\);", commands)
+    ]
+
+
+def make_dialect(
+    delimiter: str, quotechar: str, terminator: str
+) -> Type[csv.Dialect]:
+    """
+    Create a dialect that only differs from excel in the given options
+
+    Arguments:
+        delimiter (str): value separator
+        quotechar (str): quote character
+        terminator (str): line terminator
+
+    Returns:
+        (Type[csv.Dialect]): the dialect
+    """
+    return type(
+        "LoadedDialect",
+        (csv.excel,),
+        {"delimiter": delimiter, "quotechar": quotechar, "lineterminator": terminator},
+    )
+
+
+def make_csv_row(
+    row: List[str], dialect: Union[str, Type[csv.Dialect]] = "excel"
+) -> str:
     """
     Join all values on a list into a CSV style string
+    (values are quoted whenever the dialect requires it)
 
     Argumnets:
         row (List[str]): list of strings that should be concatenated
+        dialect (str|Type[csv.Dialect]): csv dialect used to format the row
 
     Returns:
-        (str): string with the elements separated by commas
+        (str): string with the elements separated by the delimiter
     """
-    return ",".join(row) + "\n"
+    buffer: io.StringIO = io.StringIO()
+    csv.writer(buffer, dialect).writerow(row)
+    return buffer.getvalue()
 
 
 def make_file(path_to_file: str) -> None:
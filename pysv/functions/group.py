@@ -0,0 +1,192 @@
+import re
+from array import array
+from itertools import repeat
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from pysv.classes.csv_file import CSVFile
+from pysv.classes.typed_column import TypedColumn
+from pysv.functions.query import to_number
+
+# split the keys from the aggregates
+AGG_SPLIT_RE = re.compile(r"(?:^|\s+)agg\s+", re.IGNORECASE)
+
+# sum(column), count(*), ...
+AGGREGATE_RE = re.compile(
+    r"^(count|sum|avg|min|max)\s*\(\s*(.+?)\s*\)$", re.IGNORECASE
+)
+
+
+def parse_group(text: str) -> Tuple[List[str], List[Tuple[str, str]]]:
+    """
+    Read the arguments of the group command
+
+        «column», «column» ... agg count(*), sum(«column»), avg(«column») ...
+
+    Without «agg» the rows of every group are counted.
+
+    Arguments:
+        text (str): everything after «group»
+
+    Returns:
+        (Tuple[List[str], List[Tuple[str, str]]]): columns to group by and
+            aggregates (function, column)
+
+    Raises:
+        ValueError: an aggregate is not valid
+    """
+    parts: List[str] = AGG_SPLIT_RE.split(text.strip(), maxsplit=1)
+    keys: List[str] = [key.strip() for key in parts[0].split(",") if key.strip()]
+
+    aggregates: List[Tuple[str, str]] = []
+    for part in parts[1].split(",") if len(parts) > 1 else ["count(*)"]:
+        match = AGGREGATE_RE.match(part.strip())
+        if match is None:
+            raise ValueError(
+                f"«{part.strip()}» is not an aggregate, use count, sum, avg, "
+                "min or max of a column"
+            )
+        function, column = match.group(1).lower(), match.group(2)
+        if column == "*" and function != "count":
+            raise ValueError(f"«{function}» needs a column")
+        aggregates.append((function, column))
+
+    return keys, aggregates
+
+
+def format_number(value: float) -> str:
+    """Write an aggregated number (12.0 -> 12)"""
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return f"{value:.15g}"
+
+
+def iter_numbers(column: Sequence[str]) -> Iterator[float]:
+    """
+    Read a column as numbers (nan for the empty cells and the cells that
+    are not numbers, typed int and float columns are read as they are)
+
+    Arguments:
+        column (Sequence[str]): the column
+
+    Returns:
+        (Iterator[float]): a number for every row
+    """
+    if isinstance(column, TypedColumn) and column.kind.name in {"int", "float"}:
+        if column.nulls is None:
+            return iter(column.values)
+        nan: float = float("nan")
+        return (
+            nan if null else value for value, null in zip(column.values, column.nulls)
+        )
+    return map(to_number, column)
+
+
+def aggregate(
+    function: str, ids: array, groups: int, column: Optional[Sequence[str]]
+) -> List[str]:
+    """
+    Aggregate a column over every group in a single scan (only a running
+    total, count, minimum or maximum is kept for every group)
+
+    Arguments:
+        function (str): count, sum, avg, min or max
+        ids (array): group of every row
+        groups (int): number of groups
+        column (Optional[Sequence[str]]): the column (None -> count(*))
+
+    Returns:
+        (List[str]): the result of every group (empty when a group has no
+            number to aggregate)
+    """
+    counts: array = array("q", bytes(8 * groups))
+
+    if column is None:
+        for group in ids:
+            counts[group] += 1
+        return [str(count) for count in counts]
+
+    if function == "count":
+        for group, value in zip(ids, column):
+            if value.strip():
+                counts[group] += 1
+        return [str(count) for count in counts]
+
+    if function in {"sum", "avg"}:
+        totals: array = array("d", bytes(8 * groups))
+        for group, number in zip(ids, iter_numbers(column)):
+            # nan != nan -> not a number
+            if number == number:
+                totals[group] += number
+                counts[group] += 1
+
+        return [
+            format_number(total if function == "sum" else total / count)
+            if count
+            else ""
+            for total, count in zip(totals, counts)
+        ]
+
+    # min / max
+    smallest: bool = function == "min"
+    bounds: array = array("d", [float("inf") if smallest else float("-inf")]) * groups
+    for group, number in zip(ids, iter_numbers(column)):
+        if number == number:
+            counts[group] += 1
+            if (number < bounds[group]) if smallest else (number > bounds[group]):
+                bounds[group] = number
+
+    return [
+        format_number(bound) if count else "" for bound, count in zip(bounds, counts)
+    ]
+
+
+def group_rows(
+    file: CSVFile, keys: List[int], aggregates: List[Tuple[str, Optional[int]]]
+) -> CSVFile:
+    """
+    Hash aggregation: every row is given the number of its group (the
+    groups are found with a single pass over the key columns) and every
+    aggregate is then computed in one scan of its column. The rows of a
+    group are never gathered.
+
+    Arguments:
+        file (CSVFile): the file
+        keys (List[int]): positions of the columns to group by
+        aggregates (List[Tuple[str, Optional[int]]]): function and position
+            of its column (None -> count(*))
+
+    Returns:
+        (CSVFile): one row per group, in the order the groups first appear
+            (it has no path until it is saved)
+    """
+    columns: List[Sequence[str]] = file.columns
+
+    values: Iterable
+    if not keys:
+        # a single group with every row
+        values = repeat((), file.row_count())
+    elif len(keys) == 1:
+        values = columns[keys[0]]
+    else:
+        values = zip(*(columns[key] for key in keys))
+
+    # a new value gets the next number (len is read before it is added)
+    groups: Dict[object, int] = {}
+    number = groups.setdefault
+    ids: array = array("q", [number(value, len(groups)) for value in values])
+
+    header: List[str] = [file.header[key] for key in keys]
+    result: List[List[str]] = (
+        [list(groups)] if len(keys) == 1 else [list(key) for key in zip(*groups)]
+    )
+    if not result and keys:
+        result = [[] for _ in keys]
+
+    for function, position in aggregates:
+        name: str = "*" if position is None else file.header[position]
+        header.append(f"{function}({name})")
+        column: Optional[Sequence[str]] = (
+            None if position is None else columns[position]
+        )
+        result.append(aggregate(function, ids, len(groups), column))
+
+    return CSVFile(header, result, dialect=file.dialect)
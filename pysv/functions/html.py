@@ -1,10 +1,25 @@
-import webbrowser
+from os import path
+from typing import Iterator, List
 from pysv.defaults import DEFAULT_CSS_STR
 from pysv.classes.settings import Settings
 from pysv.classes.csv_file import CSVFile
 
+# end of every html document
+HTML_TAIL: str = """
+</body>
+</html>"""
 
-def html_boilerplate(style: str, table: str) -> str:
+
+def html_head(style: str) -> str:
+    """
+    Generate the start of the html document (everything up to <body>)
+
+    Arguments:
+        style (str): css for the document
+
+    Returns:
+        (str): html head of the document
+    """
     return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -17,9 +32,11 @@ def html_boilerplate(style: str, table: str) -> str:
 </style>
 </head>
 <body>
-{table}
-</body>
-</html>"""
+"""
+
+
+def html_boilerplate(style: str, table: str) -> str:
+    return html_head(style) + table + HTML_TAIL
 
 
 def css_boilerplate(settings: Settings, css_string: str) -> str:
@@ -65,6 +82,94 @@ def output_html(
     return html_boilerplate(css, table_content)
 
 
+def page_path(file_name: str, page: int) -> str:
+    """
+    Path of a page of the html table
+
+    Arguments:
+        file_name (str): path of the first page (/tmp/table.html)
+        page (int): index of the page
+
+    Returns:
+        (str): /tmp/table.html, /tmp/table-1.html, /tmp/table-2.html, ...
+    """
+    if page == 0:
+        return file_name
+
+    root, ext = path.splitext(file_name)
+    return f"{root}-{page}{ext}"
+
+
+def page_nav(file_name: str, page: int, pages: int) -> str:
+    """
+    Generate the links between the pages of the html table
+
+    Arguments:
+        file_name (str): path of the first page
+        page (int): index of the current page
+        pages (int): number of pages
+
+    Returns:
+        (str): html <nav> element («prev | page x of y | next»)
+    """
+    links: List[str] = []
+    if page > 0:
+        prev: str = path.basename(page_path(file_name, page - 1))
+        links.append(f'<a href="{prev}">&laquo; prev</a>')
+
+    links.append(f"page {page + 1} of {pages}")
+
+    if page < pages - 1:
+        nxt: str = path.basename(page_path(file_name, page + 1))
+        links.append(f'<a href="{nxt}">next &raquo;</a>')
+
+    return "<nav>" + " | ".join(links) + "</nav>\n"
+
+
+def write_html_pages(
+    file: CSVFile,
+    settings: Settings,
+    file_name: str,
+    css_string: str = DEFAULT_CSS_STR,
+) -> int:
+    """
+    Write a CSV file as html table pages, streaming one row at a time.
+    Each page holds at most settings.html_page_size rows (0 -> every row)
+    and links to the previous and next pages.
+
+    Arguments:
+        file (CSVFile): CSV Object that should be written
+        settings (Settings): Settings object containing (at least)
+            the color scheme for the css and the html page size
+        file_name (str): path of the first page
+        css_string (str): a string containing the styles for the html table
+
+    Returns:
+        (int): number of pages that were written
+    """
+    head: str = html_head(css_boilerplate(settings, css_string))
+    length: int = file.row_count()
+    size: int = settings.html_page_size or length or 1
+    pages: int = max(1, -(-length // size))
+
+    # a single pass over the rows is shared by every page
+    rows: Iterator[List[str]] = file.iter_rows()
+
+    for page in range(pages):
+        start: int = page * size
+        stop: int = min(start + size, length)
+        nav: str = page_nav(file_name, page, pages) if pages > 1 else ""
+
+        with open(page_path(file_name, page), "w", buffering=1 << 20) as f:
+            f.write(head)
+            f.write(nav)
+            f.writelines(file.iter_table_html(start, stop, rows))
+            f.write(nav)
+            f.write(HTML_TAIL)
+
+    return pages
+
+
 def show_html_table(
     file: CSVFile, settings: Settings, css_string: str = DEFAULT_CSS_STR
 ) -> None:
@@ -82,10 +187,10 @@ def show_html_table(
     # path to the tmp (temporary) file to store the html output
     file_name: str = "/tmp/table.html"
 
-    # create or override the tmp file
-    with open(file_name, "w") as f:
-        # generate and write the html
-        f.write(output_html(file, settings, css_string))
+    # create or override the tmp file(s), page by page
+    write_html_pages(file, settings, file_name, css_string)
+
+    # open the first tmp html page using the default system browser
+    import webbrowser
 
-    # open the tmp html file using the default system browser
     webbrowser.open_new_tab(file_name)
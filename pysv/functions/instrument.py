@@ -0,0 +1,94 @@
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from html import escape
+from typing import Callable, Optional, Tuple
+from pysv.functions.output import title_message
+
+# functions shown in the summary of a profile
+PROFILE_TOP: int = 15
+
+
+def measure(
+    run: Callable[[], None], memory: bool = False
+) -> Tuple[float, Optional[int]]:
+    """
+    Run a function and measure its wall time (and its peak memory)
+
+    Arguments:
+        run (Callable[[], None]): the function
+        memory (bool): also trace the memory allocations (slower)
+
+    Returns:
+        (Tuple[float, Optional[int]]): seconds and peak bytes allocated
+            (None when the memory is not traced)
+    """
+    if not memory:
+        start: float = time.perf_counter()
+        run()
+        return time.perf_counter() - start, None
+
+    # someone else may already be tracing (-X tracemalloc)
+    tracing: bool = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+
+    try:
+        base: int = tracemalloc.get_traced_memory()[0]
+        start: float = time.perf_counter()
+        run()
+        seconds: float = time.perf_counter() - start
+        peak: int = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    return seconds, peak
+
+
+def timing_message(seconds: float, peak: Optional[int] = None) -> str:
+    """
+    Generate the message that reports the cost of a command
+
+    Arguments:
+        seconds (float): wall time of the command
+        peak (Optional[int]): peak bytes allocated by the command
+
+    Returns:
+        (str): formated message
+    """
+    body: str = f"«{seconds * 1000:.1f} ms»"
+    if peak is not None:
+        body += f", peak memory «{peak / (1024 * 1024):.2f} MiB»"
+    return title_message("Time", body, color="yellow")
+
+
+def profile_call(run: Callable[[], None], path: str) -> str:
+    """
+    Run a function under cProfile and dump the profile to a file
+    (it can be read with pstats, snakeviz, ...)
+
+    Arguments:
+        run (Callable[[], None]): the function
+        path (str): file where the profile is written
+
+    Returns:
+        (str): formated message with the most expensive functions
+    """
+    profiler: cProfile.Profile = cProfile.Profile()
+    profiler.runcall(run)
+    profiler.dump_stats(path)
+
+    summary: io.StringIO = io.StringIO()
+    stats: pstats.Stats = pstats.Stats(profiler, stream=summary)
+    stats.sort_stats("cumulative").print_stats(PROFILE_TOP)
+
+    return title_message(
+        "Profile",
+        f"written to «{path}»\n" + escape(summary.getvalue().strip()),
+        color="yellow",
+    )
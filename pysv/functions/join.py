@@ -0,0 +1,260 @@
+import csv
+import os
+import re
+import sys
+import tempfile
+from array import array
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+from pysv.classes.csv_file import CSVFile
+from pysv.functions.sort import read_run
+
+# join [inner|left] «file» on «column» [= «column»]
+JOIN_RE = re.compile(
+    r"^(?:(inner|left)\s+)?(.+?)\s+on\s+(.+?)(?:\s*=\s*(.+?))?\s*$", re.IGNORECASE
+)
+
+# estimated memory of every entry of the hash table besides its key
+# (its slot in the dict, the list of rows and the row index)
+ENTRY_OVERHEAD: int = 128
+
+# keys measured to estimate the size of the hash table
+KEY_SAMPLE: int = 1000
+
+# most partitions of a grace hash join (a file is open for every one)
+MAX_PARTITIONS: int = 256
+
+
+def parse_join(text: str) -> Tuple[str, str, str, str]:
+    """
+    Read the arguments of the join command
+
+        [inner|left] «file» on «column» [= «other file's column»]
+
+    Arguments:
+        text (str): everything after «join»
+
+    Returns:
+        (Tuple[str, str, str, str]): kind of join, file, column of the
+            current file and column of the other file
+
+    Raises:
+        ValueError: the arguments are not valid
+    """
+    match = JOIN_RE.match(text.strip())
+    if match is None:
+        raise ValueError("Use «join inner|left file on column = other column»")
+
+    how, name, column, other = match.groups()
+    return (how or "inner").lower(), name, column, other or column
+
+
+def table_size(keys: Sequence[str]) -> int:
+    """
+    Estimate the memory of a hash table built on a column
+
+    Arguments:
+        keys (Sequence[str]): values of the column
+
+    Returns:
+        (int): bytes
+    """
+    count: int = len(keys)
+    if not count:
+        return 0
+
+    sample: List[str] = [keys[i] for i in range(0, count, max(1, count // KEY_SAMPLE))]
+    key_size: float = sum(sys.getsizeof(key) for key in sample) / len(sample)
+    return int(count * (key_size + ENTRY_OVERHEAD))
+
+
+def partition(keys: Iterable[Tuple[int, str]], parts: int) -> List[str]:
+    """
+    Spill the keys of a column to temporary files, every key to the file
+    of its hash (equal keys always end up in the same partition)
+
+    Arguments:
+        keys (Iterable[Tuple[int, str]]): row index and key of every row
+        parts (int): number of partitions
+
+    Returns:
+        (List[str]): path of every partition
+    """
+    paths: List[str] = []
+    files: list = []
+
+    try:
+        for _ in range(parts):
+            fd, path = tempfile.mkstemp(prefix=".pysv-join-", suffix=".csv")
+            paths.append(path)
+            files.append(open(fd, "w", newline="", buffering=1 << 20))
+
+        writers: list = [csv.writer(f) for f in files]
+        for index, key in keys:
+            writers[hash(key) % parts].writerow((index, key))
+
+    except BaseException:
+        for f in files:
+            f.close()
+        for path in paths:
+            os.remove(path)
+        raise
+
+    for f in files:
+        f.close()
+    return paths
+
+
+def read_partition(path: str) -> Iterator[Tuple[int, str]]:
+    """Stream the row indexes and keys of a partition"""
+    for index, key in read_run(path):
+        yield int(index), key
+
+
+def join_pairs(
+    build: Iterable[Tuple[int, str]],
+    probe: Iterable[Tuple[int, str]],
+    build_left: bool,
+    keep_probe: bool,
+    pairs: Tuple[array, array],
+    matched: bytearray,
+) -> None:
+    """
+    Match the rows of two columns: a hash table is built on one side and
+    the other side is streamed through it. Empty keys never match.
+
+    Arguments:
+        build (Iterable[Tuple[int, str]]): row index and key of the rows
+            the hash table is built on
+        probe (Iterable[Tuple[int, str]]): row index and key of the rows
+            that are looked up
+        build_left (bool): the hash table is built on the current file
+        keep_probe (bool): keep the probe rows without a match
+        pairs (Tuple[array, array]): where the row indexes of every match
+            are added (current file, other file; -1 -> no match)
+        matched (bytearray): marks the build rows that matched (only
+            needed when build_left is set)
+    """
+    table: Dict[str, List[int]] = {}
+    for index, key in build:
+        if key:
+            found = table.get(key)
+            if found is None:
+                table[key] = [index]
+            else:
+                found.append(index)
+
+    left_rows, right_rows = pairs
+    for index, key in probe:
+        found = table.get(key) if key else None
+
+        if found is None:
+            if keep_probe:
+                left_rows.append(index)
+                right_rows.append(-1)
+
+        elif build_left:
+            for other in found:
+                left_rows.append(other)
+                right_rows.append(index)
+                matched[other] = 1
+
+        else:
+            for other in found:
+                left_rows.append(index)
+                right_rows.append(other)
+
+
+def hash_join(
+    left: CSVFile,
+    right: CSVFile,
+    left_on: int,
+    right_on: int,
+    how: str = "inner",
+    memory: int = 0,
+) -> CSVFile:
+    """
+    Join two files on a column. The hash table is built on the file with
+    fewer rows and the other file is streamed through it. When the table
+    would take more than «memory» bytes both columns are first split into
+    partitions spilled to temporary files (grace hash join) and every
+    partition is joined on its own.
+
+    The rows come out in the order of the current file (then in the order
+    of the other file). The columns are the ones of the current file
+    followed by the ones of the other file, except its join column.
+
+    Arguments:
+        left (CSVFile): the current file
+        right (CSVFile): the other file
+        left_on (int): position of the join column in the current file
+        right_on (int): position of the join column in the other file
+        how (str): inner (only the rows that match) or left (also the rows
+            of the current file without a match)
+        memory (int): memory budget (in bytes) for the hash table
+            (0 -> always in memory)
+
+    Returns:
+        (CSVFile): the joined file (it has no path until it is saved)
+    """
+    left_keys: Sequence[str] = left.columns[left_on]
+    right_keys: Sequence[str] = right.columns[right_on]
+
+    # the hash table is built on the smaller file
+    build_left: bool = len(left_keys) < len(right_keys)
+    build, probe = (left_keys, right_keys) if build_left else (right_keys, left_keys)
+
+    pairs: Tuple[array, array] = (array("q"), array("q"))
+    matched: bytearray = bytearray(len(left_keys) if build_left else 0)
+    keep_probe: bool = how == "left" and not build_left
+
+    size: int = table_size(build)
+    parts: int = 1
+    if memory and size > memory:
+        parts = min(size // memory + 1, MAX_PARTITIONS)
+
+    if parts == 1:
+        join_pairs(
+            enumerate(build), enumerate(probe), build_left, keep_probe, pairs, matched
+        )
+    else:
+        paths: List[str] = []
+        try:
+            paths += partition(enumerate(build), parts)
+            paths += partition(enumerate(probe), parts)
+            for build_path, probe_path in zip(paths[:parts], paths[parts:]):
+                join_pairs(
+                    read_partition(build_path),
+                    read_partition(probe_path),
+                    build_left,
+                    keep_probe,
+                    pairs,
+                    matched,
+                )
+        finally:
+            for path in paths:
+                os.remove(path)
+
+    left_rows, right_rows = pairs
+    if how == "left" and build_left:
+        for index, found in enumerate(matched):
+            if not found:
+                left_rows.append(index)
+                right_rows.append(-1)
+
+    if build_left or parts > 1:
+        # back to the order of the current file (the sort is stable)
+        order: List[int] = sorted(range(len(left_rows)), key=left_rows.__getitem__)
+        left_rows = array("q", [left_rows[i] for i in order])
+        right_rows = array("q", [right_rows[i] for i in order])
+
+    header: List[str] = left.header + [
+        name for position, name in enumerate(right.header) if position != right_on
+    ]
+    columns: List[List[str]] = [
+        [column[index] for index in left_rows] for column in left.columns
+    ]
+    for position, column in enumerate(right.columns):
+        if position != right_on:
+            columns.append(["" if index < 0 else column[index] for index in right_rows])
+
+    return CSVFile(header, columns, dialect=left.dialect)
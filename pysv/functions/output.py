@@ -1,3 +1,9 @@
+import re
+
+# tags of the messages made for p_print (colors and grey)
+TAG_RE = re.compile(r"</?(?:ansi[a-z]+|grey)>")
+
+
 def add_color(message: str, color: str) -> str:
     """
     Make text surrounded by «» with the provided color
@@ -46,3 +52,31 @@ def error_message(body: str, color: str = "red", title: str = "Error") -> str:
     # make text surrounded by «» colorfull
     body = add_color(body, color)
     return f"<ansi{color}>{title}</ansi{color}>: {body}"
+
+
+def is_error(message: str) -> bool:
+    """
+    Know if a message is an error (see error_message, the warnings have
+    another title)
+
+    Arguments:
+        message (str): the message
+
+    Returns:
+        (bool): the message starts with the "Error" title
+    """
+    return message.startswith(error_message(""))
+
+
+def strip_tags(message: str) -> str:
+    """
+    Remove the tags of a message made for p_print (only the color tags,
+    the rest of the text can hold any value of the file)
+
+    Arguments:
+        message (str): the message
+
+    Returns:
+        (str): the message as plain text
+    """
+    return TAG_RE.sub("", message)
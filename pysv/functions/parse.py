@@ -0,0 +1,276 @@
+import csv
+import io
+import mmap
+import os
+from typing import Iterator, List, Tuple, Type
+from pysv.classes.csv_file import transpose
+
+# bytes read at once while counting quotes
+BLOCK_SIZE: int = 16 * 1024 * 1024
+
+# smallest part of a file worth parsing on its own process
+MIN_RANGE_SIZE: int = 4 * 1024 * 1024
+
+# ranges given to every process (smaller ranges balance the work better)
+RANGES_PER_WORKER: int = 4
+
+# dialect options sent to the workers (sniffed dialects can't be pickled)
+DIALECT_OPTIONS: Tuple[str, ...] = (
+    "delimiter",
+    "quotechar",
+    "escapechar",
+    "doublequote",
+    "skipinitialspace",
+    "quoting",
+)
+
+
+def record_end(data: mmap.mmap, start: int, quote: bytes) -> int:
+    """
+    Find where the record that starts at a given offset ends.
+    Newlines inside quoted fields do not end a record.
+
+    Arguments:
+        data (mmap.mmap): content of the csv file
+        start (int): offset of the first byte of the record
+        quote (bytes): quote character of the file
+
+    Returns:
+        (int): offset just past the record's line terminator
+    """
+    return next_record(data, start, False, quote)
+
+
+def next_record(data: mmap.mmap, pos: int, in_quotes: bool, quote: bytes) -> int:
+    """
+    Find the first line end after an offset that is not inside quotes
+
+    Arguments:
+        data (mmap.mmap): content of the csv file
+        pos (int): offset where the search starts
+        in_quotes (bool): the offset is inside a quoted field
+        quote (bytes): quote character of the file
+
+    Returns:
+        (int): offset just past the line terminator (where a record starts)
+    """
+    size: int = len(data)
+
+    while pos < size:
+        newline: int = data.find(b"\n", pos)
+        end: int = size if newline == -1 else newline + 1
+
+        # only count the quotes of lines that have any
+        if data.find(quote, pos, end) != -1:
+            if data[pos:end].count(quote) % 2:
+                in_quotes = not in_quotes
+
+        pos = end
+        if not in_quotes:
+            break
+
+    return pos
+
+
+def count_quotes(task: Tuple[str, int, int, bytes]) -> int:
+    """
+    Count the quote characters in a byte range of a file (runs on a worker)
+
+    Arguments:
+        task (Tuple[str, int, int, bytes]): path, start, stop and quote
+
+    Returns:
+        (int): number of quote characters
+    """
+    path, start, stop, quote = task
+    count: int = 0
+
+    with open(path, "rb") as f:
+        f.seek(start)
+        while start < stop:
+            block: bytes = f.read(min(BLOCK_SIZE, stop - start))
+            if not block:
+                break
+            count += block.count(quote)
+            start += len(block)
+
+    return count
+
+
+def parse_range(task: Tuple[str, int, int, str, dict, int]) -> List[List[str]]:
+    """
+    Parse the records stored in a byte range of a file (runs on a worker)
+
+    Arguments:
+        task (Tuple[str, int, int, str, dict, int]): path, start, stop,
+            encoding, dialect options and number of columns
+
+    Returns:
+        (List[List[str]]): columns of the records (more columns than
+            «width» when a record has more values, see transpose)
+    """
+    path, start, stop, encoding, options, width = task
+
+    with open(path, "rb") as f:
+        f.seek(start)
+        text: str = f.read(stop - start).decode(encoding)
+
+    rows = csv.reader(io.StringIO(text, newline=""), **options)
+    return transpose(rows, width)
+
+
+def split_records(
+    data: mmap.mmap, start: int, counts: List[int], quote: bytes
+) -> List[int]:
+    """
+    Move the limits of equal byte ranges to the next record boundary
+
+    Arguments:
+        data (mmap.mmap): content of the csv file
+        start (int): offset of the first record
+        counts (List[int]): number of quotes in every equal range
+        quote (bytes): quote character of the file
+
+    Returns:
+        (List[int]): offsets where every range starts, and the end of the file
+    """
+    size: int = len(data)
+    parts: int = len(counts)
+
+    bounds: List[int] = [start]
+    in_quotes: bool = False
+    for i, count in enumerate(counts[:-1], start=1):
+        # an odd number of quotes so far -> the limit is in a quoted field
+        in_quotes ^= bool(count % 2)
+        limit: int = start + (size - start) * i // parts
+        bounds.append(max(next_record(data, limit, in_quotes, quote), bounds[-1]))
+
+    bounds.append(size)
+    return bounds
+
+
+def parse_chunks(
+    path: str, dialect: Type[csv.Dialect], encoding: str, workers: int = 0
+) -> Tuple[List[str], Iterator[Tuple[int, List[List[str]]]]]:
+    """
+    Parse a csv file on several processes. The file is split into byte
+    ranges that start on a record (quoted newlines are found by counting
+    quotes, which the workers also do in parallel) and every range is
+    parsed on its own process.
+
+    Arguments:
+        path (str): path of the csv file
+        dialect (Type[csv.Dialect]): dialect of the file
+        encoding (str): encoding of the file
+        workers (int): number of processes (0 -> one per cpu)
+
+    Returns:
+        (Tuple[List[str], Iterator[Tuple[int, List[List[str]]]]]): header
+            of the file, and the offset where every range ends with the
+            columns of the range, in order
+    """
+    quote: bytes = (dialect.quotechar or '"').encode(encoding)
+    options: dict = {name: getattr(dialect, name) for name in DIALECT_OPTIONS}
+
+    if not os.path.getsize(path):
+        return [], iter(())
+
+    with open(path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+        header_end: int = record_end(data, 0, quote)
+        text: str = data[:header_end].decode(encoding)
+        header: List[str] = next(
+            csv.reader(io.StringIO(text, newline=""), **options), []
+        )
+
+    task: tuple = (path, header_end, encoding, options, len(header), quote)
+    return header, iter_ranges(task, workers)
+
+
+def iter_ranges(
+    task: Tuple[str, int, str, dict, int, bytes], workers: int
+) -> Iterator[Tuple[int, List[List[str]]]]:
+    """
+    Parse the records of a file after its header, a byte range at a time
+
+    Arguments:
+        task (Tuple[str, int, str, dict, int, bytes]): path, offset of the
+            first record, encoding, dialect options, number of columns
+            and quote character
+        workers (int): number of processes (0 -> one per cpu)
+
+    Returns:
+        (Iterator[Tuple[int, List[List[str]]]]): offset where every range
+            ends and the columns of the range, in order
+    """
+    path, start, encoding, options, width, quote = task
+    size: int = os.path.getsize(path)
+
+    workers = workers or os.cpu_count() or 1
+    parts: int = min(workers * RANGES_PER_WORKER, size // MIN_RANGE_SIZE)
+    if workers <= 1 or parts <= 1:
+        yield size, parse_range((path, start, size, encoding, options, width))
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    pool = ProcessPoolExecutor(min(workers, parts))
+    try:
+        limits: List[int] = [
+            start + (size - start) * i // parts for i in range(parts + 1)
+        ]
+        counts: List[int] = list(
+            pool.map(
+                count_quotes,
+                [(path, a, b, quote) for a, b in zip(limits, limits[1:])],
+            )
+        )
+
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as data:
+            bounds: List[int] = split_records(data, start, counts, quote)
+
+        chunks = pool.map(
+            parse_range,
+            [
+                (path, a, b, encoding, options, width)
+                for a, b in zip(bounds, bounds[1:])
+            ],
+        )
+        yield from zip(bounds[1:], chunks)
+
+    finally:
+        # a reader that stops early doesn't wait for the remaining ranges
+        pool.shutdown(cancel_futures=True)
+
+
+def parse_file(
+    path: str, dialect: Type[csv.Dialect], encoding: str, workers: int = 0
+) -> Tuple[List[str], List[List[str]], bool]:
+    """
+    Parse a whole csv file on several processes (see parse_chunks)
+
+    Arguments:
+        path (str): path of the csv file
+        dialect (Type[csv.Dialect]): dialect of the file
+        encoding (str): encoding of the file
+        workers (int): number of processes (0 -> one per cpu)
+
+    Returns:
+        (Tuple[List[str], List[List[str]], bool]): header and columns of
+            the file, and whether some rows had values past the header
+            (they are dropped)
+    """
+    header, chunks = parse_chunks(path, dialect, encoding, workers)
+
+    # join the chunks in order, as they arrive
+    columns: List[List[str]] = [[] for _ in header]
+    wide: bool = False
+    for _, chunk in chunks:
+        wide = wide or len(chunk) > len(columns)
+        for column, part in zip(columns, chunk):
+            column.extend(part)
+
+    return header, columns, wide
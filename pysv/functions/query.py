@@ -0,0 +1,165 @@
+import math
+import re
+from typing import Callable, List, Sequence, Tuple
+from pysv.classes.csv_file import AmbiguousColumnError, CSVFile
+
+# comparison operators, longest first so that ">=" is not read as ">"
+OPERATORS: Tuple[str, ...] = (">=", "<=", "!=", "=", ">", "<", "~")
+
+# split the expression on the boolean operators
+OR_RE = re.compile(r"\s+or\s+", re.IGNORECASE)
+AND_RE = re.compile(r"\s+and\s+", re.IGNORECASE)
+NOT_RE = re.compile(r"^not\s+", re.IGNORECASE)
+CONDITION_RE = re.compile(
+    r"^(.+?)\s*(" + "|".join(re.escape(op) for op in OPERATORS) + r")\s*(.*)$"
+)
+
+# python operator used for every comparison
+PY_OPERATORS: dict = {
+    "=": "==",
+    "!=": "!=",
+    ">": ">",
+    "<": "<",
+    ">=": ">=",
+    "<=": "<=",
+}
+
+
+def to_number(value: str) -> float:
+    """
+    Read a cell as a number
+
+    Arguments:
+        value (str): content of the cell
+
+    Returns:
+        (float): the number (nan if the cell is not a number, so that
+            every comparison with it is False)
+    """
+    try:
+        return float(value)
+    except ValueError:
+        return float("nan")
+
+
+def parse_literal(text: str) -> str:
+    """Remove the quotes around a value ("Lisbon" or 'Lisbon' -> Lisbon)"""
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "\"'":
+        return text[1:-1]
+    return text
+
+
+def is_number(text: str) -> bool:
+    """Know if a literal should be compared as a number"""
+    try:
+        return math.isfinite(float(text))
+    except ValueError:
+        return False
+
+
+def compile_condition(condition: str, file: CSVFile, columns: List[int]) -> str:
+    """
+    Translate a single condition (Age > 30) into python source
+
+    Arguments:
+        condition (str): the condition
+        file (CSVFile): file whose columns are referenced
+        columns (List[int]): positions of the columns used so far
+            (the column of this condition is added to it)
+
+    Returns:
+        (str): python expression over the variables v0, v1, ...
+
+    Raises:
+        ValueError: the condition is not valid or the column does not exist
+    """
+    negate: bool = bool(NOT_RE.match(condition))
+    condition = NOT_RE.sub("", condition)
+
+    match = CONDITION_RE.match(condition.strip())
+    if match is None:
+        raise ValueError(f"«{condition}» is not a valid condition")
+
+    column, operator, value = match.groups()
+    try:
+        position: int = file.column_index(column.strip())
+    except AmbiguousColumnError:
+        raise
+    except ValueError:
+        raise ValueError(f"The column «{column.strip()}» doesn't exist!")
+    value = parse_literal(value)
+
+    # every column gets a variable, named after its order of appearance
+    if position not in columns:
+        columns.append(position)
+    var: str = f"v{columns.index(position)}"
+
+    if operator == "~":
+        # case insensitive "contains"
+        source: str = f"{value.lower()!r} in {var}.lower()"
+    elif is_number(value):
+        source: str = f"_num({var}) {PY_OPERATORS[operator]} {float(value)!r}"
+    else:
+        source: str = f"{var}.strip() {PY_OPERATORS[operator]} {value!r}"
+
+    return f"not ({source})" if negate else f"({source})"
+
+
+def compile_where(
+    expression: str, file: CSVFile
+) -> Callable[[CSVFile], List[int]]:
+    """
+    Compile a where expression into a function that returns the indexes
+    of the matching rows. The function walks the columns it needs once,
+    side by side, evaluating the whole expression on every row.
+
+    Syntax:
+        «column» «op» «value» [and|or ...] (and binds tighter than or)
+        op: = | != | > | < | >= | <= | ~ (contains, case insensitive)
+        numeric values are compared as numbers, text is compared without
+        surrounding spaces. Any condition can be preceded by «not».
+
+    Arguments:
+        expression (str): the where expression (Age > 30 and City = Lisbon)
+        file (CSVFile): file the expression refers to
+
+    Returns:
+        (Callable[[CSVFile], List[int]]): file -> indexes of matching rows
+
+    Raises:
+        ValueError: the expression is not valid
+    """
+    if not expression.strip():
+        raise ValueError("The expression is empty")
+
+    columns: List[int] = []
+    source: str = " or ".join(
+        " and ".join(
+            compile_condition(condition, file, columns)
+            for condition in AND_RE.split(group)
+        )
+        for group in OR_RE.split(expression.strip())
+    )
+
+    names: str = ", ".join(f"v{i}" for i in range(len(columns)))
+    cols: str = ", ".join(f"c{i}" for i in range(len(columns)))
+    loop: str = "v0 in enumerate(c0)"
+    if len(columns) > 1:
+        loop = f"({names}) in enumerate(zip({cols}))"
+
+    code: str = (
+        f"def where({cols}):\n"
+        f"    return [i for i, {loop} if {source}]\n"
+    )
+
+    # only literals and v/c variables ever reach the generated code
+    namespace: dict = {"_num": to_number}
+    exec(compile(code, "<where>", "exec"), namespace)
+    where: Callable[..., List[int]] = namespace["where"]
+
+    def run(target: CSVFile) -> List[int]:
+        data: Sequence = target.columns
+        return where(*(data[position] for position in columns))
+
+    return run
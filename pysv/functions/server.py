@@ -0,0 +1,185 @@
+import json
+import threading
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, ContextManager, List, Optional, Type
+from urllib.parse import parse_qs, urlparse
+from pysv.defaults import DEFAULT_CSS_STR
+from pysv.classes.settings import Settings
+from pysv.classes.csv_file import CSVFile
+from pysv.functions.html import css_boilerplate, html_boilerplate
+
+# number of rows sent to the browser on each request (the most a request
+# can ask for)
+SERVER_PAGE_SIZE: int = 200
+
+# script that asks the server for more rows as the user scrolls
+PAGING_SCRIPT: str = """
+<script>
+const table = document.querySelector("table");
+let next = 0, total = null, loading = false;
+
+async function load() {
+  if (loading || (total !== null && next >= total)) return;
+  loading = true;
+  const res = await fetch(`rows?start=${next}&count=%(count)d`);
+  const data = await res.json();
+  // the total is null until the whole file is indexed
+  total = data.rows.length ? data.total : data.start;
+  data.rows.forEach((row, i) => {
+    const tr = table.insertRow();
+    tr.insertCell().textContent = data.start + i;
+    row.forEach((value) => { tr.insertCell().textContent = value; });
+  });
+  next = data.start + data.rows.length;
+  loading = false;
+  // keep loading until the page can be scrolled
+  if (data.rows.length && document.body.scrollHeight <= window.innerHeight + 500) {
+    load();
+  }
+}
+
+window.addEventListener("scroll", () => {
+  if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 500) {
+    load();
+  }
+});
+load();
+</script>
+"""
+
+
+def output_html_shell(
+    file: CSVFile, settings: Settings, css_string: str = DEFAULT_CSS_STR
+) -> str:
+    """
+    Generate the html page served by the table server: the table header
+    and the script that fetches the rows (no rows are included)
+
+    Arguments:
+        file (CSVFile): CSV Object whose header should be shown
+        settings (Settings): Settings object containing (at least)
+            the color scheme for the css
+        css_string (str): a string containing the styles for the html table
+
+    Returns:
+        (str): The html string
+    """
+    table: str = (
+        "<table><tr><th>#</th>"
+        + "".join(f"<th>{escape(head)}</th>" for head in file.header)
+        + "</tr></table>"
+    )
+    script: str = PAGING_SCRIPT % {"count": SERVER_PAGE_SIZE}
+
+    return html_boilerplate(css_boilerplate(settings, css_string), table + script)
+
+
+def make_handler(
+    get_file: Callable[[], CSVFile], settings: Settings, lock: ContextManager
+) -> Type[BaseHTTPRequestHandler]:
+    """
+    Create the request handler for the table server
+
+    Arguments:
+        get_file (Callable[[], CSVFile]): returns the currently loaded file
+            (the rows are always read from the file that is in memory)
+        settings (Settings): Settings object containing (at least)
+            the color scheme for the css
+        lock (ContextManager): held while the file is read (the session
+            holds it while a command runs)
+
+    Returns:
+        (Type[BaseHTTPRequestHandler]): handler class
+    """
+
+    class TableHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+
+            if url.path == "/":
+                with lock:
+                    body: bytes = output_html_shell(get_file(), settings).encode()
+                self.reply(body, "text/html; charset=utf-8")
+
+            elif url.path == "/rows":
+                query: dict = parse_qs(url.query)
+                try:
+                    start: int = max(0, int(query.get("start", ["0"])[0]))
+                    count: int = int(query.get("count", [SERVER_PAGE_SIZE])[0])
+                except ValueError:
+                    self.send_error(400)
+                    return
+                count = min(max(0, count), SERVER_PAGE_SIZE)
+
+                with lock:
+                    # only the requested rows are indexed, not the whole file
+                    file: CSVFile = get_file()
+                    stop: int = file.count_rows_until(start + count)
+                    rows: List[List[str]] = [
+                        file.get_row(i) for i in range(start, stop)
+                    ]
+                    total: Optional[int] = file.known_row_count()
+
+                body: bytes = json.dumps(
+                    {"start": start, "total": total, "rows": rows}
+                ).encode()
+                self.reply(body, "application/json")
+
+            else:
+                self.send_error(404)
+
+        def reply(self, body: bytes, content_type: str) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            # don't print the requests over the prompt
+            pass
+
+    return TableHandler
+
+
+def start_table_server(
+    get_file: Callable[[], CSVFile], settings: Settings, lock: ContextManager
+) -> ThreadingHTTPServer:
+    """
+    Start a local http server (on a free port of localhost) that serves the
+    loaded CSV file page by page, in a background thread
+
+    Arguments:
+        get_file (Callable[[], CSVFile]): returns the currently loaded file
+        settings (Settings): Settings object containing (at least)
+            the color scheme for the css
+        lock (ContextManager): held while the file is read, shared with
+            the session so that no command changes the file meanwhile
+
+    Returns:
+        (ThreadingHTTPServer): the running server
+    """
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), make_handler(get_file, settings, lock)
+    )
+    server.daemon_threads = True
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    return server
+
+
+def server_url(server: ThreadingHTTPServer) -> str:
+    """
+    Address of the table server
+
+    Arguments:
+        server (ThreadingHTTPServer): running table server
+
+    Returns:
+        (str): http://127.0.0.1:«port»/
+    """
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}/"
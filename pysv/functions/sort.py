@@ -0,0 +1,232 @@
+import csv
+import heapq
+import math
+import os
+import tempfile
+from array import array
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple, Type
+from pysv.classes.sort_key import SortKey
+
+# estimated memory used by each value besides its characters
+VALUE_OVERHEAD: int = 56
+
+
+class Descending:
+    """Wrap a value so that it sorts in the opposite order"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __lt__(self, other: "Descending") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Descending) and self.value == other.value
+
+
+def parse_sort_keys(text: str) -> List[SortKey]:
+    """
+    Read the keys of the sort command
+
+        «column» [asc|desc] [num|text], «column» [asc|desc] [num|text], ...
+
+    Arguments:
+        text (str): everything after «sort»
+
+    Returns:
+        (List[SortKey]): keys, most significant first
+
+    Raises:
+        ValueError: no column was given
+    """
+    keys: List[SortKey] = []
+
+    for part in text.split(","):
+        words: List[str] = part.split()
+        key: SortKey = SortKey("")
+
+        # the options are the last words, the rest is the column name
+        while words and words[-1].lower() in {"asc", "desc", "num", "text"}:
+            option: str = words.pop().lower()
+            if option in {"asc", "desc"}:
+                key.descending = option == "desc"
+            else:
+                key.numeric = option == "num"
+
+        key.column = " ".join(words)
+        if not key.column:
+            raise ValueError("A column is needed for every sort key")
+        keys.append(key)
+
+    return keys
+
+
+def number_key(value: str) -> Tuple[int, float]:
+    """
+    Sort key of a numeric value (values that are not numbers go last)
+
+    Arguments:
+        value (str): content of the cell
+
+    Returns:
+        (Tuple[int, float]): (0, number) or (1, 0.0)
+    """
+    try:
+        number: float = float(value)
+    except ValueError:
+        return (1, 0.0)
+    if math.isnan(number):
+        return (1, 0.0)
+    return (0, number)
+
+
+def value_key(key: SortKey) -> Callable[[str], Any]:
+    """
+    Function that maps a value to what is compared when sorting.
+    Descending text is left for the sort's reverse flag.
+
+    Arguments:
+        key (SortKey): the sort key
+
+    Returns:
+        (Callable[[str], Any]): value -> comparable key
+    """
+    if key.numeric and key.descending:
+
+        def descending_number_key(value: str) -> Tuple[int, float]:
+            flag, number = number_key(value)
+            return (flag, -number)
+
+        return descending_number_key
+
+    if key.numeric:
+        return number_key
+    return str
+
+
+def row_key(
+    keys: List[SortKey], positions: List[int]
+) -> Callable[[List[str]], Tuple]:
+    """
+    Function that maps a whole row to a single comparable key
+
+    Arguments:
+        keys (List[SortKey]): sort keys, most significant first
+        positions (List[int]): position of the column of every key
+
+    Returns:
+        (Callable[[List[str]], Tuple]): row -> comparable key
+    """
+    parts: List[Tuple[int, Callable[[str], Any], bool]] = [
+        (position, value_key(key), key.descending and not key.numeric)
+        for key, position in zip(keys, positions)
+    ]
+
+    def key_of(row: List[str]) -> Tuple:
+        return tuple(
+            Descending(get(row[position])) if flip else get(row[position])
+            for position, get, flip in parts
+        )
+
+    return key_of
+
+
+def invert_order(order: Sequence[int]) -> array:
+    """
+    Invert a permutation of the rows (the order that undoes a sort)
+
+    Arguments:
+        order (Sequence[int]): index of the row for every position
+
+    Returns:
+        (array): position of every row
+    """
+    inverse: array = array("q", bytes(8 * len(order)))
+    for position, index in enumerate(order):
+        inverse[index] = position
+    return inverse
+
+
+def write_run(rows: List[List[str]], directory: str) -> str:
+    """
+    Write a sorted run to a temporary file
+
+    Arguments:
+        rows (List[List[str]]): sorted rows
+        directory (str): where the run should be stored
+
+    Returns:
+        (str): path of the run
+    """
+    fd, path = tempfile.mkstemp(prefix=".pysv-run-", suffix=".csv", dir=directory)
+    with open(fd, "w", newline="", buffering=1 << 20) as f:
+        csv.writer(f).writerows(rows)
+    return path
+
+
+def read_run(path: str) -> Iterator[List[str]]:
+    """Stream the rows of a sorted run"""
+    with open(path, "r", newline="", buffering=1 << 20) as f:
+        yield from csv.reader(f)
+
+
+def external_sort(
+    header: List[str],
+    rows: Iterator[List[str]],
+    keys: List[SortKey],
+    positions: List[int],
+    memory: int,
+    dialect: Type[csv.Dialect],
+    directory: Optional[str] = None,
+) -> str:
+    """
+    Sort rows that don't fit in memory: runs of about «memory» bytes are
+    sorted and spilled to temporary files, then k-way merged into a new
+    csv file (with the header)
+
+    Arguments:
+        header (List[str]): header of the file
+        rows (Iterator[List[str]]): every row of the file
+        keys (List[SortKey]): sort keys, most significant first
+        positions (List[int]): position of the column of every key
+        memory (int): memory budget (in bytes) for each run
+        dialect (Type[csv.Dialect]): dialect of the sorted file
+        directory (str|None): where the temporary files are stored
+
+    Returns:
+        (str): path of the sorted csv file
+    """
+    key: Callable[[List[str]], Tuple] = row_key(keys, positions)
+    runs: List[str] = []
+
+    try:
+        # split the rows into sorted runs
+        chunk: List[List[str]] = []
+        size: int = 0
+        for row in rows:
+            chunk.append(row)
+            size += sum(map(len, row)) + VALUE_OVERHEAD * (len(row) + 1)
+            if size >= memory:
+                chunk.sort(key=key)
+                runs.append(write_run(chunk, directory))
+                chunk, size = [], 0
+
+        # merge the runs (and what is left in memory) into the final file
+        chunk.sort(key=key)
+        merged = heapq.merge(*(read_run(run) for run in runs), chunk, key=key)
+
+        fd, path = tempfile.mkstemp(
+            prefix=".pysv-sorted-", suffix=".csv", dir=directory
+        )
+        with open(fd, "w", newline="", buffering=1 << 20) as f:
+            writer = csv.writer(f, dialect)
+            writer.writerow(header)
+            writer.writerows(merged)
+
+        return path
+
+    finally:
+        for run in runs:
+            os.remove(run)
@@ -0,0 +1,252 @@
+import re
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion
+from prompt_toolkit.document import Document
+from pysv.classes.csv_file import CSVFile
+from pysv.classes.named_files import NamedFiles
+from pysv.classes.prefix_index import PrefixIndex
+from pysv.classes.workspace import Workspace, workspace_key
+from pysv.functions.group import AGG_SPLIT_RE
+from pysv.functions.query import AND_RE, CONDITION_RE, NOT_RE, OR_RE
+
+# row numbers offered at once (the file can have millions of rows)
+ROW_COMPLETIONS: int = 50
+
+# command and its arguments (the arguments can be empty)
+COMMAND_RE = re.compile(r"^\s*(\S+)\s+(.*)$", re.DOTALL)
+
+# kind of a join (optional) and the rest of its arguments
+JOIN_KIND_RE = re.compile(r"^(?:(?:inner|left)\s+)?", re.IGNORECASE)
+
+# «file on» / «column =» of a join
+JOIN_ON_RE = re.compile(r"\s+on\s+", re.IGNORECASE)
+
+# commands whose arguments are a column and a row
+CELL_COMMANDS: set = {"cell", "copy", "cp", "edit", "replace", "set"}
+
+# commands followed by «column» or «row»
+SHAPE_COMMANDS: set = {"delete", "del", "peek", "switch", "sw"}
+
+
+def row_numbers(prefix: str, count: int) -> Iterator[int]:
+    """
+    Row numbers that start with a prefix, smallest first (they are
+    computed, not searched: 1 -> 1, 10-19, 100-199, ...)
+
+    Arguments:
+        prefix (str): start of the number
+        count (int): number of rows
+
+    Returns:
+        (Iterator[int]): the row numbers
+    """
+    if not prefix:
+        yield from range(count)
+        return
+    if not prefix.isdigit() or (prefix != "0" and prefix.startswith("0")):
+        return
+
+    first: int = int(prefix)
+    if first == 0:
+        if count:
+            yield 0
+        return
+
+    size: int = 1
+    while first * size < count:
+        yield from range(first * size, min((first + 1) * size, count))
+        size *= 10
+
+
+class CSVCompleter(Completer):
+    """
+    Completer of the prompt: the commands and their keywords come from a
+    static completer, the column names from the current file (see
+    CSVFile.complete_column), the row numbers from its size and the
+    files from the named files and the workspace.
+    """
+
+    def __init__(
+        self,
+        commands: Completer,
+        current: Callable[[], CSVFile],
+        named_files: NamedFiles,
+        workspace: Workspace,
+    ) -> None:
+        self.commands: Completer = commands  # command names and keywords
+        self.current: Callable[[], CSVFile] = current  # file that is shown
+        self.named_files: NamedFiles = named_files
+        self.workspace: Workspace = workspace
+        # named files sorted once (they don't change while pysv runs)
+        self.named: PrefixIndex = PrefixIndex(named_files.files)
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterator[Completion]:
+        text: str = document.text_before_cursor
+        match = COMMAND_RE.match(text)
+        if match is None:
+            # still typing the command
+            yield from self.commands.get_completions(document, complete_event)
+            return
+
+        command: str = match.group(1).lower()
+        rest: str = match.group(2)
+        completions: Optional[Iterable[Completion]] = self.complete_arguments(
+            command, rest
+        )
+        if completions is None:
+            yield from self.commands.get_completions(document, complete_event)
+        else:
+            yield from completions
+
+    def complete_arguments(
+        self, command: str, rest: str
+    ) -> Optional[Iterable[Completion]]:
+        """
+        Complete the arguments of a command
+
+        Arguments:
+            command (str): the command (lowercased)
+            rest (str): what was typed after it
+
+        Returns:
+            (Optional[Iterable[Completion]]): the completions, None when
+                the static completer knows the arguments
+        """
+        if command in {"load", "ld", "close"}:
+            return self.files(rest)
+
+        if command == "join":
+            return self.join(rest)
+
+        file: CSVFile = self.current()
+        if not file.header:
+            return None
+
+        if command == "stats":
+            return self.columns(file, rest)
+
+        if command in CELL_COMMANDS:
+            # set                   | Last Name   2 |    Smith  |
+            return () if "|" in rest else self.cell(file, rest)
+
+        if command == "sort":
+            # sort col1 desc num, col2, ...
+            return self.columns(file, rest.split(",")[-1].lstrip())
+
+        if command == "group":
+            return self.group(file, rest)
+
+        if command == "where":
+            return self.where(file, rest)
+
+        if command in SHAPE_COMMANDS:
+            kind, space, argument = rest.partition(" ")
+            if not space:
+                # still typing «column» or «row»
+                return None
+            # switch column col1 | col2
+            argument = argument.split("|")[-1].lstrip()
+            if kind == "column":
+                return self.columns(file, argument)
+            if kind == "row":
+                return self.rows(file, argument)
+            return ()
+
+        return None
+
+    def columns(self, file: CSVFile, prefix: str) -> Iterator[Completion]:
+        """Column names of a file that start with a prefix"""
+        for name in file.complete_column(prefix):
+            yield Completion(name, start_position=-len(prefix))
+
+    def rows(self, file: CSVFile, prefix: str) -> Iterator[Completion]:
+        """
+        Row numbers that start with a prefix, with the first value of
+        every row (only the first ROW_COMPLETIONS)
+        """
+        for row in islice(row_numbers(prefix, file.row_count()), ROW_COMPLETIONS):
+            yield Completion(
+                str(row),
+                start_position=-len(prefix),
+                display_meta=file.get_value(0, row),
+            )
+
+    def files(self, prefix: str) -> Iterator[Completion]:
+        """Named files that start with a prefix"""
+        for name in self.named.complete(prefix):
+            yield Completion(
+                name,
+                start_position=-len(prefix),
+                display_meta=self.named_files.files[name],
+            )
+
+    def cell(self, file: CSVFile, rest: str) -> Iterator[Completion]:
+        """
+        Column then row (the row is completed once the words before it
+        name a column and the last word is a number or nothing)
+        """
+        column, space, row = rest.rpartition(" ")
+        if space and (not row or row.isdigit()) and self.is_column(
+            file, column.strip()
+        ):
+            return self.rows(file, row)
+        return self.columns(file, rest.lstrip())
+
+    def group(self, file: CSVFile, rest: str) -> Iterator[Completion]:
+        """Columns to group by and columns of the aggregates"""
+        opened: int = rest.rfind("(")
+        if opened > rest.rfind(")"):
+            # count(«column»
+            return self.columns(file, rest[opened + 1 :].lstrip())
+        if AGG_SPLIT_RE.search(rest):
+            # an aggregate function is expected
+            return iter(())
+        return self.columns(file, rest.split(",")[-1].lstrip())
+
+    def where(self, file: CSVFile, rest: str) -> Iterator[Completion]:
+        """Column of the condition being typed"""
+        condition: str = AND_RE.split(OR_RE.split(rest)[-1])[-1].lstrip()
+        condition = NOT_RE.sub("", condition)
+        if CONDITION_RE.match(condition):
+            # the column is followed by its operator
+            return iter(())
+        return self.columns(file, condition)
+
+    def join(self, rest: str) -> Optional[Iterable[Completion]]:
+        """
+        File, then column of the current file, then column of the other
+        file (only when it is open)
+        """
+        arguments: str = JOIN_KIND_RE.sub("", rest, count=1)
+        if not JOIN_ON_RE.search(arguments):
+            if arguments == rest and " " not in rest:
+                # the kind or the file
+                return [
+                    *self.commands.get_completions(
+                        Document(f"join {rest}"), CompleteEvent()
+                    ),
+                    *self.files(rest),
+                ]
+            return () if " " in arguments else self.files(arguments)
+
+        name, column = JOIN_ON_RE.split(arguments, maxsplit=1)
+        if "=" not in column:
+            return self.columns(self.current(), column)
+
+        path: str = self.named_files.get_file(name.strip(), name.strip())
+        other: Optional[CSVFile] = self.workspace.files.get(workspace_key(path))
+        if other is None:
+            return ()
+        return self.columns(other, column.split("=", 1)[1].lstrip())
+
+    @staticmethod
+    def is_column(file: CSVFile, name: str) -> bool:
+        """The text addresses a single column of the file"""
+        try:
+            file.column_index(name)
+        except ValueError:
+            return False
+        return True
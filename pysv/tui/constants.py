@@ -1,3 +1,6 @@
+from html import unescape
+from pysv.functions.output import strip_tags
+
 prompt_txt: list = [("class:prompt_text", ">>> ")]
 
 bottom_toolbar: str = " PySV: A terminal app to help you with your CSV file"
@@ -7,6 +10,13 @@ help_msg_1: str = """Help
 {load, ld:} Load a new csv file into memory
     (load «path_to_file|named_file»)
     (ld «path_to_file|named_file»)
+    (the rows are read in the background, «Ctrl-C» cancels)
+    (loading a file that is still open shows it again without reading it)
+
+{files:} list the open files, the least recently used are closed to save memory
+
+{close:} close an open file that has no unsaved edits
+    (close «path_to_file|named_file|NONE»)
 
 {save, sv:} Save the currently loaded csv to a file
     (save «path_to_file|NONE»)
@@ -40,7 +50,44 @@ help_msg_1: str = """Help
 {replace:} replace the content of a specified cell
     (replace «column_name» «row_name»)
 
+{set:} set the content of a specified cell without a dialog
+    (set «column_name» «row_name» | «value»)
+
 {show, s:} show the current csv file as an html table inside a browser
+    (show «serve|NONE»)
+    (s «serve|NONE»)
+
+{undo, redo:} revert the last edit / make the last reverted edit again
+
+{discard:} drop the unsaved edits and read the file again
+
+{stats:} show the count, nulls, distinct values, min/max, sum and mean of a column
+    (stats «column»)
+
+{sort:} sort the rows by one or more columns (text and ascending by default)
+    (sort «column» «asc|desc» «num|text», «column» ...)
+
+{where:} only operate on the rows that match an expression
+    (where «column» «=|!=|&gt;|&lt;|&gt;=|&lt;=|~» «value» «and|or» ...)
+    (where) clears the filter
+
+{join:} add the columns of another file to the rows with the same value in a column
+    (join «inner|left» «path_to_file|named_file» on «column» = «other_column»)
+
+{group:} one row per group of equal values: count, sum, avg, min or max of columns
+    (group «column», ... agg count&#40;*&#41;, sum&#40;«column»&#41;, ...)
+
+{find:} show every cell that holds a value or contains its words, ignoring the case
+    (find «text»)
+
+{grid, g:} browse and edit the current csv file in a full screen grid
+    (arrows move, g jumps to a row, e or enter edits a cell, q quits)
+
+{timing:} report the time of every command, with memory also its peak memory
+    (timing «on|memory|off»)
+
+{profile:} run a command under cProfile and write the profile to a file
+    (profile «file» «command»)
 
 {help, h:} show this message
 
@@ -53,3 +100,6 @@ help_msg: str = (
     .replace("(", "<ansicyan>* ")
     .replace(")", "</ansicyan>")
 )
+
+# help printed when the output is not a terminal
+help_plain: str = unescape(strip_tags(help_msg))
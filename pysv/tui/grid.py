@@ -0,0 +1,319 @@
+from prompt_toolkit.application import Application
+from prompt_toolkit.application.current import get_app
+from prompt_toolkit.filters import Condition
+from prompt_toolkit.formatted_text import StyleAndTextTuples
+from prompt_toolkit.key_binding import KeyBindings
+from prompt_toolkit.layout import ConditionalContainer, HSplit, Layout, Window
+from prompt_toolkit.layout.controls import FormattedTextControl
+from prompt_toolkit.styles import Style
+from prompt_toolkit.widgets import TextArea
+from pysv.classes.csv_file import CSVFile
+from pysv.functions.output import strip_tags
+from typing import List, Optional, Tuple
+
+# widest a column can be drawn
+MAX_COL_WIDTH: int = 30
+
+# space between two columns
+COL_GAP: int = 2
+
+grid_help: str = (
+    " ←↑↓→ move | PgUp/PgDn page | Home/End first/last row"
+    " | g jump to row | e/Enter edit | q quit "
+)
+
+
+class Grid:
+    """
+    Full screen grid view of a CSV file.
+
+    Only the rows and columns that fit on the screen are read and
+    formatted, so scrolling costs the same on any file size.
+    """
+
+    def __init__(self, csv: CSVFile, style: Style, read_only: bool = False) -> None:
+        self.csv: CSVFile = csv
+        self.style: Style = style
+        # the cells can't be edited (the file is still loading)
+        self.read_only: bool = read_only
+
+        # position of the selected cell
+        self.row: int = 0
+        self.col: int = 0
+        # first row and column on screen
+        self.top: int = 0
+        self.left: int = 0
+
+        # "" -> browsing | "jump" -> typing a row | "edit" -> editing a cell
+        self.mode: str = ""
+        self.status: str = grid_help
+
+        self.input: TextArea = TextArea(
+            multiline=False, accept_handler=self.accept_input
+        )
+        self.control: FormattedTextControl = FormattedTextControl(
+            self.render, focusable=True, show_cursor=False
+        )
+
+    def body_height(self) -> int:
+        """Number of rows that fit on the screen"""
+        rows: int = get_app().output.get_size().rows
+        # header + status bar (+ the input line)
+        return max(1, rows - 2 - (1 if self.mode else 0))
+
+    def visible_columns(self, width: int, rows: range) -> List[Tuple[int, int]]:
+        """
+        Columns (index and width) that fit on the screen, starting on
+        self.left. The widths only depend on the rows on screen.
+
+        Arguments:
+            width (int): width available for the columns
+            rows (range): indexes of the rows on screen
+
+        Returns:
+            (List[Tuple[int, int]]): index and width of every visible column
+        """
+        columns: List[Tuple[int, int]] = []
+        used: int = 0
+
+        for col in range(self.left, len(self.csv.header)):
+            col_width: int = len(self.csv.header[col])
+            for row in rows:
+                col_width = max(col_width, len(self.csv.get_value(col, row)))
+            col_width = max(1, min(col_width, MAX_COL_WIDTH))
+
+            # always show at least the first column
+            if columns and used + col_width > width:
+                break
+
+            columns.append((col, col_width))
+            used += col_width + COL_GAP
+
+        return columns
+
+    def scroll(self) -> None:
+        """Move the screen so that the selected cell is visible"""
+        height: int = self.body_height()
+        if self.row < self.top:
+            self.top = self.row
+        elif self.row >= self.top + height:
+            self.top = self.row - height + 1
+
+        if self.col < self.left:
+            self.left = self.col
+
+    def render(self) -> StyleAndTextTuples:
+        """
+        Format the part of the grid that is on screen
+
+        Returns:
+            (StyleAndTextTuples): formatted text for the grid control
+        """
+        self.scroll()
+        bottom: int = self.top + self.body_height()
+
+        # a file read on demand is only indexed down to the screen
+        rows: range = range(self.top, self.csv.count_rows_until(bottom))
+        known: Optional[int] = self.csv.known_row_count()
+        gutter: int = len(str(max((bottom if known is None else known) - 1, 0)))
+        width: int = get_app().output.get_size().columns - gutter - COL_GAP
+
+        columns: List[Tuple[int, int]] = self.visible_columns(width, rows)
+        # move right until the selected column is on screen
+        while columns and self.col > columns[-1][0] and self.left < self.col:
+            self.left += 1
+            columns = self.visible_columns(width, rows)
+
+        text: StyleAndTextTuples = [("class:grid.index", "#".rjust(gutter))]
+        for col, col_width in columns:
+            text.append(("", " " * COL_GAP))
+            text.append(
+                ("class:grid.header", fit(self.csv.header[col], col_width))
+            )
+        text.append(("", "\n"))
+
+        for row in rows:
+            text.append(("class:grid.index", str(row).rjust(gutter)))
+            for col, col_width in columns:
+                style: str = "class:grid.row"
+                if row == self.row and col == self.col:
+                    style = "class:grid.cursor"
+
+                text.append(("", " " * COL_GAP))
+                text.append((style, fit(self.csv.get_value(col, row), col_width)))
+            text.append(("", "\n"))
+
+        return text
+
+    def move(self, rows: int = 0, cols: int = 0) -> None:
+        """
+        Move the selected cell
+
+        Arguments:
+            rows (int): number of rows to move (negative -> up)
+            cols (int): number of columns to move (negative -> left)
+        """
+        # rows are only counted as far as the move goes
+        target: int = max(self.row + rows, 0)
+        last_row: int = max(self.csv.count_rows_until(target + 1) - 1, 0)
+        last_col: int = max(len(self.csv.header) - 1, 0)
+
+        self.row = min(max(self.row + rows, 0), last_row)
+        self.col = min(max(self.col + cols, 0), last_col)
+        self.status = grid_help
+
+    def start_input(self, mode: str, text: str = "") -> None:
+        """
+        Show the input line
+
+        Arguments:
+            mode (str): "jump" or "edit"
+            text (str): initial content of the input
+        """
+        self.mode = mode
+        self.input.text = text
+        self.input.buffer.cursor_position = len(text)
+        get_app().layout.focus(self.input)
+
+    def stop_input(self) -> None:
+        """Hide the input line and go back to the grid"""
+        self.mode = ""
+        get_app().layout.focus(self.control)
+
+    def accept_input(self, buffer) -> bool:
+        """
+        Handle the text typed on the input line
+
+        Returns:
+            (bool): False, so the input is not kept
+        """
+        if self.mode == "jump":
+            try:
+                self.row = 0
+                self.move(rows=int(buffer.text))
+            except ValueError:
+                self.status = f" «{buffer.text}» is not a row number "
+
+        elif self.mode == "edit":
+            msg: str = self.csv.set_cell(
+                self.csv.column_name(self.col), str(self.row), buffer.text
+            )
+            self.status = " " + strip_tags(msg) + " "
+
+        self.stop_input()
+        return False
+
+    def make_bindings(self) -> KeyBindings:
+        """
+        Generate the key bindings of the grid
+
+        Returns:
+            (KeyBindings): Key bindings object for the grid
+        """
+        bindings = KeyBindings()
+        browsing = Condition(lambda: not self.mode)
+        typing = Condition(lambda: bool(self.mode))
+
+        @bindings.add("up", filter=browsing)
+        @bindings.add("k", filter=browsing)
+        def _(event):
+            self.move(rows=-1)
+
+        @bindings.add("down", filter=browsing)
+        @bindings.add("j", filter=browsing)
+        def _(event):
+            self.move(rows=1)
+
+        @bindings.add("left", filter=browsing)
+        @bindings.add("h", filter=browsing)
+        def _(event):
+            self.move(cols=-1)
+
+        @bindings.add("right", filter=browsing)
+        @bindings.add("l", filter=browsing)
+        def _(event):
+            self.move(cols=1)
+
+        @bindings.add("pageup", filter=browsing)
+        def _(event):
+            self.move(rows=-self.body_height())
+
+        @bindings.add("pagedown", filter=browsing)
+        def _(event):
+            self.move(rows=self.body_height())
+
+        @bindings.add("home", filter=browsing)
+        def _(event):
+            self.move(rows=-self.row)
+
+        @bindings.add("end", filter=browsing)
+        def _(event):
+            # the only move that counts every row
+            self.move(rows=self.csv.row_count())
+
+        @bindings.add("g", filter=browsing)
+        def _(event):
+            """ Jump to a row """
+            self.start_input("jump")
+
+        @bindings.add("e", filter=browsing)
+        @bindings.add("enter", filter=browsing)
+        def _(event):
+            """ Edit the selected cell """
+            if self.read_only:
+                self.status = " The file is still loading, it can't be edited yet "
+            elif self.csv.count_rows_until(1):
+                self.start_input("edit", self.csv.get_value(self.col, self.row))
+
+        @bindings.add("escape", filter=typing)
+        def _(event):
+            """ Cancel the input """
+            self.stop_input()
+
+        @bindings.add("q", filter=browsing)
+        @bindings.add("escape", filter=browsing)
+        @bindings.add("c-c")
+        def _(event):
+            """ Quit the grid """
+            event.app.exit()
+
+        return bindings
+
+    def run(self) -> None:
+        """Show the grid until the user quits"""
+        status_bar = Window(
+            FormattedTextControl(lambda: [("class:grid.status", self.status)]),
+            height=1,
+        )
+        input_line = ConditionalContainer(
+            HSplit([self.input]), filter=Condition(lambda: bool(self.mode))
+        )
+
+        app: Application = Application(
+            layout=Layout(
+                HSplit([Window(self.control), input_line, status_bar]),
+                focused_element=self.control,
+            ),
+            key_bindings=self.make_bindings(),
+            style=self.style,
+            full_screen=True,
+        )
+        app.run()
+
+
+def fit(value: str, width: int) -> str:
+    """
+    Fit a value on a fixed width cell (newlines are shown as ⏎)
+
+    Arguments:
+        value (str): value of the cell
+        width (int): width of the cell
+
+    Returns:
+        (str): value padded or cut to the width
+    """
+    value = value.replace("\r\n", "⏎").replace("\n", "⏎")
+    if len(value) > width:
+        return value[: width - 1] + "…"
+    return value.ljust(width)
+
@@ -1,20 +1,61 @@
-from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
 from pysv.defaults import DEFAULT_HISTORY_PATH
 from pysv.functions.html import show_html_table
-from pysv.creators.create_csv_file import load_csv
-from pysv.functions.output import error_message
-from pysv.classes.csv_file import CSVFile
+from pysv.creators.create_csv_file import make_loader
+from pysv.creators.create_journal import attach_journal
+from pysv.functions.output import error_message, is_error, title_message
+from pysv.classes.csv_file import AmbiguousColumnError, CSVFile
+from pysv.classes.csv_view import CSVView
+from pysv.classes.loader import Loader
+from pysv.classes.workspace import Workspace, base_file, workspace_key
+from pysv.functions.query import compile_where
+from pysv.functions.join import hash_join, parse_join
+from pysv.functions.group import group_rows, parse_group
+from pysv.functions.instrument import measure, profile_call, timing_message
+from pysv.functions.sort import parse_sort_keys
 from pysv.classes.settings import Settings
 from pysv.creators.create_settings import make_settings
 from pysv.functions.general import clear_screen, p_print
-from pysv.tui.constants import prompt_txt, bottom_toolbar, help_msg
-from pysv.tui.bindings import make_bindings
-from pysv.tui.tui_function import radio, copied_input, non_copied_input
-from prompt_toolkit import PromptSession
-from prompt_toolkit.completion import NestedCompleter
-from prompt_toolkit.history import FileHistory
-import pyperclip
-from typing import List, Tuple, Union
+from pysv.tui.constants import prompt_txt, bottom_toolbar, help_msg, help_plain
+import threading
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+# the prompt, the dialogs, the grid, the clipboard, the browser and the
+# server are only imported when they are first used (faster startup)
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+    from prompt_toolkit import PromptSession
+
+# commands that only read the rows, so they can run while a file is loading
+LOADING_COMMANDS: set = {
+    "clear",
+    "cls",
+    "c",
+    "help",
+    "h",
+    "load",
+    "ld",
+    "ls",
+    "files",
+    "peek",
+    "cell",
+    "copy",
+    "cp",
+    "grid",
+    "g",
+    "timing",
+}
+
+# commands that need a terminal, so they can't run from a script
+INTERACTIVE_COMMANDS: set = {
+    "grid",
+    "g",
+    "show",
+    "s",
+    "edit",
+    "replace",
+    "copy",
+    "cp",
+}
 
 
 class Session:
@@ -22,30 +63,63 @@ class Session:
     Prompt Toolkit Sessions that provides the TUI
     """
 
-    def __init__(self) -> None:
+    def __init__(self, interactive: bool = True) -> None:
+        # False -> commands come from a script (no prompt is built)
+        self.interactive: bool = interactive
         # load the settings
         self.settings: Settings = make_settings()
         # init the csv file
         self.csv: CSVFile = CSVFile([], [])
-        # create the session
-        self.session: PromptSession = self.make_session()
         # determine the SolRing toolbar text
         self.toolbar: str = bottom_toolbar
         # help message
         self.help_msg: str = help_msg
+        # local http server for «show serve» (started on first use)
+        self.server: Optional["ThreadingHTTPServer"] = None
+        # held while a command runs and while the server reads the file
+        # (reentrant: «profile» runs a command from a command)
+        self.lock: threading.RLock = threading.RLock()
+        # file being loaded in the background
+        self.loader: Optional[Loader] = None
+        # file that is kept if the load is cancelled
+        self.previous: CSVFile = self.csv
+        # loaded files that are kept open (the current one included)
+        self.workspace: Workspace = Workspace(self.settings.workspace_memory)
+        # create the session (its completer reads the workspace)
+        self.session: Optional["PromptSession"] = None
+        if interactive:
+            self.session = self.make_session()
+        # a command was not valid (the exit status of a script)
+        self.failed: bool = False
+        # report the time (and the peak memory) of every command
+        self.timing: bool = False
+        self.timing_memory: bool = False
 
     def not_valid(self) -> None:
         """
         Function that prints a message when a command is not valid
         """
+        self.failed = True
         p_print(error_message("Not a valid command!"))
 
     def no_csv(self) -> None:
         """
         Function that prints a message when a csv file has not been loaded
         """
+        self.failed = True
         p_print(error_message("No «CSV file» has been loaded"))
 
+    def report(self, msg: str) -> None:
+        """
+        Print the output of a command, an error makes a script fail
+
+        Arguments:
+            msg (str): the output
+        """
+        if is_error(msg):
+            self.failed = True
+        p_print(msg)
+
     def select_rows(self) -> str:
         """
         Create a radio checkbox for the user to select the rows
@@ -53,6 +127,10 @@ class Session:
         Returns:
             (str): the value chosen by the user
         """
+        if not self.interactive:
+            raise RuntimeError("The row must be given when running a script")
+        from pysv.tui.tui_function import radio
+
         return radio(
             "Row",
             self.csv.make_row_num_list(),
@@ -66,8 +144,14 @@ class Session:
         Returns:
             (str): the value chosen by the user
         """
+        if not self.interactive:
+            raise RuntimeError("The column must be given when running a script")
+        from pysv.tui.tui_function import radio
+
         return radio(
-            "Column", self.csv.header, self.settings.color_scheme.render_style()
+            "Column",
+            self.csv.column_names(),
+            self.settings.color_scheme.render_style(),
         )
 
     def run(self) -> None:
@@ -75,30 +159,114 @@ class Session:
         Run the prompt.
         A session prompt will be shown the resulting input will be processed
         """
+        self.check_load()
+
         # create and show prompt
-        text: str = self.session.prompt(
-            prompt_txt, bottom_toolbar=self.toolbar, complete_while_typing=True
-        )
+        try:
+            text: str = self.session.prompt(
+                prompt_txt,
+                bottom_toolbar=self.make_toolbar,
+                complete_while_typing=True,
+            )
+        except KeyboardInterrupt:
+            # Ctrl-C cancels the load instead of closing pysv (a load that
+            # already finished is kept and pysv closes as usual)
+            if self.loader is None or not self.loader.is_running():
+                self.check_load()
+                raise
+            self.loader.cancel()
+            self.check_load()
+            return
+
+        self.check_load()
 
         if text:
-            # process the input
-            try:
-                if self.csv.is_loaded():
+            self.run_command(text)
+
+    def run_command(self, text: str) -> None:
+        """
+        Run a single command (typed on the prompt or read from a script)
+
+        Arguments:
+            text (str): the command
+        """
+        first_word: str = text.split()[0].lower()
+
+        if self.loader is not None and first_word not in LOADING_COMMANDS:
+            self.report(
+                error_message(
+                    "The file is still loading, only «ls», «peek», «cell», "
+                    "«copy» and «grid» can be used («Ctrl-C» cancels it)"
+                )
+            )
+            return
+
+        if not self.interactive and first_word in INTERACTIVE_COMMANDS:
+            self.failed = True
+            p_print(error_message(f"«{first_word}» can't be used in a script"))
+            return
+
+        if self.timing and first_word != "timing":
+            seconds, peak = measure(lambda: self.dispatch(text), self.timing_memory)
+            p_print(timing_message(seconds, peak))
+        else:
+            self.dispatch(text)
+
+    def dispatch(self, text: str) -> None:
+        """
+        Process a command, reporting the commands that are not valid
+
+        Arguments:
+            text (str): the command
+        """
+        try:
+            with self.lock:
+                if self.csv.is_loaded() or self.loader is not None:
                     self.process_input(text)
                 else:
                     self.process_input_no_csv(text)
 
-            except Exception:
-                self.not_valid()
+        except RuntimeError as e:
+            # a selection dialog can't be shown from a script
+            self.failed = True
+            p_print(error_message(str(e)))
+
+        except Exception:
+            self.not_valid()
+
+    def run_script(self, commands: List[str]) -> bool:
+        """
+        Run commands one after the other, without a prompt. Empty commands
+        and comments (# ...) are skipped.
+
+        Arguments:
+            commands (List[str]): the commands
+
+        Returns:
+            (bool): True if every command was valid and none failed
+        """
+        for text in commands:
+            text = text.strip()
+            if text and not text.startswith("#"):
+                self.run_command(text)
+
+        return not self.failed
 
-    def make_session(self) -> PromptSession:
+    def make_session(self) -> "PromptSession":
         """
         Setup prompt toolkit session for simple search
 
         Returns:
             PromptSession: session for simple search
         """
-        completer: NestedCompleter = NestedCompleter.from_nested_dict(
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
+        from prompt_toolkit.completion import NestedCompleter
+        from prompt_toolkit.history import FileHistory
+        from pysv.tui.bindings import make_bindings
+        from pysv.tui.completer import CSVCompleter
+
+        commands: NestedCompleter = NestedCompleter.from_nested_dict(
             {
                 "clear": None,
                 "c": None,
@@ -109,8 +277,10 @@ class Session:
                 "delete": {"column", "row"},
                 "del": {"column", "row"},
                 "peek": {"column", "row"},
-                "show": None,
-                "s": None,
+                "grid": None,
+                "g": None,
+                "show": {"serve"},
+                "s": {"serve"},
                 "ls": {"column", "row"},
                 "cell": None,
                 "copy": None,
@@ -119,9 +289,29 @@ class Session:
                 "replace": None,
                 "switch": {"column", "row"},
                 "sw": {"column", "row"},
+                "where": None,
+                "sort": None,
+                "stats": None,
+                "undo": None,
+                "redo": None,
+                "discard": None,
+                "set": None,
+                "timing": {"on", "memory", "off"},
+                "profile": None,
+                "join": {"inner", "left"},
+                "group": None,
+                "find": None,
+                "files": None,
+                "close": None,
             }
         )
+        # column names, rows and files come from the current file
+        completer: CSVCompleter = CSVCompleter(
+            commands, lambda: self.csv, self.settings.named_files, self.workspace
+        )
         return PromptSession(
+            # redraw the toolbar while a file is loading
+            refresh_interval=0.5,
             completer=completer,
             complete_while_typing=True,
             history=FileHistory(DEFAULT_HISTORY_PATH),
@@ -145,55 +335,113 @@ class Session:
             clear_screen()
 
         elif first_word in {"help", "h"}:
-            p_print(help_msg)
+            p_print(help_msg, help_plain)
 
         elif first_word in {"load", "ld"}:
             self.load_function(commands)
 
         elif first_word in {"save", "sv"}:
             if len(commands) > 1:
-                p_print(self.csv.save(commands[1]))
+                self.report(self.csv.save(commands[1]))
             else:
-                p_print(self.csv.save())
+                self.report(self.csv.save())
 
         elif first_word in {"delete", "del"}:
             msg: str = self.delete_function(commands)
             if msg:
-                p_print(msg)
+                self.report(msg)
             else:
                 self.not_valid()
 
         elif first_word == "peek":
             msg: str = self.peek_function(commands)
             if msg:
-                p_print(msg)
+                self.report(msg)
             else:
                 self.not_valid()
 
         elif first_word in {"show", "s"}:
-            show_html_table(self.csv, self.settings)
+            self.show_function(commands)
+
+        elif first_word in {"grid", "g"}:
+            from pysv.tui.grid import Grid
+
+            # the loader is still adding rows -> no edits
+            Grid(
+                self.csv,
+                self.settings.color_scheme.render_style(),
+                read_only=self.loader is not None,
+            ).run()
 
         elif first_word == "ls":
-            p_print(self.ls_function(commands))
+            self.report(self.ls_function(commands))
 
         elif first_word == "cell":
-            p_print(self.cell_function(commands)[0])
+            self.report(self.cell_function(commands)[0])
 
         elif first_word in {"copy", "cp"}:
-            p_print(self.copy_function(commands))
+            self.report(self.copy_function(commands))
 
         elif first_word in {"switch", "sw"}:
             msg: str = self.switch_function(commands)
             if msg:
-                p_print(msg)
+                self.report(msg)
             else:
                 self.not_valid()
 
         elif first_word == "edit":
-            p_print(self.edit_function(commands, True))
+            self.report(self.edit_function(commands, True))
 
         elif first_word == "replace":
-            p_print(self.edit_function(commands))
+            self.report(self.edit_function(commands))
+
+        elif first_word == "set":
+            msg: str = self.set_function(command.strip()[len(commands[0]) :])
+            if msg:
+                self.report(msg)
+            else:
+                self.not_valid()
+
+        elif first_word == "undo":
+            self.report(self.csv.undo())
+
+        elif first_word == "redo":
+            self.report(self.csv.redo())
+
+        elif first_word == "discard":
+            self.report(self.discard_function())
+
+        elif first_word == "stats":
+            self.report(self.stats_function(commands))
+
+        elif first_word == "sort":
+            self.report(self.sort_function(command.strip()[len(commands[0]) :]))
+
+        elif first_word == "where":
+            self.report(self.where_function(command.strip()[len(commands[0]) :]))
+
+        elif first_word == "join":
+            self.report(self.join_function(command.strip()[len(commands[0]) :]))
+
+        elif first_word == "group":
+            self.report(self.group_function(command.strip()[len(commands[0]) :]))
+
+        elif first_word == "find":
+            # find                  | New York |
+            text: str = command.strip()[len(commands[0]) :]
+            self.report(self.csv.find(text, self.settings.find_index))
+
+        elif first_word == "timing":
+            self.report(self.timing_function(commands))
+
+        elif first_word == "profile":
+            self.report(self.profile_function(commands))
+
+        elif first_word == "files":
+            self.report(self.files_function())
+
+        elif first_word == "close":
+            self.report(self.close_function(commands))
 
         else:
             self.not_valid()
@@ -214,18 +462,53 @@ class Session:
             clear_screen()
 
         elif first_word in {"help", "h"}:
-            p_print(help_msg)
+            p_print(help_msg, help_plain)
 
         elif first_word in {"load", "ld"}:
             self.load_function(commands)
 
+        elif first_word == "timing":
+            self.report(self.timing_function(commands))
+
+        elif first_word == "profile":
+            self.report(self.profile_function(commands))
+
+        elif first_word == "files":
+            self.report(self.files_function())
+
+        elif first_word == "close":
+            self.report(self.close_function(commands))
+
         else:
             self.no_csv()
 
     def load_function(self, command: List[str]) -> None:
-        self.load_file(command[1])
+        # scripts wait for the whole file before the next command
+        self.load_file(command[1], wait=not self.interactive)
+
+    def make_toolbar(self) -> str:
+        """
+        Text of the bottom toolbar (the progress while a file is loading)
+
+        Returns:
+            (str): toolbar text
+        """
+        if self.loader is not None and self.loader.is_running():
+            return (
+                f" Loading {self.loader.file.path}: {self.loader.progress()}"
+                " (Ctrl-C to cancel)"
+            )
+        return self.toolbar
+
+    def load_file(self, file: str, wait: bool = False) -> None:
+        """
+        Load a csv file. The rows are read on a background thread unless
+        wait is set, the rows that are already read can be used meanwhile
 
-    def load_file(self, file: str) -> None:
+        Arguments:
+            file (str): path or name of the file
+            wait (bool): read every row before returning
+        """
         # try to get the path of the file from the named files dict
         # if the file is named -> return the path else -> None
         named: Union[str, None] = self.settings.named_files.get_file(file, file)
@@ -233,8 +516,298 @@ class Session:
         # path = Path/to/named/file or Path/provided/using/the/prompt
         path: str = named or file
 
-        # load the csv
-        self.csv = load_csv(path)
+        # a load that is still running is replaced
+        if self.loader is not None:
+            self.loader.cancel()
+            self.loader = None
+        else:
+            self.previous = self.csv
+            # keep the filter of the file that is left
+            self.workspace.update(self.csv)
+
+        # stop journaling the previous file (its journal is kept)
+        if self.base_csv().journal is not None:
+            self.base_csv().journal.close()
+
+        # an open file is shown again instead of being read
+        # (loading the current file reads it again)
+        current: str = self.base_csv().path
+        if path in self.workspace and not (
+            current and workspace_key(current) == workspace_key(path)
+        ):
+            self.csv = self.workspace.get(path)
+            p_print(
+                title_message(
+                    "Switched",
+                    f"«{path}» is open, its «{self.csv.row_count()}» rows are "
+                    "shown again",
+                )
+            )
+            return
+
+        try:
+            self.loader = make_loader(
+                path,
+                lazy_size=self.settings.lazy_size,
+                infer_types=self.settings.infer_types,
+                parallel_size=self.settings.parallel_size,
+                workers=self.settings.parse_workers,
+                cache_dir=self.settings.cache_dir if self.settings.cache else "",
+                cache_size=self.settings.cache_size,
+            )
+        except FileNotFoundError:
+            self.report(error_message("That file does not exist"))
+            self.csv = CSVFile([], [], "")
+            return
+
+        self.csv = self.loader.file
+        if wait:
+            self.loader.run()
+            self.check_load()
+        else:
+            self.loader.start()
+
+    def check_load(self) -> None:
+        """
+        Finish the load once every row is read: report it and replay the
+        edits a previous session didn't save
+        """
+        loader: Optional[Loader] = self.loader
+        if loader is None or loader.is_running():
+            return
+        self.loader = None
+
+        if loader.error is not None:
+            self.csv = CSVFile([], [], "")
+            self.report(error_message(f"The file could not be loaded: {loader.error}"))
+            return
+
+        if loader.is_cancelled():
+            # go back to the file that was loaded before
+            self.csv = self.previous
+            p_print(title_message("Cancelled", "The file was not loaded"))
+            return
+
+        p_print(
+            title_message(
+                "Loaded",
+                f"«{loader.file.path}» was loaded in «{loader.elapsed():.2f}s»",
+            )
+        )
+        if loader.file.wide_rows:
+            p_print(
+                error_message(
+                    "Some rows have more values than the header, those values "
+                    "were dropped (save to a new path to keep the source)",
+                    title="Warning",
+                )
+            )
+
+        # scripts neither journal their edits nor replay old ones
+        if self.settings.journal and self.interactive:
+            msg: str = attach_journal(self.csv)
+            if msg:
+                p_print(msg)
+
+        # the least recently used files are closed to stay in the budget
+        closed, unsaved = self.workspace.add(self.csv)
+        for path in closed:
+            p_print(title_message("Closed", f"«{path}» to free memory"))
+        for path in unsaved:
+            p_print(
+                error_message(
+                    f"«{path}» has unsaved edits and was kept open, load it "
+                    "and save it to free its memory"
+                )
+            )
+
+    def base_csv(self) -> CSVFile:
+        """
+        The loaded file, without any active filter
+
+        Returns:
+            (CSVFile): the whole csv file
+        """
+        return self.csv.base if isinstance(self.csv, CSVView) else self.csv
+
+    def discard_function(self) -> str:
+        base: CSVFile = self.base_csv()
+        journaled: bool = base.journal is not None and base.journal.exists()
+        if not base.dirty and not journaled:
+            return error_message("There are no unsaved edits to discard")
+
+        # forget the edits and read the file again (without a journal,
+        # e.g. when it is turned off, reading the file is enough)
+        if base.journal is not None:
+            base.journal.clear()
+        self.load_file(base.path, wait=not self.interactive)
+        return title_message("Discarded", "The unsaved edits were discarded")
+
+    def files_function(self) -> str:
+        if not self.workspace.files:
+            return error_message("There are no open files")
+        return self.workspace.render(self.csv)
+
+    def close_function(self, commands: List[str]) -> str:
+        # close                 | path_to_file|named_file |
+        if len(commands) > 1:
+            name: str = " ".join(commands[1:])
+            path: str = self.settings.named_files.get_file(name, name)
+        else:
+            path: str = self.base_csv().path
+
+        if not path or path not in self.workspace:
+            return error_message(f"«{path or 'No file'}» is not open")
+
+        key: str = workspace_key(path)
+        base: CSVFile = self.workspace.files[key]
+        base = base.base if isinstance(base, CSVView) else base
+        if base.dirty:
+            return error_message(
+                f"«{path}» has unsaved edits, «save» them or drop them with "
+                "«discard» first"
+            )
+
+        self.workspace.remove(path)
+        if base is self.base_csv():
+            # show the most recently used file that is still open
+            self.csv = next(reversed(self.workspace.files.values()), CSVFile([], []))
+
+        return title_message("Closed", f"«{key}»")
+
+    def show_function(self, commands: List[str]) -> None:
+        if len(commands) > 1 and commands[1] == "serve":
+            import webbrowser
+            from pysv.functions.server import start_table_server, server_url
+
+            # serve the rows on demand from a local http server
+            if self.server is None:
+                self.server = start_table_server(
+                    lambda: self.csv, self.settings, self.lock
+                )
+
+            url: str = server_url(self.server)
+            webbrowser.open_new_tab(url)
+            p_print(title_message("Serving", f"The table is available at «{url}»"))
+
+        else:
+            # write the table to html files
+            show_html_table(self.csv, self.settings)
+
+    def stats_function(self, commands: List[str]) -> str:
+        if len(commands) > 1:
+            # stats                 | Last Name            |
+            return self.csv.stats(" ".join(commands[1:]))
+
+        # no column name was given
+        # select a column
+        return self.csv.stats(self.select_columns())
+
+    def sort_function(self, text: str) -> str:
+        try:
+            # sort col1 desc num, col2, ...
+            keys = parse_sort_keys(text)
+        except ValueError as e:
+            return error_message(str(e))
+
+        return self.csv.sort(keys, self.settings.sort_memory)
+
+    def where_function(self, expression: str) -> str:
+        # filters always apply to the whole file
+        base: CSVFile = self.base_csv()
+
+        if not expression.strip():
+            if base is self.csv:
+                return error_message("There's no active filter")
+            # clear the filter
+            self.csv = base
+            return title_message("Where", "The filter was cleared")
+
+        try:
+            matches: List[int] = compile_where(expression, base)(base)
+        except ValueError as e:
+            return error_message(str(e))
+
+        if not matches:
+            return error_message("No row matches the expression")
+
+        # the other commands now operate on the matching rows
+        self.csv = CSVView(base, matches)
+        return title_message(
+            "Where",
+            f"«{len(matches)}» of «{base.row_count()}» rows match "
+            "(rows are now numbered inside the filter, clear it with «where»)",
+        )
+
+    def join_function(self, text: str) -> str:
+        try:
+            # join                  | left lookup.csv on id = user id |
+            how, name, column, other_column = parse_join(text)
+        except ValueError as e:
+            return error_message(str(e))
+
+        # an open file is used whole (without its filter and without
+        # becoming the most recently used), any other file is read at once
+        path: str = self.settings.named_files.get_file(name, name)
+        other: Optional[CSVFile] = self.workspace.files.get(workspace_key(path))
+        if other is not None:
+            other = base_file(other)
+        else:
+            try:
+                other = make_loader(
+                    path,
+                    infer_types=self.settings.infer_types,
+                    parallel_size=self.settings.parallel_size,
+                    workers=self.settings.parse_workers,
+                ).run()
+            except FileNotFoundError:
+                return error_message("That file does not exist")
+
+        try:
+            left_on: int = self.csv.column_index(column)
+            right_on: int = other.column_index(other_column)
+        except AmbiguousColumnError as e:
+            return error_message(str(e))
+        except ValueError as e:
+            return error_message(f"The column «{e}» does not exist!")
+
+        self.csv = hash_join(
+            self.csv, other, left_on, right_on, how, self.settings.join_memory
+        )
+        return title_message(
+            "Joined",
+            f"«{self.csv.row_count()}» rows ({how} join with «{path}»), "
+            "save them with «save path» before loading another file",
+        )
+
+    def group_function(self, text: str) -> str:
+        try:
+            # group                 | city, year agg count(*), avg(price) |
+            keys, aggregates = parse_group(text)
+        except ValueError as e:
+            return error_message(str(e))
+
+        try:
+            positions: List[int] = [self.csv.column_index(key) for key in keys]
+            columns: List[Optional[int]] = [
+                None if column == "*" else self.csv.column_index(column)
+                for _, column in aggregates
+            ]
+        except AmbiguousColumnError as e:
+            return error_message(str(e))
+        except ValueError as e:
+            return error_message(f"The column «{e}» does not exist!")
+
+        self.csv = group_rows(
+            self.csv,
+            positions,
+            [(function, column) for (function, _), column in zip(aggregates, columns)],
+        )
+        return title_message(
+            "Grouped",
+            f"«{self.csv.row_count()}» groups, save them with «save path» before "
+            "loading another file",
+        )
 
     def cell_function(self, command: List[str]) -> Tuple[str, str]:
         try:
@@ -268,6 +841,9 @@ class Session:
         output, content = self.csv.get_cell(col, row)
 
         if content:
+            import pyperclip
+            from pysv.tui.tui_function import copied_input, non_copied_input
+
             title: str = f"{col} - {row}"
             if to_copy:
                 pyperclip.copy(content)
@@ -286,6 +862,41 @@ class Session:
         else:
             return output
 
+    def timing_function(self, commands: List[str]) -> str:
+        if len(commands) > 1:
+            # timing                | on|memory|off |
+            if commands[1] not in {"on", "memory", "off"}:
+                return error_message(
+                    "Use «timing on», «timing memory» or «timing off»"
+                )
+            self.timing = commands[1] != "off"
+            self.timing_memory = commands[1] == "memory"
+
+        state: str = "off"
+        if self.timing:
+            state = "on (with the peak memory)" if self.timing_memory else "on"
+        return title_message("Timing", f"«{state}»")
+
+    def profile_function(self, commands: List[str]) -> str:
+        # profile               | file.prof | peek column Name |
+        if len(commands) < 3:
+            return error_message("Use «profile file command»")
+
+        command: str = " ".join(commands[2:])
+        return profile_call(lambda: self.run_command(command), commands[1])
+
+    def set_function(self, text: str) -> str:
+        # set                   | Last Name   2 |    Smith  |
+        if "|" not in text:
+            return ""
+
+        cell, value = text.split("|", 1)
+        names: List[str] = cell.split()
+        if len(names) < 2:
+            return ""
+
+        return self.csv.set_cell(" ".join(names[:-1]), names[-1], value.strip())
+
     def ls_function(self, commands: List[str]) -> str:
         try:
             if commands[1] == "column":
@@ -335,6 +946,8 @@ class Session:
         to_copy: str = response[1]
 
         if to_copy:
+            import pyperclip
+
             # copy
             pyperclip.copy(to_copy)
             return "<ansigreen>Copied</ansigreen>\n" + msg